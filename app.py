@@ -7,32 +7,140 @@
 # Endpoints:                                                                                     #
 #   - /healthcheck (GET): Simple status check.                                                   #
 #   - /solve (POST): Upload a Sudoku image and get the solved board.                             #
+#   - /solve/page (POST): Upload a page with several grids, get every board with its position.   #
+#   - /solve/batch (POST): Upload many images (or zip archives), stream results back as NDJSON.  #
+#   - /solve/stream (POST): Solve one image, streaming stage timings and solver progress (SSE).  #
+#   - /cache/stats (GET): Hit/miss counters of the result caches.                                #
+#   - /metrics (GET): Stage latencies, request and cache counters (Prometheus text format).      #
+#   - /reports/{name} (GET): Report artifact kept by the in-memory report sink.                  #
 #                                                                                                #
-# The solution is generated using a logic-based backtracking algorithm.                          #
+# Reports are optional (`report` query parameter: none, trace or full) and delivered through a   #
+# pluggable sink (`sink`: filesystem, memory or inline). By default nothing touches the disk.    #
+#                                                                                                #
+# Blocking stages run in a bounded worker pool (API_WORKER_POOL), keeping the event loop free.   #
+# Requests beyond the pool's queue depth are rejected with 503.                                  #
+# Batch boards are solved on a process pool started once (API_WORKER_POOL=process reuses it).    #
+# Streamed (SSE) jobs need threads; with API_WORKER_POOL=process they get a bounded thread pool. #
+#                                                                                                #
+# The solution is generated using a logic-based backtracking algorithm, or optionally with the   #
+# Dancing Links (DLX) exact cover backend selected through the `backend` query parameter.        #
 ##################################################################################################
 
 ##################################################################################################
 #                                            IMPORTS                                             #
 ##################################################################################################
 
-import shutil
+import time
+IMPORT_START = time.perf_counter()  # Reference point for the cold-start report
+
+import io
 import os
+import asyncio
 import uuid
 import json
+import zipfile
+from functools import partial
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse, PlainTextResponse
+from fastapi.concurrency import run_in_threadpool, iterate_in_threadpool
 
-from vision.image_parser import extract_board_from_image
-from solver.bckt_logic_solver import SudokuSolver
+from vision.image_parser import (
+    extract_board_from_bytes, extract_boards_from_bytes, extract_boards_from_page_bytes
+)
+from solver.backends import create_solver, SOLVER_BACKENDS
+from solver.batch_solver import board_to_string
+from solver.canonical import canonicalize, to_canonical, from_canonical
+from cnn_classifier import digit_classifier
 
 from utils.logs_config import logger
-from utils.reporter import save_solution_report, generate_trace_filename
+from utils import metrics
+from utils.reporter import render_report, SUMMARY_PLACEHOLDER
+from utils.report_sinks import FilesystemSink, MemorySink, InlineSink
+from utils.ai_summarizer import summarize_async
+from utils.worker_pool import BoundedWorkerPool, PoolSaturatedError
+from utils.result_cache import LRUCache, image_key
+from utils.config import (
+    SOLVER_BACKEND,
+    INFERENCE_MICRO_BATCHING,
+    INFERENCE_MAX_BATCH_SIZE,
+    INFERENCE_MAX_WAIT_MS,
+    MODEL_PREWARM,
+    API_WORKER_POOL,
+    API_WORKERS,
+    API_MAX_QUEUED,
+    RESULT_CACHE_SIZE,
+    RESULT_CACHE_DB,
+    OUTPUT_DIR,
+    REPORT_MODE,
+    REPORT_SINK,
+    REPORT_MEMORY_ENTRIES,
+    BATCH_CHUNK_IMAGES,
+    BATCH_MAX_IMAGES,
+)
 
 ##################################################################################################
 #                                     FASTAPI INITIALIZATION                                     #
 ##################################################################################################
 
+worker_pool = None  # BoundedWorkerPool for the blocking pipeline, created on startup
+batch_pool = None  # Process BoundedWorkerPool solving /solve/batch boards, created on startup
+stream_pool = None  # Thread BoundedWorkerPool running /solve/stream jobs, created on startup
+report_sinks = {}  # Sink name → report sink, created on startup
+
+REPORT_MODES = ("none", "trace", "full")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# Content-addressed result caches (image hash → parsed board, backend + board → solution,
+# backend + canonical board → solution in the canonical frame, shared by isomorphic puzzles)
+image_cache = LRUCache("images", RESULT_CACHE_SIZE, RESULT_CACHE_DB)
+board_cache = LRUCache("boards", RESULT_CACHE_SIZE, RESULT_CACHE_DB)
+canonical_cache = LRUCache("canonical", RESULT_CACHE_SIZE, RESULT_CACHE_DB)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Pre-warms the CNN model, starts the shared micro-batching queue and the worker pool on
+    startup, reports the cold-start time, and stops them on shutdown (flushing queued report and
+    cache writes).
+    """
+
+    global worker_pool, batch_pool, stream_pool, report_sinks
+
+    imports_time = time.perf_counter() - IMPORT_START
+    warmup_time = await run_in_threadpool(digit_classifier.warmup) if MODEL_PREWARM else 0.0
+    logger.info(f"🚀 Cold start: imports {imports_time:.2f}s, model warm-up {warmup_time:.2f}s, "
+                f"total {time.perf_counter() - IMPORT_START:.2f}s")
+
+    if INFERENCE_MICRO_BATCHING:
+        digit_classifier.enable_micro_batching(INFERENCE_MAX_BATCH_SIZE, INFERENCE_MAX_WAIT_MS)
+        logger.info(f"🧺 CNN micro-batching enabled (max {INFERENCE_MAX_BATCH_SIZE} cells, "
+                    f"{INFERENCE_MAX_WAIT_MS} ms)")
+
+    worker_pool = BoundedWorkerPool(API_WORKER_POOL, API_WORKERS, API_MAX_QUEUED)
+    logger.info(f"🏊 {API_WORKER_POOL.capitalize()} pool ready ({worker_pool.max_workers} workers, "
+                f"{API_MAX_QUEUED} queued requests max)")
+    # Batch boards are CPU-bound solver work: they get worker processes, started once and shared
+    batch_pool = worker_pool if worker_pool.kind == "process" else BoundedWorkerPool(
+        "process", API_WORKERS, API_MAX_QUEUED)
+    # Streamed jobs report progress through in-process callbacks: they always need threads
+    stream_pool = worker_pool if worker_pool.kind == "thread" else BoundedWorkerPool(
+        "thread", API_WORKERS, API_MAX_QUEUED)
+    report_sinks = {
+        sink.name: sink
+        for sink in (FilesystemSink(OUTPUT_DIR), MemorySink(REPORT_MEMORY_ENTRIES), InlineSink())
+    }
+    yield
+    worker_pool.shutdown()
+    for pool in (batch_pool, stream_pool):
+        if pool is not worker_pool:
+            pool.shutdown()
+    report_sinks["filesystem"].flush()
+    for cache in (image_cache, board_cache, canonical_cache):
+        cache.flush()
+    digit_classifier.disable_micro_batching()
+
 app = FastAPI(
     title="AISudokuSolver API",
     description=(
@@ -40,9 +148,26 @@ app = FastAPI(
         "a backtracking algorithm for solving, and LLMs for analytical summaries. "
         "This API supports seamless integration for automatic puzzle solving and report generation."
     ),
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """
+    Counts requests per route and status code and records their latency (for streaming
+    endpoints, the time until the response starts).
+    """
+
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    path = route.path if route is not None else "unmatched"  # Route templates keep cardinality low
+
+    metrics.inc("sudoku_http_requests_total", path=path, method=request.method, status=response.status_code)
+    metrics.observe("sudoku_http_request_duration_seconds", time.perf_counter() - start, path=path)
+    return response
+
 ##################################################################################################
 #                                           ENDPOINTS                                            #
 ##################################################################################################
@@ -55,76 +180,545 @@ def healthcheck():
     return {"status": "ok"}
 
 
+def solve_board(parsed_board: list, backend: str, progress_callback=None,
+                progress_interval: int = 1000) -> dict:
+    """
+    Runs the blocking solving stage for one parsed board. Executed in the worker pool, never
+    on the event loop.
+
+    Args:
+        parsed_board (list[list[int]]): Board extracted from the uploaded image.
+        backend (str): Solver backend name.
+        progress_callback (Callable[[dict], None]): Optional solver progress subscriber.
+        progress_interval (int): Solver steps between two progress reports.
+
+    Returns:
+        dict: Solution and metrics (`solved_board`, `method`, `unique`, `steps`, `duration`).
+        `solved_board` is None if the puzzle could not be solved.
+    """
+
+    # Solve using logic, checking for a second solution to detect OCR misreads
+    solver = create_solver([row[:] for row in parsed_board], backend)
+    if progress_callback is not None:
+        solver.set_progress_callback(progress_callback, progress_interval)
+    solution_count = solver.count_solutions(limit=2)
+    success = solution_count > 0
+
+    if solution_count > 1:
+        logger.warning("⚠️ Board has multiple solutions: the image may have been misread.")
+
+    return {
+        "solved_board": solver.get_board() if success else None,
+        "method": solver.METHOD,
+        "unique": solution_count == 1,
+        "steps": solver.steps,
+        "duration": solver.time_taken,
+    }
+
+
+async def solve_cached(parsed_board: list, backend: str, pool: BoundedWorkerPool = None) -> dict:
+    """
+    Solves a parsed board through the result caches: a known board skips the solver, and a
+    board isomorphic to a solved one reuses its solution, mapped back through the symmetry
+    transform. Uncached work runs in the worker pool.
+
+    Args:
+        parsed_board (list[list[int]]): Board extracted from an image.
+        backend (str): Solver backend name.
+        pool (BoundedWorkerPool): Pool for the uncached work (defaults to `worker_pool`).
+
+    Returns:
+        dict: Output of `solve_board` for this board.
+
+    Raises:
+        PoolSaturatedError: If the worker pool is saturated.
+    """
+
+    board_key = f"{backend.lower()}:{board_to_string(parsed_board)}"
+    result = await board_cache.aget(board_key)
+    if result is not None:
+        return result
+
+    pool = pool or worker_pool
+    canonical_key, transform = await pool.run(canonicalize, parsed_board)
+    canonical_key = f"{backend.lower()}:{canonical_key}"
+    canonical = await canonical_cache.aget(canonical_key)
+
+    if canonical is not None:
+        # Isomorphic puzzle already solved: map its solution back to this board
+        result = dict(canonical)
+        if result["solved_board"] is not None:
+            result["solved_board"] = from_canonical(result["solved_board"], transform)
+    else:
+        result = await pool.run(solve_board, parsed_board, backend)
+        canonical = dict(result)
+        if canonical["solved_board"] is not None:
+            canonical["solved_board"] = to_canonical(canonical["solved_board"], transform)
+        canonical_cache.put(canonical_key, canonical)
+
+    board_cache.put(board_key, result)
+    return result
+
+
+def emit_report(parsed_board: list, result: dict, image_bytes: bytes, filename: str,
+                mode: str, sink) -> dict:
+    """
+    Builds the report artifacts of a solved board and hands them to a report sink.
+
+    Rendering is in-memory string work; disk writes (filesystem sink) happen in the sink's
+    background thread. In "full" mode the LLM summary is generated asynchronously: artifacts are
+    emitted with a placeholder and the report is emitted again once the summary is ready
+    (the inline sink returns whatever is available when the response is built).
+
+    Args:
+        parsed_board (list[list[int]]): Board extracted from the uploaded image.
+        result (dict): Output of `solve_board` for this board.
+        image_bytes (bytes): Content of the uploaded image, embedded in full reports.
+        filename (str): Original upload name, used for the file extension of the report image.
+        mode (str): "trace" (solution trace only) or "full" (trace, Markdown report and image).
+        sink: Report sink (see utils/report_sinks.py).
+
+    Returns:
+        dict: `sink` name and `files`, a list of artifact names (or name → content for inline).
+    """
+
+    base_name = f"upload_{uuid.uuid4()}"
+    solved_board = result["solved_board"]
+
+    final_trace = [
+        {"row": i, "col": j, "value": solved_board[i][j]}
+        for i in range(9)
+        for j in range(9)
+        if parsed_board[i][j] == 0
+    ]
+    artifacts = {f"{base_name}_solution_trace.json": json.dumps(final_trace, indent=2)}
+
+    if mode == "full":
+        image_name = f"{base_name}_input{os.path.splitext(filename)[1].lower()}"
+        report_name = f"{base_name}_REPORT.md"
+        metrics = {
+            "method": result["method"],
+            "solved": True,
+            "steps": result["steps"],
+            "duration": result["duration"]
+        }
+        render = partial(render_report, parsed_board, solved_board, metrics, image_name)
+
+        summary_future = summarize_async(len(final_trace), result["steps"], result["duration"])
+        summary = summary_future.result() if summary_future.done() else SUMMARY_PLACEHOLDER
+
+        if sink.name != "inline":
+            artifacts[image_name] = image_bytes
+        artifacts[report_name] = render(summary)
+
+    delivered = sink.emit(artifacts)
+
+    if mode == "full" and summary is SUMMARY_PLACEHOLDER and sink.name != "inline":
+        # Registered only after the placeholder is emitted: a summary that completed meanwhile
+        # runs the callback right here, and its report replaces the placeholder, not the reverse
+        summary_future.add_done_callback(
+            lambda future: sink.emit({report_name: render(future.result())})
+        )
+    return {"sink": sink.name, "files": delivered if delivered is not None else list(artifacts)}
+
+
 @app.post("/solve")
-async def solve_sudoku(image: UploadFile = File(...)):
+async def solve_sudoku(image: UploadFile = File(...), backend: str = Query(SOLVER_BACKEND),
+                       report: str = Query(REPORT_MODE), sink: str = Query(REPORT_SINK)):
     """
     Upload a Sudoku image, extract the board, solve it, and return the result.
 
+    Results are cached by content: a known image skips segmentation and the CNN, and a known
+    board skips the solver.
+    Boards that are isomorphic to a solved one (relabeled digits, permuted rows/columns/bands/
+    stacks, transposed) reuse its solution, mapped back through the symmetry transform.
+    Uncached stages run in the bounded worker pool; when the pool is saturated the request
+    is rejected right away with 503 instead of waiting in an unbounded queue.
+
     Args:
         image (UploadFile): Uploaded Sudoku image (JPG/PNG).
+        backend (str): Solver backend ("backtracking" or "dlx").
+        report (str): Report artifacts to produce: "none", "trace" or "full" (trace, Markdown
+            report with the LLM summary and the input image).
+        sink (str): Where report artifacts go: "filesystem" (OUTPUT_DIR, written in the
+            background), "memory" (served by /reports/{name}) or "inline" (in the response).
 
     Returns:
-        JSON containing the parsed and solved board, steps taken, and duration.
+        JSON containing the parsed and solved board, steps taken, and duration, plus a `report`
+        entry listing the artifacts when a report was requested.
+        `unique` is False when the parsed board admits more than one solution, which usually
+        means a digit was misread or missed by the CNN.
     """
     if not image.filename.endswith((".jpg", ".jpeg", ".png")):
         raise HTTPException(status_code=400, detail="Only JPG/PNG readme_images are supported")
 
-    # Save the uploaded file temporarily
-    temp_filename = f"temp_{uuid.uuid4()}.png"
-    with open(temp_filename, "wb") as f:
-        shutil.copyfileobj(image.file, f)
+    if backend.lower() not in SOLVER_BACKENDS:
+        raise HTTPException(status_code=400, detail=f"Unknown solver backend: {backend}")
 
-    try:
-        # Step 1: Parse board from image
-        parsed_board = extract_board_from_image(temp_filename)
-        if not isinstance(parsed_board, list) or len(parsed_board) != 9:
-            raise ValueError("Board extraction failed")
-
-        # Step 2: Solve using logic
-        solver = SudokuSolver(parsed_board)
-        success = solver.solve()
-
-        if not success:
-            return JSONResponse(status_code=422, content={"detail": "Could not solve the puzzle"})
-
-        # Step 3: Save trace and report
-        solved_board = solver.get_board()
-        trace_path = generate_trace_filename(temp_filename)
-
-        final_trace = [
-            {"row": i, "col": j, "value": solved_board[i][j]}
-            for i in range(9)
-            for j in range(9)
-            if parsed_board[i][j] == 0
-        ]
+    if report.lower() not in REPORT_MODES:
+        raise HTTPException(status_code=400, detail=f"Unknown report mode: {report}")
 
-        with open(trace_path, "w") as f:
-            json.dump(final_trace, f, indent=2)
-
-        save_solution_report(
-            input_board=parsed_board,
-            solved_board=solved_board,
-            bckt_metrics={
-                "method": "Backtracking",
-                "solved": success,
-                "steps": solver.steps,
-                "duration": solver.time_taken
-            },
-            image_path=temp_filename
-        )
+    if sink.lower() not in report_sinks:
+        raise HTTPException(status_code=400, detail=f"Unknown report sink: {sink}")
 
-        return {
-            "parsed_board": parsed_board,
-            "solved_board": solved_board,
-            "steps": solver.steps,
-            "duration": solver.time_taken,
-        }
+    image_bytes = await image.read()
+    digest = image_key(image_bytes)
 
+    try:
+        # Step 1: Parse board from the in-memory image (concurrent workers share CNN batches)
+        parsed_board = await image_cache.aget(digest)
+        if parsed_board is None:
+            parsed_board = await worker_pool.run(extract_board_from_bytes, image_bytes)
+            if not isinstance(parsed_board, list) or len(parsed_board) != 9:
+                raise ValueError("Board extraction failed")
+            image_cache.put(digest, parsed_board)
+
+        # Step 2: Solve the board
+        result = await solve_cached(parsed_board, backend)
+
+    except PoolSaturatedError:
+        logger.warning("⚠️ Worker pool saturated, rejecting request.")
+        raise HTTPException(status_code=503, detail="Server busy, please retry later",
+                            headers={"Retry-After": "1"})
     except Exception as e:
         logger.exception("❌ Failed to solve puzzle.")
         raise HTTPException(status_code=500, detail=str(e))
 
+    if result["solved_board"] is None:
+        return JSONResponse(status_code=422, content={"detail": "Could not solve the puzzle"})
+
+    response = {"parsed_board": parsed_board, **result}
+
+    # Step 3: Optional report artifacts (never written on the request path)
+    if report.lower() != "none":
+        response["report"] = emit_report(parsed_board, result, image_bytes, image.filename,
+                                         report.lower(), report_sinks[sink.lower()])
+
+    return response
+
+
+@app.post("/solve/page")
+async def solve_page(image: UploadFile = File(...), backend: str = Query(SOLVER_BACKEND)):
+    """
+    Upload a page holding several Sudoku grids (e.g. a scanned newspaper or puzzle book page),
+    and solve every grid found on it.
+
+    The cells of all the grids are classified in one CNN forward pass, and the boards are
+    solved concurrently in the worker pool, through the same result caches as /solve.
+
+    Args:
+        image (UploadFile): Uploaded page image (JPG/PNG).
+        backend (str): Solver backend ("backtracking" or "dlx").
+
+    Returns:
+        JSON with a `boards` list in reading order, one entry per grid: `index`, `corners`
+        (top-left, top-right, bottom-right and bottom-left [x, y] in page pixels),
+        `parsed_board`, `solved`, and the solution and metrics as returned by /solve.
+        The list is empty if no grid was found.
+    """
+    if not image.filename.lower().endswith(IMAGE_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="Only JPG/PNG readme_images are supported")
+
+    if backend.lower() not in SOLVER_BACKENDS:
+        raise HTTPException(status_code=400, detail=f"Unknown solver backend: {backend}")
+
+    image_bytes = await image.read()
+
+    try:
+        boards = await worker_pool.run(extract_boards_from_page_bytes, image_bytes)
+        results = await asyncio.gather(*(solve_cached(entry["parsed_board"], backend) for entry in boards))
+    except PoolSaturatedError:
+        logger.warning("⚠️ Worker pool saturated, rejecting request.")
+        raise HTTPException(status_code=503, detail="Server busy, please retry later",
+                            headers={"Retry-After": "1"})
+    except Exception as e:
+        logger.exception("❌ Failed to solve page.")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    logger.info(f"📰 Page solved: {len(boards)} grids found.")
+    return {
+        "boards": [
+            {"index": index, **entry, "solved": result["solved_board"] is not None, **result}
+            for index, (entry, result) in enumerate(zip(boards, results))
+        ]
+    }
+
+
+@app.post("/solve/batch")
+async def solve_batch(images: list[UploadFile] = File(...), backend: str = Query(SOLVER_BACKEND)):
+    """
+    Upload many Sudoku images, or zip archives of images (e.g. the scanned pages of a puzzle
+    book), and stream one result per image as NDJSON as soon as each board is solved.
+
+    Images are decoded and segmented in parallel, the cells of BATCH_CHUNK_IMAGES images are
+    classified in one CNN forward pass, and boards are solved on the shared batch process pool
+    through the same result caches as /solve. Lines arrive in completion order; `index` is the
+    position of the image in the upload (zip members are expanded in archive order). The batch
+    is rejected with 503 when the pool is saturated.
+
+    Args:
+        images (list[UploadFile]): JPG/PNG images and/or zip archives containing them.
+        backend (str): Solver backend ("backtracking" or "dlx").
+
+    Returns:
+        application/x-ndjson stream of {index, name, parsed_board, solved, solved_board, method,
+        unique, steps, duration}, or {index, name, parsed_board, error} for images that could
+        not be processed.
+    """
+
+    if backend.lower() not in SOLVER_BACKENDS:
+        raise HTTPException(status_code=400, detail=f"Unknown solver backend: {backend}")
+
+    entries = []  # (name, loader returning the encoded image)
+    for upload in images:
+        data = await upload.read()
+        filename = upload.filename or ""
+
+        if filename.lower().endswith(".zip"):
+            try:
+                archive = zipfile.ZipFile(io.BytesIO(data))
+            except zipfile.BadZipFile:
+                raise HTTPException(status_code=400, detail=f"Invalid zip archive: {filename}")
+            for member in archive.namelist():
+                if member.lower().endswith(IMAGE_EXTENSIONS) and not member.startswith("__MACOSX/"):
+                    entries.append((member, partial(archive.read, member)))
+        elif filename.lower().endswith(IMAGE_EXTENSIONS):
+            entries.append((filename, partial(bytes, data)))
+        else:
+            raise HTTPException(status_code=400, detail=f"Unsupported file: {filename}")
+
+    if not entries:
+        raise HTTPException(status_code=400, detail="No JPG/PNG images found in the upload")
+    if len(entries) > BATCH_MAX_IMAGES:
+        raise HTTPException(status_code=413, detail=f"Too many images (max {BATCH_MAX_IMAGES})")
+
+    if batch_pool.saturated:
+        logger.warning("⚠️ Batch pool saturated, rejecting batch.")
+        raise HTTPException(status_code=503, detail="Server busy, please retry later",
+                            headers={"Retry-After": "1"})
+
+    logger.info(f"📚 Batch of {len(entries)} images received.")
+    return StreamingResponse(stream_batch(entries, backend.lower()), media_type="application/x-ndjson")
+
+
+async def stream_batch(entries: list, backend: str):
+    """
+    Runs the batch pipeline and yields one NDJSON line per image as boards finish solving.
+
+    Extraction runs in a worker thread, and boards are solved through the result caches on
+    the shared batch process pool, at most one board per pool worker at a time for this batch.
+    A board rejected because the pool is saturated is reported as an error line.
+
+    Args:
+        entries (list[tuple[str, Callable[[], bytes]]]): Image names and loaders.
+        backend (str): Solver backend name.
+
+    Yields:
+        str: JSON result line.
+    """
+
+    async def solve_entry(index: int, board):
+        line = {"index": index, "name": entries[index][0]}
+        if isinstance(board, Exception):
+            return {**line, "parsed_board": None, "error": str(board)}
+
+        line["parsed_board"] = board
+        try:
+            result = await solve_cached(board, backend, batch_pool)
+        except PoolSaturatedError:
+            return {**line, "error": "Server busy, please retry later"}
+        except Exception as e:
+            return {**line, "error": str(e)}
+        return {**line, "solved": result["solved_board"] is not None, **result}
+
+    # Extraction of later chunks overlaps with solving
+    extracted = iterate_in_threadpool(
+        extract_boards_from_bytes((load() for _, load in entries), BATCH_CHUNK_IMAGES, API_WORKERS)
+    )
+    pending = set()
+
+    try:
+        index = 0
+        async for board in extracted:
+            pending.add(asyncio.create_task(solve_entry(index, board)))
+            index += 1
+
+            done = {task for task in pending if task.done()}
+            if len(pending) >= batch_pool.max_workers:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                yield json.dumps(task.result()) + "\n"
+
+        for task in asyncio.as_completed(pending):
+            yield json.dumps(await task) + "\n"
+        pending.clear()
     finally:
-        # Clean up temporary file
-        if os.path.exists(temp_filename):
-            os.remove(temp_filename)
\ No newline at end of file
+        for task in pending:  # Client disconnected: stop solving the remaining boards
+            task.cancel()
+
+
+@app.post("/solve/stream")
+async def solve_stream(image: UploadFile = File(...), backend: str = Query(SOLVER_BACKEND),
+                       report: str = Query(REPORT_MODE), sink: str = Query(REPORT_SINK),
+                       progress_interval: int = Query(1000, ge=1)):
+    """
+    Upload a Sudoku image and follow its processing as Server-Sent Events.
+
+    Events:
+        - `stage`: {stage, duration} when a pipeline stage completes (decode, warp, classify,
+          solve, and report when requested).
+        - `progress`: {steps, depth, filled, fill_ratio} every `progress_interval` solver steps.
+        - `result`: the same payload as /solve, sent last.
+        - `error`: {status, detail}, sent last if the pipeline fails.
+
+    Results are always computed (the result caches are bypassed) so progress is observable.
+
+    Args:
+        image (UploadFile): Uploaded Sudoku image (JPG/PNG).
+        backend (str): Solver backend ("backtracking" or "dlx").
+        report (str): Report artifacts to produce: "none", "trace" or "full".
+        sink (str): Where report artifacts go: "filesystem", "memory" or "inline".
+        progress_interval (int): Solver steps between two progress events.
+
+    Returns:
+        text/event-stream response.
+    """
+
+    if not image.filename.lower().endswith(IMAGE_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="Only JPG/PNG readme_images are supported")
+
+    if backend.lower() not in SOLVER_BACKENDS:
+        raise HTTPException(status_code=400, detail=f"Unknown solver backend: {backend}")
+
+    if report.lower() not in REPORT_MODES:
+        raise HTTPException(status_code=400, detail=f"Unknown report mode: {report}")
+
+    if sink.lower() not in report_sinks:
+        raise HTTPException(status_code=400, detail=f"Unknown report sink: {sink}")
+
+    image_bytes = await image.read()
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+
+    def emit(event: str, data: dict):
+        # Called from the worker thread: hand the event over to the event loop
+        loop.call_soon_threadsafe(events.put_nowait, (event, data))
+
+    job = partial(run_streamed_pipeline, image_bytes, image.filename, backend.lower(), report.lower(),
+                  report_sinks[sink.lower()], progress_interval, emit)
+
+    # The job reports its own result and errors as events. Progress callbacks cannot cross
+    # process boundaries, so it runs on the (bounded) thread pool for streamed jobs
+    try:
+        stream_pool.submit(job)
+    except PoolSaturatedError:
+        logger.warning("⚠️ Stream pool saturated, rejecting request.")
+        raise HTTPException(status_code=503, detail="Server busy, please retry later",
+                            headers={"Retry-After": "1"})
+
+    async def event_stream():
+        while True:
+            event, data = await events.get()
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+            if event in ("result", "error"):
+                break
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+
+def run_streamed_pipeline(image_bytes: bytes, filename: str, backend: str, report: str, sink,
+                          progress_interval: int, emit):
+    """
+    Runs the full /solve pipeline for one image, reporting each stage through `emit`.
+    Executed in a worker thread.
+
+    Args:
+        image_bytes (bytes): Content of the uploaded image.
+        filename (str): Original upload name.
+        backend (str): Solver backend name.
+        report (str): Report mode ("none", "trace" or "full").
+        sink: Report sink for the artifacts.
+        progress_interval (int): Solver steps between two progress events.
+        emit (Callable[[str, dict], None]): Receives each event name and payload.
+    """
+
+    def on_stage(stage: str, duration: float):
+        emit("stage", {"stage": stage, "duration": round(duration, 4)})
+
+    try:
+        parsed_board = extract_board_from_bytes(image_bytes, on_stage=on_stage)
+
+        start = time.perf_counter()
+        result = solve_board(parsed_board, backend, partial(emit, "progress"), progress_interval)
+        on_stage("solve", time.perf_counter() - start)
+
+        if result["solved_board"] is None:
+            emit("error", {"status": 422, "detail": "Could not solve the puzzle"})
+            return
+
+        response = {"parsed_board": parsed_board, **result}
+        if report != "none":
+            start = time.perf_counter()
+            response["report"] = emit_report(parsed_board, result, image_bytes, filename, report, sink)
+            on_stage("report", time.perf_counter() - start)
+
+        emit("result", response)
+
+    except Exception as e:
+        logger.exception("❌ Failed to solve puzzle.")
+        emit("error", {"status": 500, "detail": str(e)})
+
+
+@app.get("/reports/{name}")
+def get_report(name: str):
+    """
+    Returns a report artifact kept by the in-memory sink (`sink=memory` on /solve).
+    """
+
+    content = report_sinks["memory"].get(name)
+    if content is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired report artifact: {name}")
+
+    if name.endswith(".md"):
+        media_type = "text/markdown"
+    elif name.endswith(".json"):
+        media_type = "application/json"
+    elif name.endswith(".png"):
+        media_type = "image/png"
+    else:
+        media_type = "image/jpeg"
+    return Response(content=content, media_type=media_type)
+
+
+@app.get("/cache/stats")
+def cache_stats():
+    """
+    Returns hit/miss counters of the image → board, board → solution and canonical board
+    → solution caches.
+    """
+    return {"images": image_cache.stats(), "boards": board_cache.stats(), "canonical": canonical_cache.stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """
+    Exposes stage latency histograms, request counters, cache counters and worker pool gauges
+    in the Prometheus text exposition format.
+    """
+
+    for cache in (image_cache, board_cache, canonical_cache):
+        stats = cache.stats()
+        for field in ("size", "hits", "misses"):
+            metrics.set_gauge(f"sudoku_result_cache_{field}", stats[field], cache=cache.name)
+
+    if worker_pool is not None:
+        metrics.set_gauge("sudoku_worker_pool_in_flight", worker_pool.in_flight)
+        metrics.set_gauge("sudoku_worker_pool_rejected", worker_pool.rejected)
+    for name, pool in (("batch", batch_pool), ("stream", stream_pool)):
+        if pool is not None and pool is not worker_pool:
+            metrics.set_gauge(f"sudoku_{name}_pool_in_flight", pool.in_flight)
+            metrics.set_gauge(f"sudoku_{name}_pool_rejected", pool.rejected)
+
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
@@ -10,6 +10,18 @@
 # The output is an integer:                                                                      #
 #     - 1 to 9 → predicted digit                                                                 #
 #     - 0      → if the cell is classified as empty                                              #
+#                                                                                                #
+# `classify_cells` stacks many cells into a single (N, 64, 64, 1) tensor and classifies them     #
+# in one forward pass, which avoids paying the per-call Keras overhead 81 times per board.       #
+# `preprocess_grid` builds the same tensor straight from a warped grid: the grid is converted    #
+# to grayscale and resized once, then reshaped into 81 cells, with no per-cell Python work.      #
+#                                                                                                #
+# When micro-batching is enabled (see `enable_micro_batching`), the tensors of concurrent        #
+# callers are merged by an InferenceBatcher into larger model calls.                             #
+#                                                                                                #
+# The inference runtime (Keras, TFLite or ONNX Runtime, see `inference_backends`) is selected   #
+# by INFERENCE_BACKEND and loaded lazily, on first use (or via `warmup()`), so importing this    #
+# module (and the vision pipeline) stays cheap for solver-only code paths.                       #
 ##################################################################################################
 
 ##################################################################################################
@@ -18,36 +30,41 @@
 
 import numpy as np
 import cv2
-import os
-from tensorflow.keras.models import load_model
+import time
+import threading
+from cnn_classifier.inference_batcher import InferenceBatcher
+from cnn_classifier.inference_backends import load_backend
+from utils.logs_config import logger
+from utils.metrics import timed, inc
 
 ##################################################################################################
 #                                        CONFIGURATION                                           #
 ##################################################################################################
 
-MODEL_PATH = os.path.join(os.path.dirname(__file__), "model", "digit_model.keras")
 IMG_SIZE = 64
 
-model = load_model(MODEL_PATH)
+model = None  # Inference backend, loaded on first use by get_model()
+_model_lock = threading.Lock()
 class_names = ['1', '2', '3', '4', '5', '6', '7', '8', '9', 'empty']
 
+batcher = None  # Shared InferenceBatcher, set by enable_micro_batching()
+
 ##################################################################################################
 #                                        IMPLEMENTATION                                          #
 ##################################################################################################
 
-def classify_cell(cell_img: np.ndarray) -> int:
+def preprocess_cell(cell_img: np.ndarray) -> np.ndarray:
     """
-    Classifies the digit present in a Sudoku cell using a pre-trained CNN model.
+    Converts a cell image into the model's input format.
 
-    The input is a grayscale image of a single cell. The image is resized,
-    normalized, and reshaped to match the model’s expected input format.
-    The model then predicts whether the cell contains a digit (1–9) or is empty.
+    The image is resized to IMG_SIZE x IMG_SIZE, converted to grayscale if needed,
+    and normalized to [0, 1].
 
     Args:
-        cell_img (np.ndarray): Grayscale image of the Sudoku cell as a 2D NumPy array.
+        cell_img (np.ndarray): Grayscale or BGR image of the Sudoku cell.
 
     Returns:
-        int: Predicted digit (1–9), or 0 if the cell is classified as empty.
+        np.ndarray: Float32 array of shape (64, 64).
     """
 
     # Resize and normalize
@@ -57,12 +74,176 @@ def classify_cell(cell_img: np.ndarray) -> int:
     if len(cell.shape) == 3 and cell.shape[2] == 3:
         cell = cv2.cvtColor(cell, cv2.COLOR_BGR2GRAY)
 
-    cell = cell.astype("float32") / 255.0
-    cell = np.expand_dims(cell, axis=-1)   # → (64, 64, 1)
-    cell = np.expand_dims(cell, axis=0)    # → (1, 64, 64, 1)
+    return cell.astype("float32") / 255.0
+
+def preprocess_grid(grid_img: np.ndarray, trim: float = 0.0) -> np.ndarray:
+    """
+    Converts a whole warped grid into the model's input tensor in one pass.
+
+    The grid is converted to grayscale once, the cell borders are optionally trimmed, and the
+    grid is resized to 9 * IMG_SIZE pixels per side, which scales each cell to IMG_SIZE exactly
+    like resizing it on its own. The result is reshaped into 81 cells in row-major order.
+
+    Args:
+        grid_img (np.ndarray): Warped grayscale or BGR grid (e.g. 450x450 from the segmenter).
+        trim (float): Fraction of each cell's size removed on every side before resizing.
+
+    Returns:
+        np.ndarray: Contiguous float32 tensor of shape (81, 64, 64, 1) with values in [0, 1].
+    """
+
+    gray = grid_img if grid_img.ndim == 2 else cv2.cvtColor(grid_img, cv2.COLOR_BGR2GRAY)
+    cell_h, cell_w = gray.shape[0] // 9, gray.shape[1] // 9
+    dy, dx = int(round(cell_h * trim)), int(round(cell_w * trim))
+
+    # (9, h, 9, w) view of the cells; trimming and merging back into a mosaic is one copy
+    cells = gray[:cell_h * 9, :cell_w * 9].reshape(9, cell_h, 9, cell_w)
+    if dy or dx:
+        cells = cells[:, dy:cell_h - dy, :, dx:cell_w - dx]
+    mosaic = cells.reshape(9 * cells.shape[1], 9 * cells.shape[3])
+
+    resized = cv2.resize(mosaic, (9 * IMG_SIZE, 9 * IMG_SIZE))
+    batch = resized.reshape(9, IMG_SIZE, 9, IMG_SIZE).swapaxes(1, 2).reshape(81, IMG_SIZE, IMG_SIZE, 1)
+
+    batch = batch.astype("float32")
+    batch *= 1.0 / 255.0
+    return batch
+
+def get_model():
+    """
+    Returns the configured inference backend, importing its runtime and loading the model
+    from disk on the first call.
+
+    Loading is guarded by a lock, so concurrent first requests deserialize the model once.
+
+    Returns:
+        KerasBackend | TFLiteBackend | OnnxBackend: Backend exposing `predict(batch)`.
+    """
+
+    global model
+
+    if model is None:
+        with _model_lock:
+            if model is None:
+                start = time.perf_counter()
+                model = load_backend()
+                logger.info(f"🧠 CNN model loaded with the {model.name} backend "
+                            f"in {time.perf_counter() - start:.2f} seconds")
+    return model
+
+def warmup() -> float:
+    """
+    Loads the model and runs one dummy forward pass, so the first real request does not pay
+    for TensorFlow initialization. Intended for startup hooks.
+
+    Returns:
+        float: Time spent warming up, in seconds.
+    """
+
+    start = time.perf_counter()
+    predict_batch(np.zeros((1, IMG_SIZE, IMG_SIZE, 1), dtype="float32"))
+    return time.perf_counter() - start
+
+@timed("cnn_inference")
+def predict_batch(batch: np.ndarray) -> np.ndarray:
+    """
+    Runs a single forward pass of the CNN model on a preprocessed batch.
+
+    Args:
+        batch (np.ndarray): Float32 tensor of shape (N, 64, 64, 1).
+
+    Returns:
+        np.ndarray: Class probabilities of shape (N, 10).
+    """
+
+    return get_model().predict(batch)
+
+def enable_micro_batching(max_batch_size: int = 810, max_wait_ms: float = 5.0) -> InferenceBatcher:
+    """
+    Routes every `classify_cells` call through a shared cross-request batching queue.
 
-    pred = model.predict(cell, verbose=0)
-    predicted_class = np.argmax(pred)
+    Args:
+        max_batch_size (int): Number of cells that triggers an immediate model call.
+        max_wait_ms (float): Maximum time a request waits for others to join its batch.
+
+    Returns:
+        InferenceBatcher: The running batcher (also stored in the module-level `batcher`).
+    """
+
+    global batcher
+
+    disable_micro_batching()
+    batcher = InferenceBatcher(predict_batch, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    batcher.start()
+    return batcher
+
+def disable_micro_batching():
+    """
+    Stops the shared batching queue, if any, and goes back to direct model calls.
+    """
+
+    global batcher
+
+    if batcher is not None:
+        batcher.stop()
+        batcher = None
+
+def classify_cells(cells) -> list[int]:
+    """
+    Classifies many Sudoku cells with a single forward pass of the CNN model.
+
+    All cells are preprocessed and stacked into one (N, 64, 64, 1) tensor, so the model
+    is invoked once per board instead of once per cell.
+
+    Args:
+        cells (list[np.ndarray]): Grayscale or BGR cell images.
+
+    Returns:
+        list[int]: Predicted digit (1–9) for each cell, or 0 if classified as empty.
+    """
+
+    if len(cells) == 0:
+        return []
+
+    batch = np.stack([preprocess_cell(cell) for cell in cells])
+    batch = np.expand_dims(batch, axis=-1)   # → (N, 64, 64, 1)
+    return classify_batch(batch)
+
+@timed("classify_cells")
+def classify_batch(batch: np.ndarray) -> list[int]:
+    """
+    Classifies an already preprocessed tensor of cells (see `preprocess_grid`).
+
+    Args:
+        batch (np.ndarray): Float32 tensor of shape (N, 64, 64, 1).
+
+    Returns:
+        list[int]: Predicted digit (1–9) for each cell, or 0 if classified as empty.
+    """
+
+    if len(batch) == 0:
+        return []
+
+    inc("sudoku_cells_classified_total", len(batch))
+    preds = batcher.predict(batch) if batcher is not None else predict_batch(batch)
+    predicted_classes = np.argmax(preds, axis=1)
+
+    labels = [class_names[i] for i in predicted_classes]
+    return [int(label) if label != "empty" else 0 for label in labels]
+
+def classify_cell(cell_img: np.ndarray) -> int:
+    """
+    Classifies the digit present in a Sudoku cell using a pre-trained CNN model.
+
+    The input is a grayscale image of a single cell. The image is resized,
+    normalized, and reshaped to match the model’s expected input format.
+    The model then predicts whether the cell contains a digit (1–9) or is empty.
+
+    Args:
+        cell_img (np.ndarray): Grayscale image of the Sudoku cell as a 2D NumPy array.
+
+    Returns:
+        int: Predicted digit (1–9), or 0 if the cell is classified as empty.
+    """
 
-    label = class_names[predicted_class]
-    return int(label) if label != "empty" else 0
+    return classify_cells([cell_img])[0]
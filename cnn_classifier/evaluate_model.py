@@ -5,6 +5,10 @@
 # It generates final metrics (loss, accuracy), a detailed predictions report (CSV),              #
 # and a confusion matrix heatmap for visual inspection.                                          #
 # Outputs are saved under cnn_classifier/results/test/                                           #
+#                                                                                                #
+# With --compare-backends, every available inference backend (Keras, and the TFLite/ONNX         #
+# models produced by export_model.py) is scored on the same test images, reporting accuracy,     #
+# agreement with Keras, per-board latency and model size in `backends_comparison.json`.          #
 ##################################################################################################
 
 ##################################################################################################
@@ -13,6 +17,8 @@
 
 import os
 import json
+import time
+import argparse
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -21,6 +27,8 @@ from utils.logs_config import logger
 from sklearn.metrics import confusion_matrix
 from tensorflow.keras.models import load_model
 from tensorflow.keras.preprocessing.image import ImageDataGenerator
+from cnn_classifier.inference_backends import load_backend, MODEL_DIR
+from cnn_classifier.export_model import load_labeled_cells
 
 ##################################################################################################
 #                                      CONFIGURATION                                             #
@@ -32,6 +40,16 @@ MODEL_PATH = "model/digit_model.keras"
 TEST_DIR = "../datasets/test"
 OUTPUT_DIR = "results/test"
 
+# Candidate models for the backend comparison (missing files are skipped)
+BACKEND_MODELS = [
+    ("keras", "digit_model.keras"),
+    ("tflite", "digit_model.tflite"),
+    ("tflite", "digit_model_int8.tflite"),
+    ("onnx", "digit_model.onnx"),
+    ("onnx", "digit_model_int8.onnx"),
+]
+BOARD_SIZE = 81  # Cells per forward pass, as in the solving pipeline
+
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 ##################################################################################################
@@ -151,9 +169,77 @@ def run_evaluation():
     df.to_csv(os.path.join(OUTPUT_DIR, "predictions_report.csv"), index=False)
     logger.info("📁 Saved predictions report CSV.")
 
+def compare_backends():
+    """
+    Scores every available inference backend on the labeled test dataset.
+
+    This function:
+    - Loads the test images with the same preprocessing as the deployed classifier.
+    - Runs each exported model in 81-cell batches, as the solving pipeline does.
+    - Reports accuracy, agreement with the Keras predictions, mean latency per board and
+      model file size, and saves them to `backends_comparison.json`.
+    """
+
+    inputs, labels = load_labeled_cells(TEST_DIR)
+    logger.info(f"Loaded {len(inputs)} test images from {TEST_DIR}")
+
+    results = []
+    reference = None
+
+    for backend_name, filename in BACKEND_MODELS:
+        model_path = os.path.join(MODEL_DIR, filename)
+        if not os.path.exists(model_path):
+            logger.info(f"⏭️ Skipping {filename} (not exported)")
+            continue
+
+        try:
+            backend = load_backend(backend_name, model_path)
+        except ImportError as e:
+            logger.warning(f"⚠️ Skipping {filename}: runtime not installed ({e})")
+            continue
+
+        backend.predict(inputs[:BOARD_SIZE])  # Warm-up
+
+        batch_times = []
+        predictions = []
+        for start in range(0, len(inputs), BOARD_SIZE):
+            t0 = time.perf_counter()
+            preds = backend.predict(inputs[start:start + BOARD_SIZE])
+            batch_times.append(time.perf_counter() - t0)
+            predictions.append(np.argmax(preds, axis=1))
+
+        predictions = np.concatenate(predictions)
+        if reference is None:
+            reference = predictions
+
+        result = {
+            "backend": backend_name,
+            "model": filename,
+            "accuracy": round(float(np.mean(predictions == labels)), 4),
+            "agreement_with_reference": round(float(np.mean(predictions == reference)), 4),
+            "ms_per_board": round(1000 * float(np.mean(batch_times)), 3),
+            "size_mb": round(os.path.getsize(model_path) / 1e6, 3),
+        }
+        results.append(result)
+        logger.info(f"🎯 {filename:<24} accuracy {result['accuracy']:.4f} | "
+                    f"agreement {result['agreement_with_reference']:.4f} | "
+                    f"{result['ms_per_board']:.2f} ms/board | {result['size_mb']:.2f} MB")
+
+    with open(os.path.join(OUTPUT_DIR, "backends_comparison.json"), "w") as f:
+        json.dump(results, f, indent=4)
+    logger.info("📁 Saved backends comparison JSON.")
+
 ##################################################################################################
 #                                               MAIN                                             #
 ##################################################################################################
 
 if __name__ == "__main__":
-    run_evaluation()
+    parser = argparse.ArgumentParser(description="Evaluate the digit classifier on the test dataset.")
+    parser.add_argument("--compare-backends", action="store_true",
+                        help="Compare accuracy and latency of the Keras, TFLite and ONNX models")
+    args = parser.parse_args()
+
+    if args.compare_backends:
+        compare_backends()
+    else:
+        run_evaluation()
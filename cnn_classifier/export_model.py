@@ -0,0 +1,210 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This script converts the trained Keras model (digit_model.keras) into lightweight formats      #
+# for the `tflite` and `onnx` inference backends (see cnn_classifier/inference_backends.py).     #
+#                                                                                                #
+# With --int8, post-training full-integer quantization is applied, calibrated on labeled cell    #
+# images from datasets/val. Calibration images go through the same `preprocess_cell` as the      #
+# deployed classifier, so the quantization ranges match what the model sees in production.      #
+#                                                                                                #
+# Outputs (under cnn_classifier/model/):                                                         #
+#   - digit_model.tflite / digit_model_int8.tflite                                               #
+#   - digit_model.onnx   / digit_model_int8.onnx                                                 #
+#                                                                                                #
+# Usage:                                                                                         #
+#   python -m cnn_classifier.export_model --format tflite onnx --int8                            #
+#   INFERENCE_BACKEND=tflite INFERENCE_MODEL_PATH=<file> python app.py                           #
+#                                                                                                #
+# Accuracy and latency of every exported model can be compared with                             #
+#   python -m cnn_classifier.evaluate_model --compare-backends                                   #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import os
+import argparse
+import tempfile
+import cv2
+import numpy as np
+from utils.logs_config import logger
+from cnn_classifier.digit_classifier import preprocess_cell, class_names, IMG_SIZE
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MODEL_DIR = os.path.join(BASE_DIR, "model")
+KERAS_MODEL_PATH = os.path.join(MODEL_DIR, "digit_model.keras")
+VAL_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", "datasets", "val"))
+
+CALIBRATION_PER_CLASS = 30  # Calibration images per class (300 in total)
+ONNX_OPSET = 13
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def load_labeled_cells(directory: str, limit_per_class: int = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Loads labeled cell images from a class-per-folder dataset (1/ … 9/, empty/).
+
+    Images are preprocessed exactly like in `digit_classifier.classify_cells`.
+
+    Args:
+        directory (str): Dataset root containing one subfolder per class.
+        limit_per_class (int): Maximum number of images per class (all if None).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Float32 inputs (N, 64, 64, 1) and class indices (N,).
+    """
+
+    images, labels = [], []
+
+    for label, class_name in enumerate(class_names):
+        class_dir = os.path.join(directory, class_name)
+        if not os.path.isdir(class_dir):
+            continue
+
+        filenames = sorted(os.listdir(class_dir))[:limit_per_class]
+        for filename in filenames:
+            img = cv2.imread(os.path.join(class_dir, filename), cv2.IMREAD_GRAYSCALE)
+            if img is None:
+                continue
+            images.append(preprocess_cell(img))
+            labels.append(label)
+
+    return np.expand_dims(np.stack(images), axis=-1), np.array(labels)
+
+def export_tflite(model, output_path: str, calibration: np.ndarray = None) -> int:
+    """
+    Converts a Keras model to TFLite.
+
+    Args:
+        model (keras.Model): Trained digit classifier.
+        output_path (str): Destination .tflite file.
+        calibration (np.ndarray): Representative inputs (N, 64, 64, 1). If given, the model is
+            fully quantized to int8, including its input and output tensors.
+
+    Returns:
+        int: Size of the exported file in bytes.
+    """
+
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+
+    if calibration is not None:
+        def representative_dataset():
+            for sample in calibration:
+                yield [sample[np.newaxis]]
+
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+
+    with open(output_path, "wb") as f:
+        f.write(converter.convert())
+
+    return os.path.getsize(output_path)
+
+def export_onnx(model, output_path: str, calibration: np.ndarray = None) -> int:
+    """
+    Converts a Keras model to ONNX with a dynamic batch dimension.
+
+    Args:
+        model (keras.Model): Trained digit classifier.
+        output_path (str): Destination .onnx file.
+        calibration (np.ndarray): Representative inputs (N, 64, 64, 1). If given, static int8
+            quantization (QDQ format) is applied with ONNX Runtime.
+
+    Returns:
+        int: Size of the exported file in bytes.
+    """
+
+    import tensorflow as tf
+    import tf2onnx
+
+    spec = (tf.TensorSpec((None, IMG_SIZE, IMG_SIZE, 1), tf.float32, name="input"),)
+    forward = tf.function(lambda x: model(x, training=False), input_signature=spec)
+
+    if calibration is None:
+        tf2onnx.convert.from_function(forward, input_signature=spec, opset=ONNX_OPSET, output_path=output_path)
+        return os.path.getsize(output_path)
+
+    from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+
+    class CellCalibrationReader(CalibrationDataReader):
+        """
+        Feeds calibration cells to ONNX Runtime one at a time.
+        """
+
+        def __init__(self, samples):
+            self.samples = iter(samples)
+
+        def get_next(self):
+            sample = next(self.samples, None)
+            return None if sample is None else {"input": sample[np.newaxis]}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        float_path = os.path.join(tmp_dir, "digit_model_fp32.onnx")
+        tf2onnx.convert.from_function(forward, input_signature=spec, opset=ONNX_OPSET, output_path=float_path)
+        quantize_static(
+            float_path,
+            output_path,
+            CellCalibrationReader(calibration),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QInt8,
+            weight_type=QuantType.QInt8,
+        )
+
+    return os.path.getsize(output_path)
+
+EXPORTERS = {
+    "tflite": export_tflite,
+    "onnx": export_onnx,
+}
+
+def run_export(formats=("tflite", "onnx"), int8: bool = False):
+    """
+    Exports the trained Keras model to the requested formats.
+
+    Args:
+        formats (Iterable[str]): Target formats (keys of EXPORTERS).
+        int8 (bool): If True, applies int8 post-training quantization calibrated on datasets/val.
+    """
+
+    from tensorflow.keras.models import load_model
+
+    model = load_model(KERAS_MODEL_PATH)
+    logger.info(f"Loaded model from {KERAS_MODEL_PATH} ({os.path.getsize(KERAS_MODEL_PATH) / 1e6:.2f} MB)")
+
+    calibration = None
+    if int8:
+        calibration, _ = load_labeled_cells(VAL_DIR, CALIBRATION_PER_CLASS)
+        logger.info(f"🎯 Calibrating int8 quantization on {len(calibration)} images from {VAL_DIR}")
+
+    suffix = "_int8" if int8 else ""
+    for fmt in formats:
+        output_path = os.path.join(MODEL_DIR, f"digit_model{suffix}.{fmt}")
+        size = EXPORTERS[fmt](model, output_path, calibration)
+        logger.info(f"💾 Exported {fmt} model to {output_path} ({size / 1e6:.2f} MB)")
+
+##################################################################################################
+#                                               MAIN                                             #
+##################################################################################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the digit classifier to TFLite and/or ONNX.")
+    parser.add_argument("--format", nargs="+", default=["tflite", "onnx"], choices=sorted(EXPORTERS),
+                        help="Target formats (default: both)")
+    parser.add_argument("--int8", action="store_true", help="Apply int8 post-training quantization")
+    args = parser.parse_args()
+
+    run_export(args.format, args.int8)
@@ -0,0 +1,192 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module provides interchangeable inference runtimes for the digit classifier CNN.          #
+# Every backend exposes the same `predict(batch)` call, mapping a float32 (N, 64, 64, 1) tensor  #
+# to class probabilities (N, 10), so `digit_classifier` does not depend on a specific runtime.   #
+#                                                                                                #
+# Available backends:                                                                            #
+#   - keras  → the original TensorFlow/Keras model (digit_model.keras)                           #
+#   - tflite → TFLite model, float32 or int8-quantized (digit_model.tflite)                      #
+#   - onnx   → ONNX Runtime model, float32 or int8-quantized (digit_model.onnx)                  #
+#                                                                                                #
+# TFLite and ONNX files are produced by `cnn_classifier/export_model.py`. Both runtimes start    #
+# faster and use far less memory than the full TensorFlow stack, which matters per API worker.   #
+# Runtime packages are imported only when their backend is loaded.                               #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import os
+import threading
+import numpy as np
+from utils.config import INFERENCE_BACKEND, INFERENCE_MODEL_PATH
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+MODEL_DIR = os.path.join(os.path.dirname(__file__), "model")
+
+DEFAULT_MODEL_PATHS = {
+    "keras": os.path.join(MODEL_DIR, "digit_model.keras"),
+    "tflite": os.path.join(MODEL_DIR, "digit_model.tflite"),
+    "onnx": os.path.join(MODEL_DIR, "digit_model.onnx"),
+}
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def quantize(batch: np.ndarray, scale: float, zero_point: int, dtype) -> np.ndarray:
+    """
+    Converts a float tensor into the integer representation expected by a quantized model.
+
+    Args:
+        batch (np.ndarray): Float input tensor.
+        scale (float): Quantization scale of the model input.
+        zero_point (int): Quantization zero point of the model input.
+        dtype (np.dtype): Integer input type (e.g. np.int8).
+
+    Returns:
+        np.ndarray: Quantized tensor, clipped to the range of `dtype`.
+    """
+
+    info = np.iinfo(dtype)
+    return np.clip(np.round(batch / scale + zero_point), info.min, info.max).astype(dtype)
+
+def dequantize(values: np.ndarray, scale: float, zero_point: int) -> np.ndarray:
+    """
+    Converts a quantized model output back into float values.
+
+    Args:
+        values (np.ndarray): Integer output tensor.
+        scale (float): Quantization scale of the model output.
+        zero_point (int): Quantization zero point of the model output.
+
+    Returns:
+        np.ndarray: Float32 tensor.
+    """
+
+    return (values.astype("float32") - zero_point) * scale
+
+class KerasBackend:
+    """
+    Runs the original Keras model through TensorFlow.
+    """
+
+    name = "keras"
+
+    def __init__(self, model_path: str):
+        from tensorflow.keras.models import load_model
+        self.model = load_model(model_path)
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Returns class probabilities (N, 10) for a float32 (N, 64, 64, 1) batch.
+        """
+
+        return np.asarray(self.model.predict_on_batch(batch))
+
+class TFLiteBackend:
+    """
+    Runs a TFLite model with the standalone `tflite_runtime` interpreter when installed,
+    falling back to the interpreter bundled with TensorFlow. Int8 models are handled
+    transparently by quantizing inputs and dequantizing outputs. Calls are serialized,
+    since an interpreter must not be invoked from several threads at once.
+    """
+
+    name = "tflite"
+
+    def __init__(self, model_path: str):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter
+
+        self.interpreter = Interpreter(model_path=model_path)
+        self.interpreter.allocate_tensors()
+        self.input = self.interpreter.get_input_details()[0]
+        self.output = self.interpreter.get_output_details()[0]
+        self.batch_size = int(self.input["shape"][0])
+        self._lock = threading.Lock()
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Returns class probabilities (N, 10) for a float32 (N, 64, 64, 1) batch.
+        """
+
+        with self._lock:
+            # The interpreter has a static batch dimension, resized only when N changes
+            if len(batch) != self.batch_size:
+                self.interpreter.resize_tensor_input(self.input["index"], [len(batch), *batch.shape[1:]])
+                self.interpreter.allocate_tensors()
+                self.input = self.interpreter.get_input_details()[0]
+                self.output = self.interpreter.get_output_details()[0]
+                self.batch_size = len(batch)
+
+            if np.issubdtype(self.input["dtype"], np.integer):
+                scale, zero_point = self.input["quantization"]
+                batch = quantize(batch, scale, zero_point, self.input["dtype"])
+
+            self.interpreter.set_tensor(self.input["index"], batch.astype(self.input["dtype"], copy=False))
+            self.interpreter.invoke()
+            preds = self.interpreter.get_tensor(self.output["index"])
+
+        if np.issubdtype(self.output["dtype"], np.integer):
+            scale, zero_point = self.output["quantization"]
+            preds = dequantize(preds, scale, zero_point)
+        return preds
+
+class OnnxBackend:
+    """
+    Runs an ONNX model (float32 or QDQ int8) with ONNX Runtime on the CPU.
+    """
+
+    name = "onnx"
+
+    def __init__(self, model_path: str):
+        import onnxruntime as ort
+
+        self.session = ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Returns class probabilities (N, 10) for a float32 (N, 64, 64, 1) batch.
+        """
+
+        return self.session.run(None, {self.input_name: batch.astype("float32", copy=False)})[0]
+
+INFERENCE_BACKENDS = {
+    "keras": KerasBackend,
+    "tflite": TFLiteBackend,
+    "onnx": OnnxBackend,
+}
+
+def load_backend(name: str = None, model_path: str = None):
+    """
+    Instantiates the inference backend registered under the given name.
+
+    Args:
+        name (str): Backend name (see INFERENCE_BACKENDS). Defaults to the configured backend.
+        model_path (str): Model file to load. Defaults to the configured path, or to the
+            backend's file in MODEL_DIR.
+
+    Returns:
+        KerasBackend | TFLiteBackend | OnnxBackend: Backend ready for `predict(batch)`.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+
+    if name is None:
+        name, model_path = INFERENCE_BACKEND, model_path or INFERENCE_MODEL_PATH
+
+    name = name.lower()
+    if name not in INFERENCE_BACKENDS:
+        raise ValueError(f"Unknown inference backend '{name}'. Available: {', '.join(INFERENCE_BACKENDS)}")
+
+    return INFERENCE_BACKENDS[name](model_path or DEFAULT_MODEL_PATHS[name])
@@ -0,0 +1,160 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module implements a cross-request micro-batching queue for CNN inference.                 #
+#                                                                                                #
+# Concurrent callers submit their cell tensors (N, 64, 64, 1) to a shared queue. A single        #
+# background thread gathers pending tensors and flushes them as one batch when either:          #
+#   - the accumulated number of cells reaches `max_batch_size`, or                               #
+#   - `max_wait_ms` milliseconds have passed since the first pending tensor arrived.             #
+# The batch predictions are then split and routed back to each caller through a Future.          #
+#                                                                                                #
+# Batching amortizes the fixed per-call model overhead across requests, so CPU throughput grows  #
+# with concurrency instead of staying flat. It also keeps every model call on a single thread.   #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import time
+import queue
+import threading
+from concurrent.futures import Future
+
+import numpy as np
+from utils.logs_config import logger
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+class InferenceBatcher:
+    """
+    Gathers inference requests from many threads and runs them as combined batches.
+    """
+
+    def __init__(self, predict_fn, max_batch_size: int = 810, max_wait_ms: float = 5.0):
+        """
+        Initializes the batcher. Call `start()` before submitting work.
+
+        Args:
+            predict_fn (Callable[[np.ndarray], np.ndarray]): Function mapping an input batch
+                (N, ...) to an output array (N, ...), e.g. a model's predict_on_batch.
+            max_batch_size (int): Number of rows that triggers an immediate flush.
+            max_wait_ms (float): Maximum time a request waits for other requests to join its batch.
+        """
+
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.batches = 0  # Number of model calls made
+        self.items = 0  # Number of rows predicted
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        """
+        Starts the background flushing thread (no-op if already running).
+        """
+
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="inference-batcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Flushes pending requests and stops the background thread.
+        """
+
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+
+    def submit(self, batch: np.ndarray) -> Future:
+        """
+        Queues an input batch for inference.
+
+        Args:
+            batch (np.ndarray): Input rows for the model, e.g. (81, 64, 64, 1).
+
+        Returns:
+            Future: Resolves to the predictions for exactly these rows.
+        """
+
+        future = Future()
+        self._queue.put((batch, future))
+        return future
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Queues an input batch and blocks until its predictions are available.
+        """
+
+        return self.submit(batch).result()
+
+    def _run(self):
+        """
+        Background loop: collects pending requests into batches and dispatches them.
+        """
+
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            pending = [item]
+            size = len(item[0])
+            deadline = time.perf_counter() + self.max_wait
+
+            while size < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                pending.append(item)
+                size += len(item[0])
+
+            self._flush(pending)
+
+        # Serve anything still queued after the stop sentinel
+        leftovers = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                leftovers.append(item)
+        if leftovers:
+            self._flush(leftovers)
+
+    def _flush(self, pending):
+        """
+        Runs one model call for all pending requests and routes the results back.
+
+        Args:
+            pending (list[tuple[np.ndarray, Future]]): Requests to serve together.
+        """
+
+        try:
+            batch = np.concatenate([inputs for inputs, _ in pending])
+            outputs = self.predict_fn(batch)
+        except Exception as e:
+            logger.exception("❌ Batched inference failed.")
+            for _, future in pending:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.items += len(batch)
+
+        offset = 0
+        for inputs, future in pending:
+            future.set_result(outputs[offset:offset + len(inputs)])
+            offset += len(inputs)
@@ -0,0 +1,53 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module registers the available Sudoku solving backends and provides a single factory to   #
+# instantiate them by name. Every backend shares the same contract: a 9x9 list board in, and     #
+# solve(), get_board(), steps, time_taken and final_trace out.                                   #
+#                                                                                                #
+# Backends:                                                                                      #
+#   - backtracking → solver/bckt_logic_solver.py (MRV + forward checking)                        #
+#   - dlx          → solver/dlx_solver.py (Algorithm X with Dancing Links)                       #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+from solver.bckt_logic_solver import SudokuSolver
+from solver.dlx_solver import DLXSolver
+from utils.config import SOLVER_BACKEND
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+SOLVER_BACKENDS = {
+    "backtracking": SudokuSolver,
+    "dlx": DLXSolver,
+}
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def create_solver(board, backend: str = None):
+    """
+    Instantiates the solver registered under the given backend name.
+
+    Args:
+        board (list[list[int]]): A 9x9 Sudoku board where empty cells are represented by 0.
+        backend (str): Backend name (see SOLVER_BACKENDS). Defaults to the configured backend.
+
+    Returns:
+        SudokuSolver | DLXSolver: Solver instance ready to call `solve()` on.
+
+    Raises:
+        ValueError: If the backend name is not registered.
+    """
+
+    name = (backend or SOLVER_BACKEND).lower()
+    if name not in SOLVER_BACKENDS:
+        raise ValueError(f"Unknown solver backend '{name}'. Available: {', '.join(SOLVER_BACKENDS)}")
+
+    return SOLVER_BACKENDS[name](board)
@@ -0,0 +1,200 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module provides a batch solving API for large puzzle banks. Boards (9x9 lists or          #
+# 81-character strings) are grouped into chunks and fanned out over a ProcessPoolExecutor.       #
+# Results are yielded lazily, either in input order or as soon as each chunk completes.         #
+#                                                                                                #
+# Only a bounded number of chunks is in flight at any time, so arbitrarily large iterables       #
+# (e.g. a generator reading a multi-GB puzzle file) are consumed with constant memory.           #
+# Solvers run with verbose=False, so no logging happens inside the solving loop.                 #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import os
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from solver.backends import create_solver
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+DEFAULT_CHUNKSIZE = 64  # Boards sent to a worker per task
+PENDING_CHUNKS_PER_WORKER = 4  # In-flight chunks per worker (bounds memory on huge inputs)
+
+EMPTY_CHARS = ".0"
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def parse_board(puzzle) -> list[list[int]]:
+    """
+    Converts a puzzle into a fresh 9x9 list board.
+
+    Args:
+        puzzle (str | list[list[int]]): 81-character string using digits 1–9 for givens and
+            '.' or '0' for empty cells, or a 9x9 nested list (copied, not modified).
+
+    Returns:
+        list[list[int]]: A new 9x9 board with 0 for empty cells.
+
+    Raises:
+        ValueError: If the puzzle is not a valid 81-cell board.
+    """
+
+    if isinstance(puzzle, str):
+        puzzle = puzzle.strip()
+        if len(puzzle) != 81:
+            raise ValueError(f"Expected 81 characters, got {len(puzzle)}")
+
+        cells = []
+        for char in puzzle:
+            if char in EMPTY_CHARS:
+                cells.append(0)
+            elif "1" <= char <= "9":
+                cells.append(ord(char) - 48)
+            else:
+                raise ValueError(f"Invalid character in puzzle: {char!r}")
+        return [cells[r * 9:(r + 1) * 9] for r in range(9)]
+
+    board = [list(row) for row in puzzle]
+    if len(board) != 9 or any(len(row) != 9 for row in board):
+        raise ValueError("Board must be a 9x9 matrix")
+    if any(not isinstance(v, int) or not 0 <= v <= 9 for row in board for v in row):
+        raise ValueError("Board values must be integers between 0 and 9")
+    return board
+
+def board_to_string(board, empty: str = ".") -> str:
+    """
+    Serializes a 9x9 board into the 81-character line format.
+
+    Args:
+        board (list[list[int]]): The 9x9 board.
+        empty (str): Character used for empty cells.
+
+    Returns:
+        str: 81-character string in row-major order.
+    """
+
+    return "".join(str(v) if v else empty for row in board for v in row)
+
+def solve_puzzle(index: int, puzzle, backend: str = None) -> dict:
+    """
+    Solves a single puzzle without logging and returns its solution and metrics.
+
+    Args:
+        index (int): Position of the puzzle in the input stream.
+        puzzle (str | list[list[int]]): Puzzle as an 81-character string or a 9x9 board.
+        backend (str): Solver backend name. Defaults to the configured backend.
+
+    Returns:
+        dict: Result with keys `index`, `solved`, `solution` (same format as the input, or None),
+        `steps`, `duration` and `method`. Invalid puzzles (or an unknown backend) get an `error`
+        message instead.
+    """
+
+    try:
+        board = parse_board(puzzle)
+        solver = create_solver(board, backend)  # Unknown backend → per-puzzle error too
+    except (TypeError, ValueError) as e:
+        return {"index": index, "solved": False, "solution": None, "error": str(e)}
+
+    solved = solver.solve(verbose=False)
+
+    solution = None
+    if solved:
+        solution = board_to_string(solver.get_board()) if isinstance(puzzle, str) else solver.get_board()
+
+    return {
+        "index": index,
+        "solved": solved,
+        "solution": solution,
+        "steps": solver.steps,
+        "duration": solver.time_taken,
+        "method": solver.METHOD,
+    }
+
+def _solve_chunk(chunk, backend):
+    """
+    Worker entry point: solves a list of (index, puzzle) pairs.
+    """
+
+    return [solve_puzzle(index, puzzle, backend) for index, puzzle in chunk]
+
+def _chunks(boards, chunksize):
+    """
+    Lazily groups an iterable of puzzles into lists of (index, puzzle) pairs.
+    """
+
+    indexed = enumerate(boards)
+    while True:
+        chunk = list(islice(indexed, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+def solve_many(boards, workers: int = None, chunksize: int = DEFAULT_CHUNKSIZE,
+               ordered: bool = True, backend: str = None):
+    """
+    Solves many puzzles in parallel and yields one result per puzzle.
+
+    The input iterable is consumed lazily; at most `workers * PENDING_CHUNKS_PER_WORKER` chunks
+    are in flight, so memory stays constant regardless of how many puzzles are streamed.
+
+    Args:
+        boards (Iterable[str | list[list[int]]]): Puzzles as 81-character strings or 9x9 boards.
+        workers (int): Number of worker processes. Defaults to os.cpu_count(). With 1, puzzles
+            are solved in the current process without a pool.
+        chunksize (int): Number of puzzles sent to a worker per task.
+        ordered (bool): If True, results are yielded in input order; otherwise as completed.
+        backend (str): Solver backend name. Defaults to the configured backend.
+
+    Yields:
+        dict: Per-puzzle result as returned by `solve_puzzle`.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, chunksize)
+
+    if workers == 1:
+        for index, puzzle in enumerate(boards):
+            yield solve_puzzle(index, puzzle, backend)
+        return
+
+    max_pending = workers * PENDING_CHUNKS_PER_WORKER
+    chunks = _chunks(boards, chunksize)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque() if ordered else set()
+
+        def submit_next():
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            future = executor.submit(_solve_chunk, chunk, backend)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+            return True
+
+        while len(pending) < max_pending and submit_next():
+            pass
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending.difference_update(done)
+
+            for future in done:
+                yield from future.result()
+                submit_next()
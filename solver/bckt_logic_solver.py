@@ -4,6 +4,17 @@
 # This module defines a AISudokuSolver class that solves 9x9 Sudoku puzzles using backtracking.  #
 # It provides a method to solve the puzzle and a pretty printer to display it in grid format.    #
 # The board is expected to be a 9x9 list of lists with 0 representing empty cells.               #
+#                                                                                                #
+# Constraints are tracked as 9-bit integer masks: bit (n - 1) is set when digit n is present.    #
+# Row, column and box occupancy are kept incrementally, so the candidates of a cell are a single #
+# AND/NOT over three masks and the MRV heuristic is a popcount.                                  #
+#                                                                                                #
+# Domain removals made by forward checking are recorded on a trail (undo log), so backtracking   #
+# restores exactly the candidates it removed instead of copying every domain at each node.       #
+#                                                                                                #
+# Before and during the search, a propagation stage applies logical techniques to a fixpoint:    #
+# naked/hidden singles, pointing pairs/triples, box-line reduction and naked/hidden pairs.       #
+# Most easy to hard puzzles are solved by propagation alone, without any guess.                  #
 ##################################################################################################
 
 ##################################################################################################
@@ -11,28 +22,110 @@
 ##################################################################################################
 
 import time
-import copy
 from utils.logs_config import logger
+from utils.metrics import timed
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+ALL_DIGITS = 0x1FF  # Bits 0..8 set → digits 1..9 available
+
+# Box index of every (row, col) coordinate
+BOX_OF = [[(i // 3) * 3 + j // 3 for j in range(9)] for i in range(9)]
+
+# Rows, columns and boxes as lists of (row, col) coordinates
+ROW_UNITS = [[(i, j) for j in range(9)] for i in range(9)]
+COL_UNITS = [[(i, j) for i in range(9)] for j in range(9)]
+BOX_UNITS = [[(i, j) for i in range(9) for j in range(9) if BOX_OF[i][j] == b] for b in range(9)]
+UNITS = ROW_UNITS + COL_UNITS + BOX_UNITS
+
+# Logical techniques applied by the propagation stage, as reported in `technique_counts`
+TECHNIQUES = ("naked_single", "hidden_single", "pointing", "box_line", "naked_pair", "hidden_pair")
+
+# Cells sharing a row, column or box with each cell (excluding the cell itself)
+PEERS = {
+    (i, j): tuple(
+        (r, c)
+        for r in range(9)
+        for c in range(9)
+        if (r, c) != (i, j) and (r == i or c == j or BOX_OF[r][c] == BOX_OF[i][j])
+    )
+    for i in range(9)
+    for j in range(9)
+}
 
 ##################################################################################################
 #                                        IMPLEMENTATION                                          #
 ##################################################################################################
 
+def digits_from_mask(mask):
+    """
+    Expands a 9-bit candidate mask into the list of digits it contains.
+
+    Args:
+        mask (int): Bitmask where bit (n - 1) represents digit n.
+
+    Returns:
+        list[int]: Digits present in the mask, in ascending order.
+    """
+
+    return [n for n in range(1, 10) if mask & (1 << (n - 1))]
+
+class _Contradiction(Exception):
+    """
+    Raised internally when propagation empties a domain or leaves a digit without a cell.
+    """
+
 class SudokuSolver:
 
-    def __init__(self, board):
+    METHOD = "Backtracking"
+
+    def __init__(self, board, propagate=True):
         """
         Initializes the SudokuSolver with a given 9x9 board.
 
         Args:
             board (list[list[int]]): A 9x9 Sudoku board where empty cells are represented by 0.
+            propagate (bool): If True, applies logical propagation before and during the search.
         """
 
         self.board = board
+        self.propagate = propagate
         self.steps = 0  # Number of recursive steps taken during solving
+        self.guesses = 0  # Number of trial placements made by the search
+        self.technique_counts = dict.fromkeys(TECHNIQUES, 0)  # Applications of each technique
         self.time_taken = 0  # Total solving time in seconds
+        self.rows = [0] * 9  # Occupancy mask per row
+        self.cols = [0] * 9  # Occupancy mask per column
+        self.boxes = [0] * 9  # Occupancy mask per 3x3 box
+        self.consistent = self._initialize_masks()  # False if the givens already conflict
         self.domains = self._initialize_domains()
+        self.trail = []  # Undo log of (cell, bits) domain removals
+        self.assigned = []  # Undo log of (row, col, value) placements
         self.final_trace = []  # Capture solving trace
+        self.solution_count = 0  # Solutions found by the last solve / count_solutions call
+        self._first_solution = None  # (board, steps, guesses, trace length, technique counts)
+        self.verbose = True  # Emit per-step debug logs (set by solve)
+        self.givens = sum(1 for row in board for v in row if v)
+        self.progress_callback = None  # Called with a progress dict every `progress_interval` steps
+        self.progress_interval = 0
+        self._progress_at = -1  # Step count of the next progress report (-1: nobody listening)
+
+    def candidates(self, row, col):
+        """
+        Computes the candidate mask of a cell from its domain and the current occupancy masks.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+
+        Returns:
+            int: 9-bit mask of the digits that can still be placed in the cell.
+        """
+
+        used = self.rows[row] | self.cols[col] | self.boxes[BOX_OF[row][col]]
+        return self.domains.get((row, col), ALL_DIGITS) & ~used
 
     def find_mrv_cell(self):
         """
@@ -46,15 +139,14 @@ class SudokuSolver:
         min_options = 10
         best_cell = None
 
-        for i in range(9):
-            for j in range(9):
-                if self.board[i][j] == 0:
-                    options = [num for num in range(1, 10) if self.is_valid(num, (i, j))]
-                    if len(options) < min_options:
-                        min_options = len(options)
-                        best_cell = (i, j)
-                        if min_options == 1:
-                            return best_cell  # Early exit
+        for (i, j) in self.domains:
+            if self.board[i][j] == 0:
+                options = self.candidates(i, j).bit_count()
+                if options < min_options:
+                    min_options = options
+                    best_cell = (i, j)
+                    if min_options <= 1:
+                        return best_cell  # Early exit
 
         return best_cell
 
@@ -71,112 +163,487 @@ class SudokuSolver:
         """
 
         row, col = pos
+        bit = 1 << (num - 1)
+        used = self.rows[row] | self.cols[col] | self.boxes[BOX_OF[row][col]]
 
-        # Row check
-        if any(self.board[row][i] == num for i in range(9) if i != col):
-            return False
-
-        # Column check
-        if any(self.board[i][col] == num for i in range(9) if i != row):
-            return False
+        # The cell's own value is part of the masks, so ignore it when re-checking a filled cell
+        if self.board[row][col] == num:
+            return self._count_in_units(num, pos) == 0
 
-        # 3x3 subgrid check
-        box_x = col // 3
-        box_y = row // 3
-        for i in range(box_y * 3, box_y * 3 + 3):
-            for j in range(box_x * 3, box_x * 3 + 3):
-                if self.board[i][j] == num and (i, j) != pos:
-                    return False
-
-        return True
+        return not used & bit
 
+    @timed("solve", backend="backtracking")
     def solve(self, verbose=True):
         """
         Attempts to solve the Sudoku board using recursive backtracking with MRV and forward checking.
 
         Args:
-            verbose (bool): If True, logs step count and total solving time.
+            verbose (bool): If True, logs step count and total solving time, plus per-step
+                debug traces. Pass False for batch solving to keep logging out of the loop.
 
         Returns:
             bool: True if the puzzle was successfully solved, False otherwise.
         """
 
+        self.verbose = verbose
+
         start = time.perf_counter()
-        solved = self._backtrack()
+        solved = self.consistent and (not self.propagate or self._propagate()) and self._backtrack()
         end = time.perf_counter()
 
         self.time_taken = round(end - start, 4)
 
         if verbose:
-            logger.info(f"\n🧠 Steps taken: {self.steps}")
+            logger.info(f"\n🧠 Steps taken: {self.steps} ({self.guesses} guesses)")
             logger.info(f"⏱️ Time taken: {self.time_taken:.4f} seconds")
+            if self.propagate:
+                logger.info(f"🔎 Propagation: {self.technique_counts}")
 
         return solved
 
-    def _backtrack(self):
+    @timed("count_solutions", backend="backtracking")
+    def count_solutions(self, limit=2, verbose=True):
+        """
+        Counts the solutions of the board, stopping as soon as `limit` solutions are found.
+
+        The search shares the propagation and undo state of `solve`, so checking uniqueness
+        with limit=2 only costs the extra exploration needed to find (or rule out) a second
+        solution. The first solution found is left on the board.
+
+        Args:
+            limit (int): Maximum number of solutions to look for (at least 1).
+            verbose (bool): If True, logs the count, step count and total solving time.
+
+        Returns:
+            int: Number of solutions found, capped at `limit` (0 if unsolvable).
+        """
+
+        self.verbose = verbose
+        limit = max(1, limit)
+
+        start = time.perf_counter()
+        if self.consistent and (not self.propagate or self._propagate()):
+            self._backtrack(limit)
+        end = time.perf_counter()
+
+        self.time_taken = round(end - start, 4)
+
+        # When the search went past the first solution, put that solution back on the board and
+        # report the work needed to reach it, not the extra search for a second solution
+        if self.solution_count and limit > 1:
+            board, self.steps, self.guesses, trace_length, techniques = self._first_solution
+            for row, values in zip(self.board, board):
+                row[:] = values
+            del self.final_trace[trace_length:]
+            self.technique_counts = techniques
+
+        if verbose:
+            logger.info(f"\n🔢 Solutions found: {self.solution_count} (limit {limit})")
+            logger.info(f"🧠 Steps taken: {self.steps} ({self.guesses} guesses)")
+            logger.info(f"⏱️ Time taken: {self.time_taken:.4f} seconds")
+
+        return self.solution_count
+
+    def _backtrack(self, limit=1):
         """
         Core recursive backtracking solver.
 
+        Args:
+            limit (int): Number of solutions after which the search stops.
+
         Returns:
-            bool: True if a valid solution is found, False if backtracking fails.
+            bool: True once `limit` solutions are found, False if the search space is exhausted.
         """
 
         find = self.find_mrv_cell()
         if not find:
-            return True  # Solved
+            return self._record_solution(limit)
 
         row, col = find
-        options = self.domains.get((row, col), [])
+        options = digits_from_mask(self.candidates(row, col))
 
         for num in options:
-            logger.debug(f"  ➤ Testing {num} at ({row},{col})")
+            if self.verbose:
+                logger.debug(f"  ➤ Testing {num} at ({row},{col})")
 
-            if self.is_valid(num, (row, col)):
-                prev_domains = copy.deepcopy(self.domains)
+            mark = self._mark()
 
-                self.board[row][col] = num
+            self._place(row, col, num)
+            self.guesses += 1
 
-                if self._forward_check(row, col, num):
-                    self.steps += 1
+            if self._forward_check(row, col, num):
+                self.steps += 1
+                if self.verbose:
                     logger.debug(f"✅ Placed {num} at ({row},{col}) [Step {self.steps}]")
+                if self.steps == self._progress_at:
+                    self._report_progress()
 
-                    # Save final trace (only when it is actually placed)
-                    self.final_trace.append({
-                        "row": row,
-                        "col": col,
-                        "value": num,
-                        "step": self.steps
-                    })
+                # Save final trace (only when it is actually placed)
+                self.final_trace.append({
+                    "row": row,
+                    "col": col,
+                    "value": num,
+                    "step": self.steps
+                })
 
-                    if self._backtrack():
-                        return True
+                if (not self.propagate or self._propagate()) and self._backtrack(limit):
+                    return True
 
+                if self.verbose:
                     logger.debug(f"❌ Backtrack on ({row},{col}), removing {num}")
 
-                self.board[row][col] = 0
-                self.domains = prev_domains
+            self._undo(mark)
 
         return False
 
+    def _record_solution(self, limit):
+        """
+        Registers a complete board found by the search.
+
+        Returns:
+            bool: True if the search should stop (the limit is reached).
+        """
+
+        self.solution_count += 1
+        if self.solution_count == 1 and limit > 1:
+            self._first_solution = ([row[:] for row in self.board], self.steps, self.guesses,
+                                    len(self.final_trace), dict(self.technique_counts))
+        return self.solution_count >= limit
+
+    def _place(self, row, col, value):
+        """
+        Writes a value on the board and marks it in the row, column and box masks.
+
+        The placement is recorded on the `assigned` undo log.
+        """
+
+        bit = 1 << (value - 1)
+        self.assigned.append((row, col, value))
+        self.board[row][col] = value
+        self.rows[row] |= bit
+        self.cols[col] |= bit
+        self.boxes[BOX_OF[row][col]] |= bit
+
+    def _unplace(self, row, col, value):
+        """
+        Clears a value from the board and from the row, column and box masks.
+        """
+
+        mask = ~(1 << (value - 1))
+        self.board[row][col] = 0
+        self.rows[row] &= mask
+        self.cols[col] &= mask
+        self.boxes[BOX_OF[row][col]] &= mask
+
+    def _mark(self):
+        """
+        Returns the current lengths of the undo logs, to be passed to `_undo` later.
+        """
+
+        return len(self.trail), len(self.assigned)
+
+    def _undo(self, mark):
+        """
+        Restores every domain removal and placement recorded after `mark`.
+
+        Args:
+            mark (tuple[int, int]): Undo log lengths returned by `_mark`.
+        """
+
+        trail_mark, assigned_mark = mark
+
+        trail = self.trail
+        domains = self.domains
+        while len(trail) > trail_mark:
+            cell, bits = trail.pop()
+            domains[cell] |= bits
+
+        assigned = self.assigned
+        while len(assigned) > assigned_mark:
+            self._unplace(*assigned.pop())
+
+    ##############################################################################################
+    #                                  LOGICAL PROPAGATION                                       #
+    ##############################################################################################
+
+    def _propagate(self):
+        """
+        Applies logical techniques until none of them makes further progress (fixpoint).
+
+        Singles are applied first; the more expensive techniques only run when singles stall,
+        and any progress sends propagation back to singles. Every placement and elimination is
+        recorded on the undo logs, so the caller can roll back with `_undo`.
+
+        Returns:
+            bool: False if a contradiction was found, True otherwise.
+        """
+
+        techniques = (self._apply_locked_candidates, self._apply_naked_pairs, self._apply_hidden_pairs)
+
+        try:
+            while True:
+                if self._apply_singles():
+                    continue
+                if not any(technique() for technique in techniques):
+                    return True
+        except _Contradiction:
+            return False
+
+    def _assign(self, row, col, value, technique):
+        """
+        Places a value deduced by propagation, forward checks it and records it in the trace.
+
+        Raises:
+            _Contradiction: If forward checking empties a related domain.
+        """
+
+        self._place(row, col, value)
+        self.technique_counts[technique] += 1
+
+        self.final_trace.append({
+            "row": row,
+            "col": col,
+            "value": value,
+            "step": self.steps,
+            "technique": technique
+        })
+
+        if not self._forward_check(row, col, value):
+            raise _Contradiction
+
+    def _eliminate(self, cells, bits):
+        """
+        Removes candidate bits from the domains of the empty cells given.
+
+        Returns:
+            bool: True if at least one candidate was removed.
+
+        Raises:
+            _Contradiction: If a domain becomes empty.
+        """
+
+        removed_any = False
+        for (i, j) in cells:
+            if self.board[i][j] == 0:
+                domain = self.domains[(i, j)]
+                removed = domain & bits
+                if removed:
+                    domain ^= removed
+                    self.domains[(i, j)] = domain
+                    self.trail.append(((i, j), removed))
+                    removed_any = True
+                    if not domain:
+                        raise _Contradiction
+        return removed_any
+
+    def _apply_singles(self):
+        """
+        Places naked singles (cells with one candidate) and hidden singles (digits with one
+        possible cell in a row, column or box).
+
+        Returns:
+            bool: True if at least one value was placed.
+        """
+
+        board, domains = self.board, self.domains
+        progress = False
+
+        for (i, j) in domains:
+            if board[i][j] == 0:
+                domain = domains[(i, j)]
+                if not domain:
+                    raise _Contradiction
+                if not domain & (domain - 1):
+                    self._assign(i, j, domain.bit_length(), "naked_single")
+                    progress = True
+
+        for unit in UNITS:
+            once = twice = placed = 0
+            for (i, j) in unit:
+                value = board[i][j]
+                if value:
+                    placed |= 1 << (value - 1)
+                else:
+                    domain = domains[(i, j)]
+                    twice |= once & domain
+                    once |= domain
+
+            if (once | placed) != ALL_DIGITS:
+                raise _Contradiction  # A digit has no cell left in this unit
+
+            hidden = once & ~twice & ~placed
+            while hidden:
+                bit = hidden & -hidden
+                hidden ^= bit
+                for (i, j) in unit:
+                    if board[i][j] == 0 and domains[(i, j)] & bit:
+                        self._assign(i, j, bit.bit_length(), "hidden_single")
+                        progress = True
+                        break
+                else:
+                    raise _Contradiction
+
+        return progress
+
+    def _apply_locked_candidates(self):
+        """
+        Applies pointing pairs/triples (a digit confined to one line inside a box is removed from
+        the rest of that line) and box-line reduction (a digit confined to one box inside a line
+        is removed from the rest of that box).
+
+        Returns:
+            bool: True if at least one candidate was eliminated.
+        """
+
+        board, domains = self.board, self.domains
+        progress = False
+
+        for b, box in enumerate(BOX_UNITS):
+            for n in range(9):
+                bit = 1 << n
+                cells = [(i, j) for (i, j) in box if board[i][j] == 0 and domains[(i, j)] & bit]
+                if len(cells) < 2:
+                    continue
+
+                rows = {i for (i, _) in cells}
+                cols = {j for (_, j) in cells}
+                if len(rows) == 1:
+                    line = [cell for cell in ROW_UNITS[rows.pop()] if BOX_OF[cell[0]][cell[1]] != b]
+                elif len(cols) == 1:
+                    line = [cell for cell in COL_UNITS[cols.pop()] if BOX_OF[cell[0]][cell[1]] != b]
+                else:
+                    continue
+
+                if self._eliminate(line, bit):
+                    self.technique_counts["pointing"] += 1
+                    progress = True
+
+        for unit in ROW_UNITS + COL_UNITS:
+            for n in range(9):
+                bit = 1 << n
+                cells = [(i, j) for (i, j) in unit if board[i][j] == 0 and domains[(i, j)] & bit]
+                if len(cells) < 2:
+                    continue
+
+                boxes = {BOX_OF[i][j] for (i, j) in cells}
+                if len(boxes) == 1:
+                    rest = [cell for cell in BOX_UNITS[boxes.pop()] if cell not in unit]
+                    if self._eliminate(rest, bit):
+                        self.technique_counts["box_line"] += 1
+                        progress = True
+
+        return progress
+
+    def _apply_naked_pairs(self):
+        """
+        Applies naked pairs: two cells of a unit sharing the same two candidates remove those
+        candidates from every other cell of the unit.
+
+        Returns:
+            bool: True if at least one candidate was eliminated.
+        """
+
+        board, domains = self.board, self.domains
+        progress = False
+
+        for unit in UNITS:
+            seen = {}
+            for (i, j) in unit:
+                if board[i][j] == 0:
+                    domain = domains[(i, j)]
+                    if domain.bit_count() == 2:
+                        if domain in seen:
+                            pair = (seen[domain], (i, j))
+                            rest = [cell for cell in unit if cell not in pair]
+                            if self._eliminate(rest, domain):
+                                self.technique_counts["naked_pair"] += 1
+                                progress = True
+                        else:
+                            seen[domain] = (i, j)
+
+        return progress
+
+    def _apply_hidden_pairs(self):
+        """
+        Applies hidden pairs: two digits that can only go in the same two cells of a unit
+        remove every other candidate from those two cells.
+
+        Returns:
+            bool: True if at least one candidate was eliminated.
+        """
+
+        board, domains = self.board, self.domains
+        progress = False
+
+        for unit in UNITS:
+            pairs = {}  # (cell_a, cell_b) → mask of digits confined to these two cells
+            for n in range(9):
+                bit = 1 << n
+                cells = tuple((i, j) for (i, j) in unit if board[i][j] == 0 and domains[(i, j)] & bit)
+                if len(cells) == 2:
+                    pairs[cells] = pairs.get(cells, 0) | bit
+
+            for cells, mask in pairs.items():
+                count = mask.bit_count()
+                if count > 2:
+                    raise _Contradiction  # Three digits for two cells
+                if count == 2 and self._eliminate(cells, ALL_DIGITS & ~mask):
+                    self.technique_counts["hidden_pair"] += 1
+                    progress = True
+
+        return progress
+
+    def _count_in_units(self, num, pos):
+        """
+        Counts how many other cells in the row, column and box of `pos` already hold `num`.
+        """
+
+        return sum(1 for (r, c) in PEERS[pos] if self.board[r][c] == num)
+
+    def _initialize_masks(self):
+        """
+        Builds the row, column and box occupancy masks from the given digits.
+
+        Returns:
+            bool: True if the givens are consistent, False if a digit is repeated in a unit.
+        """
+
+        consistent = True
+        for i in range(9):
+            for j in range(9):
+                num = self.board[i][j]
+                if num:
+                    bit = 1 << (num - 1)
+                    if (self.rows[i] | self.cols[j] | self.boxes[BOX_OF[i][j]]) & bit:
+                        consistent = False
+                    self.rows[i] |= bit
+                    self.cols[j] |= bit
+                    self.boxes[BOX_OF[i][j]] |= bit
+        return consistent
+
     def _initialize_domains(self):
         """
         Initializes the domain of possible values for each empty cell.
 
         Returns:
-            dict: Mapping of cell coordinates to lists of valid numbers.
+            dict: Mapping of cell coordinates to 9-bit candidate masks.
         """
 
         domains = {}
         for i in range(9):
             for j in range(9):
                 if self.board[i][j] == 0:
-                    domains[(i, j)] = [n for n in range(1, 10) if self.is_valid(n, (i, j))]
+                    used = self.rows[i] | self.cols[j] | self.boxes[BOX_OF[i][j]]
+                    domains[(i, j)] = ALL_DIGITS & ~used
         return domains
 
     def _forward_check(self, row, col, value):
         """
         Performs forward checking by updating domains of related cells.
 
+        Every removal is pushed on the trail so the caller can undo it with `_undo`,
+        including the removals made before a conflict is detected.
+
         Args:
             row (int): Row index of the placed value.
             col (int): Column index of the placed value.
@@ -186,19 +653,50 @@ class SudokuSolver:
             bool: True if no domain is emptied (i.e., no conflicts), False otherwise.
         """
 
-        affected = []
-
-        for i in range(9):
-            for j in range(9):
-                if self.board[i][j] == 0 and (i, j) in self.domains and (
-                        i == row or j == col or (i // 3 == row // 3 and j // 3 == col // 3)):
-                    if value in self.domains[(i, j)]:
-                        self.domains[(i, j)].remove(value)
-                        affected.append((i, j))
-                        if not self.domains[(i, j)]:
-                            return False  # No valid values left
+        bit = 1 << (value - 1)
+
+        for (i, j) in PEERS[(row, col)]:
+            if self.board[i][j] == 0:
+                domain = self.domains[(i, j)]
+                if domain & bit:
+                    domain &= ~bit
+                    self.domains[(i, j)] = domain
+                    self.trail.append(((i, j), bit))
+                    if not domain:
+                        return False  # No valid values left
         return True
 
+    def set_progress_callback(self, callback, interval=1000):
+        """
+        Subscribes to periodic progress reports during `solve` / `count_solutions`.
+
+        Without a subscriber the search only pays one integer comparison per step.
+
+        Args:
+            callback (Callable[[dict], None] | None): Receives `steps`, `depth` (cells filled
+                beyond the givens on the current search path), `filled` and `fill_ratio`.
+                None unsubscribes.
+            interval (int): Number of steps between two reports.
+        """
+
+        self.progress_callback = callback
+        self.progress_interval = max(1, interval)
+        self._progress_at = self.steps + self.progress_interval if callback is not None else -1
+
+    def _report_progress(self):
+        """
+        Sends the current search state to the progress callback and schedules the next report.
+        """
+
+        self._progress_at += self.progress_interval
+        filled = sum(1 for row in self.board for v in row if v)
+        self.progress_callback({
+            "steps": self.steps,
+            "depth": filled - self.givens,
+            "filled": filled,
+            "fill_ratio": round(filled / 81, 3),
+        })
+
     def get_board(self):
         """
         Returns the current state of the Sudoku board.
@@ -207,4 +705,4 @@ class SudokuSolver:
             list[list[int]]: The 9x9 board as a nested list.
         """
 
-        return self.board
\ No newline at end of file
+        return self.board
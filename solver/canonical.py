@@ -0,0 +1,225 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module computes a canonical form of a Sudoku board under its symmetry group:              #
+#   - transpose                                                                                  #
+#   - band permutations and row permutations within each band                                    #
+#   - stack permutations and column permutations within each stack                               #
+#   - digit relabeling                                                                           #
+#                                                                                                #
+# Isomorphic puzzles share the same canonical key, so a solution cached for one of them can be   #
+# reused for all of them by mapping it back through the inverse transform.                       #
+#                                                                                                #
+# The canonical board is the lexicographically smallest 81-character string reachable by the     #
+# group, with digits relabeled 1, 2, 3... in order of first appearance. It is found by a         #
+# level-by-level search that keeps only the candidates tied for the smallest prefix. Boards      #
+# with too many ties (e.g. almost empty grids) fall back to a key that only relabels digits;     #
+# this lowers the hit rate for such boards but never affects correctness, because every key is   #
+# a board equivalent to the original through its returned transform.                             #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+from functools import lru_cache
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+MAX_FRONTIER = 8192  # Tied candidates kept per search level before falling back
+
+IDENTITY = tuple(range(9))
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+@lru_cache(maxsize=None)
+def _next_lines(placed: tuple) -> tuple:
+    """
+    Rows (or columns) that may take the next canonical position, given those already placed.
+    A new band (or stack) can only be opened once the current one is complete.
+    """
+
+    if len(placed) % 3:
+        band = placed[-1] // 3
+        return tuple(line for line in range(band * 3, band * 3 + 3) if line not in placed)
+
+    used = {line // 3 for line in placed}
+    return tuple(line for line in range(9) if line // 3 not in used)
+
+def _relabel(values, dmap, nxt):
+    """
+    Relabels digits in order of first appearance, extending a partial digit map.
+
+    Args:
+        values (Iterable[int]): Original digits (0 for empty cells).
+        dmap (tuple[int]): Current map from original digit (index) to label (0 = unmapped).
+        nxt (int): Next free label.
+
+    Returns:
+        tuple: Relabeled values, extended map and next free label.
+    """
+
+    dmap = list(dmap)
+    out = []
+    for v in values:
+        if v and not dmap[v]:
+            dmap[v] = nxt
+            nxt += 1
+        out.append(dmap[v])
+    return tuple(out), tuple(dmap), nxt
+
+def _keep_minimal(candidates):
+    """
+    Keeps the candidates with the smallest value, as (value, states) for the next level.
+    """
+
+    best = min(value for value, _ in candidates)
+    return best, [state for value, state in candidates if value == best]
+
+def _best_pattern(row) -> tuple:
+    """
+    Smallest filled/empty pattern a row can take under stack and column permutations
+    (empty cells first within each stack, then stacks in ascending order). With distinct
+    digits in the row, this pattern fixes the relabeled row, which prunes first-row choices.
+    """
+
+    stacks = []
+    for s in range(3):
+        filled = sum(1 for v in row[s * 3:s * 3 + 3] if v)
+        stacks.append((0,) * (3 - filled) + (1,) * filled)
+    return tuple(sorted(stacks))
+
+def _fallback(board):
+    """
+    Non-canonical key for boards whose search is too ambiguous: digits are relabeled,
+    cells are left in place.
+    """
+
+    flat = [v for row in board for v in row]
+    values, dmap, _ = _relabel(flat, (0,) * 10, 1)
+    return values, (False, IDENTITY, IDENTITY, dmap)
+
+def _search(board):
+    """
+    Finds the lexicographically smallest equivalent board.
+
+    Returns:
+        tuple | None: (values, transform) or None if the search exceeds MAX_FRONTIER.
+    """
+
+    grids = (board, [list(col) for col in zip(*board)])
+
+    # Level 0: choose the grid orientation, the first row and, cell by cell, the column order
+    first_rows = [(_best_pattern(grids[t][r]), t, r) for t in (False, True) for r in range(9)]
+    best = min(pattern for pattern, _, _ in first_rows)
+    states = [(t, (r,), (), (0,) * 10, 1) for pattern, t, r in first_rows if pattern == best]
+    prefix = []
+
+    for _ in range(9):
+        candidates = []
+        for t, rows, cols, dmap, nxt in states:
+            row = grids[t][rows[0]]
+            for c in _next_lines(cols):
+                v = row[c]
+                if v and not dmap[v]:
+                    # First occurrence of this digit: it takes the next free label
+                    new_map = dmap[:v] + (nxt,) + dmap[v + 1:]
+                    candidates.append((nxt, (t, rows, cols + (c,), new_map, nxt + 1)))
+                else:
+                    candidates.append((dmap[v], (t, rows, cols + (c,), dmap, nxt)))
+        value, states = _keep_minimal(candidates)
+        prefix.append(value)
+        if len(states) > MAX_FRONTIER:
+            return None
+
+    # Levels 1–8: choose the remaining rows, one whole row at a time
+    for _ in range(1, 9):
+        candidates = []
+        for t, rows, cols, dmap, nxt in states:
+            grid = grids[t]
+            for r in _next_lines(rows):
+                row = grid[r]
+                values, new_map, new_nxt = _relabel((row[c] for c in cols), dmap, nxt)
+                candidates.append((values, (t, rows + (r,), cols, new_map, new_nxt)))
+        values, states = _keep_minimal(candidates)
+        prefix.extend(values)
+        if len(states) > MAX_FRONTIER:
+            return None
+
+    t, rows, cols, dmap, _ = states[0]
+    return tuple(prefix), (t, rows, cols, dmap)
+
+def _complete_map(dmap):
+    """
+    Extends a partial digit map to a bijection on 1–9 (digits absent from the puzzle
+    take the remaining labels in increasing order).
+    """
+
+    dmap = list(dmap)
+    free = iter(sorted(set(range(1, 10)) - set(dmap)))
+    for d in range(1, 10):
+        if not dmap[d]:
+            dmap[d] = next(free)
+    return tuple(dmap)
+
+def canonicalize(board) -> tuple[str, tuple]:
+    """
+    Computes the canonical key of a board and the transform that produces it.
+
+    Args:
+        board (list[list[int]]): 9x9 board with 0 for empty cells.
+
+    Returns:
+        tuple[str, tuple]: 81-character canonical key ('.' for empty cells) and the transform
+        (transposed, row order, column order, digit map) to pass to `from_canonical`.
+    """
+
+    result = _search(board) or _fallback(board)
+    values, (t, rows, cols, dmap) = result
+    key = "".join(str(v) if v else "." for v in values)
+    return key, (t, rows, cols, _complete_map(dmap))
+
+def to_canonical(board, transform) -> list[list[int]]:
+    """
+    Applies a transform to a board (original frame → canonical frame).
+
+    Args:
+        board (list[list[int]]): 9x9 board in the original frame.
+        transform (tuple): Transform returned by `canonicalize`.
+
+    Returns:
+        list[list[int]]: Board in the canonical frame.
+    """
+
+    t, rows, cols, dmap = transform
+    grid = [list(col) for col in zip(*board)] if t else board
+    return [[dmap[grid[r][c]] for c in cols] for r in rows]
+
+def from_canonical(board, transform) -> list[list[int]]:
+    """
+    Maps a board back from the canonical frame to the original one, e.g. a cached solution
+    of the canonical puzzle into the solution of the submitted puzzle.
+
+    Args:
+        board (list[list[int]]): 9x9 board in the canonical frame.
+        transform (tuple): Transform returned by `canonicalize` for the original board.
+
+    Returns:
+        list[list[int]]: Board in the original frame.
+    """
+
+    t, rows, cols, dmap = transform
+    inverse = [0] * 10
+    for digit, label in enumerate(dmap):
+        inverse[label] = digit
+
+    grid = [[0] * 9 for _ in range(9)]
+    for i, r in enumerate(rows):
+        for j, c in enumerate(cols):
+            grid[r][c] = inverse[board[i][j]]
+
+    return [list(col) for col in zip(*grid)] if t else grid
@@ -0,0 +1,374 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module defines a DLXSolver class that solves 9x9 Sudoku puzzles as an exact cover        #
+# problem using Knuth's Algorithm X with Dancing Links (DLX).                                    #
+#                                                                                                #
+# The puzzle is encoded as 729 candidate rows (row, col, digit) over 324 constraint columns:     #
+#   - 81 cell constraints (each cell holds exactly one digit)                                    #
+#   - 81 row/digit, 81 column/digit and 81 box/digit constraints                                 #
+# Givens are selected up front, then the search always branches on the column with the fewest    #
+# remaining rows, which keeps the worst case predictable on adversarial puzzles.                 #
+#                                                                                                #
+# The class mirrors the SudokuSolver contract: solve(), get_board(), steps, time_taken and       #
+# final_trace, so both backends can be used interchangeably.                                     #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import time
+from utils.logs_config import logger
+from utils.metrics import timed
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+NUM_COLUMNS = 324  # 4 constraint families x 81
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def _constraint_columns(row, col, digit):
+    """
+    Returns the four constraint column indices (1-based, 0 is the root) covered by a candidate.
+
+    Args:
+        row (int): Row index (0–8).
+        col (int): Column index (0–8).
+        digit (int): Digit (1–9).
+
+    Returns:
+        tuple[int, int, int, int]: Cell, row/digit, column/digit and box/digit column indices.
+    """
+
+    d = digit - 1
+    box = (row // 3) * 3 + col // 3
+    return (
+        1 + row * 9 + col,
+        1 + 81 + row * 9 + d,
+        1 + 162 + col * 9 + d,
+        1 + 243 + box * 9 + d,
+    )
+
+class DLXSolver:
+
+    METHOD = "Dancing Links"
+
+    def __init__(self, board):
+        """
+        Initializes the DLXSolver with a given 9x9 board and builds the exact cover matrix.
+
+        Args:
+            board (list[list[int]]): A 9x9 Sudoku board where empty cells are represented by 0.
+        """
+
+        self.board = board
+        self.steps = 0  # Number of candidate rows selected during the search
+        self.time_taken = 0  # Total solving time in seconds
+        self.final_trace = []  # Capture solving trace
+        self.solution_count = 0  # Solutions found by the last solve / count_solutions call
+        self._first_solution = None  # (board, steps, trace length) when the first cover was found
+        self.verbose = True  # Emit per-step debug logs (set by solve)
+        self.givens = sum(1 for row in board for v in row if v)
+        self.progress_callback = None  # Called with a progress dict every `progress_interval` steps
+        self.progress_interval = 0
+        self._progress_at = -1  # Step count of the next progress report (-1: nobody listening)
+        self._build_matrix()
+        self.consistent = self._select_givens()  # False if the givens already conflict
+
+    @timed("solve", backend="dlx")
+    def solve(self, verbose=True):
+        """
+        Attempts to solve the Sudoku board using Algorithm X over the dancing links matrix.
+
+        Args:
+            verbose (bool): If True, logs step count and total solving time, plus per-step
+                debug traces. Pass False for batch solving to keep logging out of the loop.
+
+        Returns:
+            bool: True if the puzzle was successfully solved, False otherwise.
+        """
+
+        self.verbose = verbose
+
+        start = time.perf_counter()
+        solved = self.consistent and self._search()
+        end = time.perf_counter()
+
+        self.time_taken = round(end - start, 4)
+
+        if verbose:
+            logger.info(f"\n🧠 Steps taken: {self.steps}")
+            logger.info(f"⏱️ Time taken: {self.time_taken:.4f} seconds")
+
+        return solved
+
+    @timed("count_solutions", backend="dlx")
+    def count_solutions(self, limit=2, verbose=True):
+        """
+        Counts the exact covers of the board, stopping as soon as `limit` solutions are found.
+
+        The first solution found is left on the board.
+
+        Args:
+            limit (int): Maximum number of solutions to look for (at least 1).
+            verbose (bool): If True, logs the count, step count and total solving time.
+
+        Returns:
+            int: Number of solutions found, capped at `limit` (0 if unsolvable).
+        """
+
+        self.verbose = verbose
+        limit = max(1, limit)
+
+        start = time.perf_counter()
+        if self.consistent:
+            self._search(limit)
+        end = time.perf_counter()
+
+        self.time_taken = round(end - start, 4)
+
+        # When the search went past the first solution, put that solution back on the board and
+        # report the work needed to reach it, not the extra search for a second solution
+        if self.solution_count and limit > 1:
+            board, self.steps, trace_length = self._first_solution
+            for row, values in zip(self.board, board):
+                row[:] = values
+            del self.final_trace[trace_length:]
+
+        if verbose:
+            logger.info(f"\n🔢 Solutions found: {self.solution_count} (limit {limit})")
+            logger.info(f"🧠 Steps taken: {self.steps}")
+            logger.info(f"⏱️ Time taken: {self.time_taken:.4f} seconds")
+
+        return self.solution_count
+
+    def set_progress_callback(self, callback, interval=1000):
+        """
+        Subscribes to periodic progress reports during `solve` / `count_solutions`.
+
+        Without a subscriber the search only pays one integer comparison per step.
+
+        Args:
+            callback (Callable[[dict], None] | None): Receives `steps`, `depth` (cells filled
+                beyond the givens on the current search path), `filled` and `fill_ratio`.
+                None unsubscribes.
+            interval (int): Number of steps between two reports.
+        """
+
+        self.progress_callback = callback
+        self.progress_interval = max(1, interval)
+        self._progress_at = self.steps + self.progress_interval if callback is not None else -1
+
+    def _report_progress(self):
+        """
+        Sends the current search state to the progress callback and schedules the next report.
+        """
+
+        self._progress_at += self.progress_interval
+        filled = sum(1 for row in self.board for v in row if v)
+        self.progress_callback({
+            "steps": self.steps,
+            "depth": filled - self.givens,
+            "filled": filled,
+            "fill_ratio": round(filled / 81, 3),
+        })
+
+    def get_board(self):
+        """
+        Returns the current state of the Sudoku board.
+
+        Returns:
+            list[list[int]]: The 9x9 board as a nested list.
+        """
+
+        return self.board
+
+    def _build_matrix(self):
+        """
+        Builds the toroidal doubly linked list structure for the 729 x 324 exact cover matrix.
+
+        Nodes are stored in parallel lists (left, right, up, down, column, candidate) indexed by
+        node id. Node 0 is the root header and nodes 1..324 are the column headers.
+        """
+
+        n = NUM_COLUMNS + 1
+        self.L = [i - 1 for i in range(n)]
+        self.R = [i + 1 for i in range(n)]
+        self.L[0] = NUM_COLUMNS
+        self.R[NUM_COLUMNS] = 0
+        self.U = list(range(n))
+        self.D = list(range(n))
+        self.C = list(range(n))
+        self.S = [0] * n  # Number of rows remaining in each column
+        self.candidate = [None] * n  # (row, col, digit) owning each node
+        self.row_head = {}  # (row, col, digit) → first node of its matrix row
+
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+
+        for r in range(9):
+            for c in range(9):
+                for digit in range(1, 10):
+                    first = None
+                    for column in _constraint_columns(r, c, digit):
+                        node = len(C)
+                        C.append(column)
+                        self.candidate.append((r, c, digit))
+
+                        # Vertical link at the bottom of the column
+                        U.append(U[column])
+                        D.append(column)
+                        D[U[column]] = node
+                        U[column] = node
+                        S[column] += 1
+
+                        # Horizontal link inside the candidate row
+                        if first is None:
+                            first = node
+                            L.append(node)
+                            R.append(node)
+                        else:
+                            L.append(L[first])
+                            R.append(first)
+                            R[L[first]] = node
+                            L[first] = node
+
+                    self.row_head[(r, c, digit)] = first
+
+    def _cover(self, column):
+        """
+        Removes a column header and every row that intersects it from the matrix.
+        """
+
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+
+        R[L[column]] = R[column]
+        L[R[column]] = L[column]
+
+        i = D[column]
+        while i != column:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _uncover(self, column):
+        """
+        Restores a column previously removed with `_cover`, in exact reverse order.
+        """
+
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+
+        i = U[column]
+        while i != column:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+
+        R[L[column]] = column
+        L[R[column]] = column
+
+    def _select_givens(self):
+        """
+        Selects the candidate rows of all given digits before the search starts.
+
+        Returns:
+            bool: True if the givens are consistent, False if two givens share a constraint.
+        """
+
+        covered = set()
+        for r in range(9):
+            for c in range(9):
+                digit = self.board[r][c]
+                if digit:
+                    columns = _constraint_columns(r, c, digit)
+                    if covered.intersection(columns):
+                        return False
+                    covered.update(columns)
+                    for column in columns:
+                        self._cover(column)
+        return True
+
+    def _search(self, limit=1):
+        """
+        Core recursive Algorithm X search.
+
+        Args:
+            limit (int): Number of solutions after which the search stops.
+
+        Returns:
+            bool: True once `limit` exact covers are found, False if the search space is exhausted.
+        """
+
+        R, D, S, C = self.R, self.D, self.S, self.C
+
+        if R[0] == 0:
+            # Every constraint is satisfied
+            self.solution_count += 1
+            if self.solution_count == 1 and limit > 1:
+                self._first_solution = ([row[:] for row in self.board], self.steps, len(self.final_trace))
+            return self.solution_count >= limit
+
+        # Choose the column with the fewest remaining rows (S heuristic)
+        column = R[0]
+        best_size = S[column]
+        j = R[column]
+        while j != 0 and best_size > 1:
+            if S[j] < best_size:
+                column, best_size = j, S[j]
+            j = R[j]
+
+        if best_size == 0:
+            return False  # Dead end: a constraint can no longer be satisfied
+
+        self._cover(column)
+
+        i = D[column]
+        while i != column:
+            r, c, digit = self.candidate[i]
+            self.board[r][c] = digit
+            self.steps += 1
+            if self.verbose:
+                logger.debug(f"✅ Selected {digit} at ({r},{c}) [Step {self.steps}]")
+            if self.steps == self._progress_at:
+                self._report_progress()
+
+            self.final_trace.append({
+                "row": r,
+                "col": c,
+                "value": digit,
+                "step": self.steps
+            })
+
+            j = R[i]
+            while j != i:
+                self._cover(C[j])
+                j = R[j]
+
+            if self._search(limit):
+                return True
+
+            if self.verbose:
+                logger.debug(f"❌ Backtrack on ({r},{c}), removing {digit}")
+
+            j = self.L[i]
+            while j != i:
+                self._uncover(C[j])
+                j = self.L[j]
+
+            self.board[r][c] = 0
+            i = D[i]
+
+        self._uncover(column)
+        return False
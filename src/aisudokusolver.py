@@ -20,6 +20,9 @@
 #                                            IMPORTS                                             #
 ##################################################################################################
 
+import time
+IMPORT_START = time.perf_counter()  # Reference point for the cold-start report
+
 import sys
 import os
 import io
@@ -28,7 +31,7 @@ import json
 import logging
 
 from vision.image_parser import extract_board_from_image            # Extracts 9x9 board from image
-from solver.bckt_logic_solver import SudokuSolver                   # Sudoku solver - Backtracking logic
+from solver.backends import create_solver                           # Sudoku solver - selectable backend
 
 from utils.logs_config import logger                                # Logs and events
 from utils.reporter import save_solution_report                     # save report as markdown
@@ -43,6 +46,8 @@ from utils.config import OUTPUT_DIR
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), ".")))
 
+IMPORTS_TIME = time.perf_counter() - IMPORT_START
+
 ##################################################################################################
 #                                        IMPLEMENTATION                                          #
 ##################################################################################################
@@ -65,15 +70,18 @@ class DualOutput:
         for out in self.outputs:
             out.flush()
 
-def main():
+def main(backend: str = None):
     """
     Executes the complete Sudoku solving pipeline from image to solution.
 
     Steps:
     - Prompts the user to select an input image.
     - Extracts and reconstructs the Sudoku board using computer vision and OCR.
-    - Solves the board using a backtracking algorithm.
+    - Solves the board using the selected backend (backtracking by default).
     - Saves a Markdown report and final trace file.
+
+    Args:
+        backend (str): Solver backend name ("backtracking" or "dlx"). Defaults to SOLVER_BACKEND.
     """
 
     IMAGE_PATH = prompt_user_for_image()
@@ -91,7 +99,10 @@ def main():
     logger.addHandler(capture_handler)
 
     logger.info(f"📸 Loading Sudoku from: {IMAGE_PATH}")
+    parse_start = time.perf_counter()
     parsed_board = extract_board_from_image(IMAGE_PATH)
+    logger.info(f"🚀 Board parsed in {time.perf_counter() - parse_start:.2f}s "
+                f"(imports took {IMPORTS_TIME:.2f}s; includes lazy CNN model loading)")
 
     if not isinstance(parsed_board, list) or len(parsed_board) != 9:
         logger.error("❌ Failed to extract board from image.")
@@ -106,8 +117,8 @@ def main():
     #                              SOLVE WITH LOGIC (BACKTRACKING)                                   #
     ##################################################################################################
 
-    logic_solver = SudokuSolver(logic_board)
-    logger.info("\n🧠 Solving with logic-based solver...\n")
+    logic_solver = create_solver(logic_board, backend)
+    logger.info(f"\n🧠 Solving with logic-based solver ({logic_solver.METHOD})...\n")
     #print_board(logic_solver.board)
     #print("\n")
 
@@ -150,12 +161,13 @@ def main():
             input_board=parsed_board,
             solved_board=logic_solver.board,
             bckt_metrics={
-                "method": "Backtracking",
+                "method": logic_solver.METHOD,
                 "solved": logic_success,
                 "steps": logic_solver.steps,
                 "duration": logic_solver.time_taken
             },
-            image_path=IMAGE_PATH
+            image_path=IMAGE_PATH,
+            wait_for_summary=True  # The CLI exits right after, so deliver a complete report
         )
 
     else:
@@ -0,0 +1,160 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# Headless command line entry point for pages holding several Sudoku grids (scanned newspaper    #
+# or puzzle book pages).                                                                         #
+#                                                                                                #
+# Every grid of each page is detected and read (one CNN forward pass per page), and the boards   #
+# of all pages are solved in parallel on a process pool while the next pages are being read.     #
+# One JSON line is written per page, in input order:                                             #
+#   {"image": ..., "boards": [{"index", "corners", "parsed_board", "solved", "solved_board",     #
+#                              "steps", "duration", "method"}, ...]}                             #
+# `corners` are the top-left, top-right, bottom-right and bottom-left [x, y] page pixels of the  #
+# grid. Pages that cannot be read are written as {"image": ..., "error": ...}.                   #
+#                                                                                                #
+# Usage:                                                                                         #
+#   python -m src.solve_pages page_01.jpg page_02.jpg --workers 8 > boards.jsonl                 #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import time
+IMPORT_START = time.perf_counter()  # Reference point for the cold-start report
+
+import sys
+import json
+import argparse
+from collections import deque
+
+from vision.board_segmenter import load_image
+from vision.image_parser import extract_boards_from_page
+from solver.batch_solver import solve_many
+from solver.backends import SOLVER_BACKENDS
+from utils.logs_config import logger, handler
+from utils.config import SOLVER_BACKEND
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def read_pages(paths):
+    """
+    Lazily reads the boards of each page image.
+
+    Args:
+        paths (Iterable[str]): Page image paths.
+
+    Yields:
+        tuple[str, list[dict] | Exception]: The path and its boards (see
+        `extract_boards_from_page`), or the exception that prevented reading the page.
+    """
+
+    for path in paths:
+        try:
+            yield path, extract_boards_from_page(load_image(path))
+        except Exception as e:
+            yield path, e
+
+def solve_pages(paths, output_stream, workers: int = None, backend: str = None) -> dict:
+    """
+    Solves every grid of every page and writes one JSON line per page, in input order.
+
+    Boards are streamed to `solve_many` as pages are read, so reading the next pages overlaps
+    with solving; a page is written as soon as all of its boards are solved.
+
+    Args:
+        paths (Iterable[str]): Page image paths.
+        output_stream (TextIO): Destination for result lines.
+        workers (int): Number of worker processes (see `solve_many`).
+        backend (str): Solver backend name.
+
+    Returns:
+        dict: Totals with keys `pages`, `boards`, `solved`, `errors` and `elapsed` (seconds).
+    """
+
+    totals = {"pages": 0, "boards": 0, "solved": 0, "errors": 0}
+    start = time.perf_counter()
+
+    pages = deque()  # Pages read but not written yet: [line, boards still being solved]
+    pending = deque()  # (page, board entry) per board sent to the solver, in order
+
+    def boards():
+        for path, entries in read_pages(paths):
+            if isinstance(entries, Exception):
+                logger.warning(f"⚠️ Could not read page {path}: {entries}")
+                pages.append([{"image": path, "error": str(entries)}, 0])
+                continue
+
+            page = [{"image": path, "boards": []}, len(entries)]
+            pages.append(page)
+            for index, entry in enumerate(entries):
+                board = {"index": index, **entry}
+                page[0]["boards"].append(board)
+                pending.append((page, board))
+                yield entry["parsed_board"]
+
+    def write_completed():
+        while pages and pages[0][1] == 0:
+            line = pages.popleft()[0]
+            output_stream.write(json.dumps(line) + "\n")
+            totals["pages"] += 1
+            totals["errors"] += "error" in line
+
+    for result in solve_many(boards(), workers=workers, chunksize=1, backend=backend):
+        page, board = pending.popleft()
+        board.update({
+            "solved": result["solved"],
+            "solved_board": result["solution"],
+            "steps": result.get("steps"),
+            "duration": result.get("duration"),
+            "method": result.get("method"),
+        })
+        page[1] -= 1
+        totals["boards"] += 1
+        totals["solved"] += result["solved"]
+        write_completed()
+
+    write_completed()  # Trailing pages without any grid
+    output_stream.flush()
+    totals["elapsed"] = round(time.perf_counter() - start, 4)
+    return totals
+
+def main(argv=None):
+    """
+    Parses command line arguments and solves the given pages.
+
+    Args:
+        argv (list[str]): Command line arguments (defaults to sys.argv[1:]).
+    """
+
+    parser = argparse.ArgumentParser(description="Solve every Sudoku grid of scanned page images.")
+    parser.add_argument("images", nargs="+", help="Page images (JPG/PNG)")
+    parser.add_argument("-o", "--output", default="-", help="Output file, or '-' for stdout (default)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--backend", default=SOLVER_BACKEND, choices=sorted(SOLVER_BACKENDS),
+                        help="Solver backend")
+    args = parser.parse_args(argv)
+
+    # Keep stdout reserved for results
+    handler.setStream(sys.stderr)
+    logger.info(f"🚀 Cold start: {time.perf_counter() - IMPORT_START:.3f}s")
+
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        totals = solve_pages(args.images, output_stream, workers=args.workers, backend=args.backend)
+    finally:
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+    rate = totals["pages"] / totals["elapsed"] if totals["elapsed"] else 0.0
+    logger.info(f"✅ Solved {totals['solved']}/{totals['boards']} boards on {totals['pages']} pages "
+                f"({totals['errors']} unreadable) in {totals['elapsed']:.2f}s — {rate:.1f} pages/s")
+
+##################################################################################################
+#                                               MAIN                                             #
+##################################################################################################
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# Headless command line entry point for solving puzzle files without images.                     #
+#                                                                                                #
+# Reads newline-delimited 81-character puzzles ('.' or '0' for empty cells) from a file or       #
+# stdin and streams one output line per puzzle, in input order:                                  #
+#   <solution>[\t<steps>\t<seconds>]                                                             #
+# Unsolvable puzzles are written as `unsolved` and malformed lines as `invalid`, so output       #
+# lines always align with input puzzles. Blank lines and lines starting with '#' are skipped.    #
+#                                                                                                #
+# The pipeline is fully lazy (file → generator → solve_many → writer), so memory stays constant  #
+# regardless of the input size. Logs go to stderr to keep stdout clean for the results.          #
+#                                                                                                #
+# Usage:                                                                                         #
+#   python -m src.solve_puzzles puzzles.txt --stats --workers 8 > solutions.txt                  #
+#   cat puzzles.txt | python -m src.solve_puzzles - -o solutions.txt                             #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import time
+IMPORT_START = time.perf_counter()  # Reference point for the cold-start report
+
+import sys
+import argparse
+
+from solver.batch_solver import solve_many, DEFAULT_CHUNKSIZE
+from solver.backends import SOLVER_BACKENDS
+from utils.logs_config import logger, handler
+from utils.config import SOLVER_BACKEND
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def read_puzzles(stream):
+    """
+    Lazily yields puzzle lines from a text stream, skipping blank lines and comments.
+
+    Args:
+        stream (TextIO): Open text stream with one 81-character puzzle per line.
+
+    Yields:
+        str: Stripped puzzle line.
+    """
+
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+def format_result(result: dict, stats: bool = False) -> str:
+    """
+    Formats a batch solving result as a single output line.
+
+    Args:
+        result (dict): Result returned by `solve_many`.
+        stats (bool): If True, appends tab-separated step count and solving time.
+
+    Returns:
+        str: Output line without the trailing newline.
+    """
+
+    if "error" in result:
+        return "invalid"
+
+    line = result["solution"] if result["solved"] else "unsolved"
+    if stats:
+        line += f"\t{result['steps']}\t{result['duration']:.4f}"
+    return line
+
+def solve_stream(input_stream, output_stream, workers: int = None, chunksize: int = DEFAULT_CHUNKSIZE,
+                 backend: str = None, stats: bool = False) -> dict:
+    """
+    Solves every puzzle read from `input_stream` and writes one result line per puzzle.
+
+    Args:
+        input_stream (TextIO): Source of newline-delimited puzzles.
+        output_stream (TextIO): Destination for result lines.
+        workers (int): Number of worker processes (see `solve_many`).
+        chunksize (int): Puzzles sent to a worker per task.
+        backend (str): Solver backend name.
+        stats (bool): If True, writes step and time columns.
+
+    Returns:
+        dict: Totals with keys `puzzles`, `solved`, `invalid` and `elapsed` (seconds).
+    """
+
+    totals = {"puzzles": 0, "solved": 0, "invalid": 0}
+    start = time.perf_counter()
+
+    for result in solve_many(read_puzzles(input_stream), workers=workers, chunksize=chunksize, backend=backend):
+        output_stream.write(format_result(result, stats) + "\n")
+        totals["puzzles"] += 1
+        totals["solved"] += result["solved"]
+        totals["invalid"] += "error" in result
+        if "error" in result:
+            logger.warning(f"⚠️ Puzzle #{result['index'] + 1} is invalid: {result['error']}")
+
+    output_stream.flush()
+    totals["elapsed"] = round(time.perf_counter() - start, 4)
+    return totals
+
+def main(argv=None):
+    """
+    Parses command line arguments and runs the streaming solver.
+
+    Args:
+        argv (list[str]): Command line arguments (defaults to sys.argv[1:]).
+    """
+
+    parser = argparse.ArgumentParser(description="Solve newline-delimited 81-character Sudoku puzzles.")
+    parser.add_argument("input", nargs="?", default="-", help="Puzzle file, or '-' for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="Output file, or '-' for stdout (default)")
+    parser.add_argument("--stats", action="store_true", help="Append step count and solving time columns")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Puzzles per worker task")
+    parser.add_argument("--backend", default=SOLVER_BACKEND, choices=sorted(SOLVER_BACKENDS),
+                        help="Solver backend")
+    args = parser.parse_args(argv)
+
+    # Keep stdout reserved for solutions
+    handler.setStream(sys.stderr)
+    logger.info(f"🚀 Cold start: {time.perf_counter() - IMPORT_START:.3f}s (TensorFlow not loaded)")
+
+    input_stream = sys.stdin if args.input == "-" else open(args.input, "r")
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w")
+
+    try:
+        totals = solve_stream(input_stream, output_stream, workers=args.workers, chunksize=args.chunksize,
+                              backend=args.backend, stats=args.stats)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+    rate = totals["puzzles"] / totals["elapsed"] if totals["elapsed"] else 0.0
+    logger.info(f"✅ Solved {totals['solved']}/{totals['puzzles']} puzzles "
+                f"({totals['invalid']} invalid) in {totals['elapsed']:.2f}s — {rate:.1f} puzzles/s")
+
+##################################################################################################
+#                                               MAIN                                             #
+##################################################################################################
+
+if __name__ == "__main__":
+    main()
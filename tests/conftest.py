@@ -0,0 +1,47 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Shared pytest fixtures. `stub_client` builds local stand-ins for the OpenAI client, used by    #
+# the summarizer and reporter tests instead of the network.                                      #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import pytest
+from types import SimpleNamespace
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+class StubClient:
+    """
+    Local stand-in for the OpenAI client. Returns `text` (or raises `error`), optionally
+    waiting for `release`, and counts calls.
+    """
+
+    def __init__(self, text="", error=None, release=None):
+        self.text = text
+        self.error = error
+        self.release = release
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        message = SimpleNamespace(content=self.text)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+@pytest.fixture
+def stub_client():
+    """
+    Factory for stub OpenAI clients: `stub_client(text, error=..., release=...)`.
+    """
+
+    return StubClient
@@ -1,10 +1,20 @@
 import json
 import tempfile
-from unittest.mock import patch
-from utils.ai_summarizer import generate_summary_from_trace
+import threading
+import pytest
+from utils import ai_summarizer
+from utils.ai_summarizer import generate_summary_from_trace, generate_summary_async, set_client
 
 
-def test_generate_summary_from_trace_success():
+@pytest.fixture(autouse=True)
+def isolated_summarizer(tmp_path, monkeypatch):
+    # Fresh summary cache per test, and no real OpenAI client left behind
+    monkeypatch.setattr(ai_summarizer, "CACHE_DIR", str(tmp_path / "summary_cache"))
+    yield
+    set_client(None)
+
+
+def test_generate_summary_from_trace_success(stub_client):
     # Simulate minimal trace
     dummy_trace = {
         "0_0": {"value": 5, "step": 1, "action": "place"},
@@ -20,15 +30,12 @@ def test_generate_summary_from_trace_success():
     # Mock OpenAI's response
     fake_response = "The puzzle was solved using constraint-based reasoning in under 3 seconds."
 
-    with patch("utils.ai_summarizer.client.chat.completions.create") as mock_openai:
-        mock_openai.return_value.choices = [
-            type("Choice", (object,), {"message": type("Msg", (object,), {"content": fake_response})()})
-        ]
+    set_client(stub_client(fake_response))
 
-        summary = generate_summary_from_trace(tmp_path, steps=42, duration=2.89)
+    summary = generate_summary_from_trace(tmp_path, steps=42, duration=2.89)
 
-        assert fake_response in summary
-        assert "constraint-based" in summary.lower()
+    assert fake_response in summary
+    assert "constraint-based" in summary.lower()
 
 def test_generate_summary_trace_file_not_found():
     # Provide a path to a non-existent trace file
@@ -38,15 +45,40 @@ def test_generate_summary_trace_file_not_found():
     assert "Failed to read trace file" in summary
 
 
-def test_generate_summary_llm_failure(tmp_path):
+def test_generate_summary_llm_failure(tmp_path, stub_client):
     # Create a valid trace file
     trace_path = tmp_path / "trace.json"
     trace_path.write_text(json.dumps({
         "0_0": {"value": 1, "step": 1, "action": "place"}
     }))
 
-    # Patch the LLM call to simulate an exception
-    with patch("utils.ai_summarizer.client.chat.completions.create", side_effect=Exception("Simulated failure")):
-        summary = generate_summary_from_trace(str(trace_path), steps=5, duration=0.5)
+    # Plug in a client that simulates an exception
+    set_client(stub_client(error=Exception("Simulated failure")))
+
+    summary = generate_summary_from_trace(str(trace_path), steps=5, duration=0.5)
+
+    assert "LLM call failed" in summary
+
+
+def test_concurrent_summaries_are_coalesced_and_cached(tmp_path, stub_client):
+    # Two traces with the same prompt inputs (3 filled cells, same steps, same duration bucket)
+    paths = []
+    for name in ("a.json", "b.json"):
+        path = tmp_path / name
+        path.write_text(json.dumps([{"row": 0, "col": i, "value": i + 1} for i in range(3)]))
+        paths.append(str(path))
+
+    release = threading.Event()
+    stub = stub_client("Shared summary.", release=release)
+    set_client(stub)
+
+    first = generate_summary_async(paths[0], steps=3, duration=0.101)
+    second = generate_summary_async(paths[1], steps=3, duration=0.102)
+    release.set()
+
+    assert first.result(timeout=5) == second.result(timeout=5) == "Shared summary."
+    assert stub.calls == 1
 
-        assert "LLM call failed" in summary
+    # A later request is served from the disk cache
+    assert generate_summary_from_trace(paths[0], steps=3, duration=0.099) == "Shared summary."
+    assert stub.calls == 1
@@ -0,0 +1,118 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the batch and streaming API endpoints. Board extraction is replaced by a stub,  #
+# and boards are solved on a real process pool, to verify that lines carry the uniqueness flag,  #
+# that known boards are served from the result caches, and that saturated pools answer 503.      #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import json
+import threading
+import pytest
+from fastapi.testclient import TestClient
+import app
+from solver.batch_solver import parse_board
+from utils.worker_pool import BoundedWorkerPool
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+EASY = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+AMBIGUOUS = "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......"
+
+@pytest.fixture
+def client(monkeypatch):
+    """
+    API client whose extraction stage returns two boards and one unreadable image.
+    """
+
+    boards = [parse_board(EASY), ValueError("Grid not found"), parse_board(AMBIGUOUS.replace(".", "0"))]
+    boards[2][0][0] = 0  # One clue fewer than the original: several solutions
+
+    def extract_boards_from_bytes(images, *args):
+        list(images)  # Load every upload, like the real extraction
+        return iter(boards)
+
+    monkeypatch.setattr(app, "extract_boards_from_bytes", extract_boards_from_bytes)
+    return TestClient(app.app)
+
+def post_batch(client, count=3):
+    """
+    Uploads `count` placeholder images to /solve/batch.
+    """
+
+    files = [("images", (f"board_{i}.png", b"png", "image/png")) for i in range(count)]
+    return client.post("/solve/batch", files=files, params={"backend": "dlx"})
+
+def test_batch_solves_on_process_pool_through_result_caches(client, monkeypatch):
+    """
+    Tests that batch lines carry the same fields as /solve (including `unique`), that errors
+    are reported per image, and that a second batch is answered from the result caches.
+    """
+
+    pool = BoundedWorkerPool("process", max_workers=2, max_queued=0)
+    monkeypatch.setattr(app, "batch_pool", pool)
+
+    try:
+        lines = [json.loads(line) for line in post_batch(client).text.splitlines()]
+        hits = app.board_cache.stats()["hits"]
+        again = [json.loads(line) for line in post_batch(client).text.splitlines()]
+    finally:
+        pool.shutdown()
+
+    lines = sorted(lines, key=lambda line: line["index"])
+    assert [line["name"] for line in lines] == ["board_0.png", "board_1.png", "board_2.png"]
+
+    assert lines[0]["solved"] and lines[0]["unique"] and lines[0]["method"]
+    assert all(sorted(row) == list(range(1, 10)) for row in lines[0]["solved_board"])
+    assert lines[1] == {"index": 1, "name": "board_1.png", "parsed_board": None, "error": "Grid not found"}
+    assert lines[2]["solved"] and not lines[2]["unique"]
+
+    assert app.board_cache.stats()["hits"] == hits + 2
+    assert sorted(again, key=lambda line: line["index"]) == lines
+
+def test_batch_is_rejected_when_pool_is_saturated(client, monkeypatch):
+    """
+    Tests that a batch arriving while the batch pool is full is answered with 503.
+    """
+
+    pool = BoundedWorkerPool("thread", max_workers=1, max_queued=0)
+    monkeypatch.setattr(app, "batch_pool", pool)
+    release = threading.Event()
+
+    try:
+        pool.submit(release.wait)
+        response = post_batch(client)
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+def test_stream_is_rejected_when_its_thread_pool_is_saturated(client, monkeypatch):
+    """
+    Tests that /solve/stream jobs (which need threads even with API_WORKER_POOL=process) run on
+    a bounded pool and are answered with 503 once it is full.
+    """
+
+    pool = BoundedWorkerPool("thread", max_workers=1, max_queued=0)
+    monkeypatch.setattr(app, "stream_pool", pool)
+    monkeypatch.setattr(app, "report_sinks", {"memory": None})
+    release = threading.Event()
+
+    try:
+        pool.submit(release.wait)
+        response = client.post("/solve/stream", files={"image": ("board.png", b"png", "image/png")},
+                               params={"report": "none", "sink": "memory"})
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert response.status_code == 503
+    assert pool.rejected == 1
@@ -0,0 +1,71 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the batch solving API. Verifies parsing of 81-character puzzles, in-order and   #
+# as-completed result streaming over a process pool, and error reporting for invalid inputs.     #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import pytest
+from solver.batch_solver import solve_many, parse_board, board_to_string
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+EASY = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+HARD = "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......"
+
+def test_parse_board_accepts_dots_and_zeros():
+    """
+    Tests that both '.' and '0' are parsed as empty cells and that the round trip is stable.
+    """
+
+    board = parse_board(HARD)
+
+    assert board[0][:3] == [4, 0, 0]
+    assert board_to_string(parse_board(EASY)) == EASY.replace("0", ".")
+
+    with pytest.raises(ValueError):
+        parse_board("12345")
+
+def test_solve_many_yields_results_in_input_order():
+    """
+    Tests that a process pool returns one solved result per puzzle, in input order,
+    with solutions in the same format as the inputs.
+    """
+
+    puzzles = [EASY, HARD, parse_board(EASY)] * 3
+    results = list(solve_many(puzzles, workers=2, chunksize=2))
+
+    assert [r["index"] for r in results] == list(range(len(puzzles)))
+    assert all(r["solved"] for r in results)
+    assert isinstance(results[0]["solution"], str) and len(results[0]["solution"]) == 81
+    assert isinstance(results[2]["solution"], list)
+
+def test_solve_many_as_completed_and_invalid_inputs():
+    """
+    Tests that unordered streaming still returns every puzzle once and that invalid
+    puzzles are reported per board instead of aborting the batch.
+    """
+
+    puzzles = [EASY, "not a sudoku", HARD]
+    results = list(solve_many(puzzles, workers=2, chunksize=1, ordered=False))
+
+    assert sorted(r["index"] for r in results) == [0, 1, 2]
+    invalid = next(r for r in results if r["index"] == 1)
+    assert not invalid["solved"] and "error" in invalid
+
+def test_unknown_backend_is_reported_per_puzzle():
+    """
+    Tests that an unknown backend yields an error result per puzzle instead of aborting the
+    stream (and its worker pool).
+    """
+
+    results = list(solve_many([EASY, HARD], workers=2, chunksize=1, backend="nope"))
+
+    assert [r["index"] for r in results] == [0, 1]
+    assert all(not r["solved"] and "Unknown solver backend" in r["error"] for r in results)
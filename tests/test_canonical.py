@@ -0,0 +1,81 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for Sudoku symmetry canonicalization. Verifies that isomorphic puzzles share a      #
+# canonical key and that a solution found in the canonical frame maps back to a valid solution   #
+# of each original puzzle.                                                                       #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import random
+from solver.canonical import canonicalize, to_canonical, from_canonical
+from solver.batch_solver import parse_board, board_to_string
+from solver.dlx_solver import DLXSolver
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+HARD = "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......"
+
+def random_isomorph(board, rng):
+    """
+    Applies a random symmetry: transpose, band/row and stack/column permutations, digit relabeling.
+    """
+
+    rows = [band * 3 + i for band in rng.sample(range(3), 3) for i in rng.sample(range(3), 3)]
+    cols = [stack * 3 + i for stack in rng.sample(range(3), 3) for i in rng.sample(range(3), 3)]
+    digits = [0] + rng.sample(range(1, 10), 9)
+    grid = [list(col) for col in zip(*board)] if rng.random() < 0.5 else board
+    return [[digits[grid[r][c]] for c in cols] for r in rows]
+
+def test_isomorphic_puzzles_share_canonical_key():
+    """
+    Tests that relabeled, permuted and transposed copies of a puzzle get the same key, and that
+    the returned transform maps each copy onto the key and back.
+    """
+
+    rng = random.Random(7)
+    board = parse_board(HARD)
+    key, _ = canonicalize(board)
+
+    for _ in range(5):
+        isomorph = random_isomorph(board, rng)
+        iso_key, transform = canonicalize(isomorph)
+
+        assert iso_key == key
+        assert board_to_string(to_canonical(isomorph, transform)) == key
+        assert from_canonical(to_canonical(isomorph, transform), transform) == isomorph
+
+def test_canonical_solution_maps_back_to_original_puzzle():
+    """
+    Tests that solving the canonical board once yields valid solutions for isomorphic puzzles.
+    """
+
+    rng = random.Random(11)
+    isomorph = random_isomorph(parse_board(HARD), rng)
+    key, transform = canonicalize(isomorph)
+
+    solver = DLXSolver(parse_board(key))
+    assert solver.solve(verbose=False)
+    solution = from_canonical(solver.get_board(), transform)
+
+    assert all(isomorph[r][c] in (0, solution[r][c]) for r in range(9) for c in range(9))
+    assert DLXSolver(solution).solve(verbose=False)
+    assert all(v for row in solution for v in row)
+
+def test_ambiguous_board_falls_back_to_relabeled_key():
+    """
+    Tests that a board with too many symmetric ties still gets a key that round-trips.
+    """
+
+    board = [[0] * 9 for _ in range(9)]
+    board[8][8] = 7
+
+    key, transform = canonicalize(board)
+
+    assert key == "." * 80 + "1"
+    assert from_canonical(parse_board(key), transform) == board
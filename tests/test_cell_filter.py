@@ -0,0 +1,63 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the empty-cell gate. Validates its thresholds against the labeled test cells    #
+# (every empty cell rejected, every digit kept) and checks that it skips a large share of the    #
+# cells of a real board.                                                                         #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import glob
+import cv2
+import numpy as np
+from vision.cell_filter import find_nonempty_cells
+from vision.board_segmenter import extract_cells_from_image
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def load_cells(label: str) -> list:
+    """
+    Loads the labeled test cells of one class (a digit or "empty").
+    """
+
+    return [cv2.imread(path) for path in sorted(glob.glob(f"datasets/test/{label}/*.png"))]
+
+def test_gate_rejects_every_labeled_empty_cell():
+    """
+    Tests that no cell of datasets/test/empty is sent to the CNN.
+    """
+
+    cells = load_cells("empty")
+
+    assert len(cells) > 0
+    assert not find_nonempty_cells(cells).any()
+
+def test_gate_keeps_every_labeled_digit():
+    """
+    Tests that every digit of datasets/test/1–9 passes the gate, including highlighted cells
+    (light digit on a dark background).
+    """
+
+    cells = [cell for digit in range(1, 10) for cell in load_cells(str(digit))]
+    inverted = [255 - cell for cell in cells[:5]]
+
+    assert find_nonempty_cells(cells).all()
+    assert find_nonempty_cells(inverted).all()
+
+def test_gate_skips_empty_cells_of_a_board():
+    """
+    Tests the gate on the 81 cells of a real board: roughly half of them never reach the CNN,
+    and a grayscale copy of the cells gives the same decision.
+    """
+
+    cells = extract_cells_from_image("tests/resources/inputs/easy.jpg")
+    nonempty = find_nonempty_cells(cells)
+    gray = find_nonempty_cells([cv2.cvtColor(cell, cv2.COLOR_BGR2GRAY) for cell in cells])
+
+    assert 17 <= nonempty.sum() <= 60
+    assert np.array_equal(nonempty, gray)
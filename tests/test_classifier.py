@@ -10,7 +10,7 @@
 ##################################################################################################
 
 import numpy as np
-from cnn_classifier.digit_classifier import classify_cell
+from cnn_classifier.digit_classifier import classify_cell, classify_cells
 
 ##################################################################################################
 #                                        IMPLEMENTATION                                          #
@@ -30,3 +30,21 @@ def test_classify_cell_returns_digit_or_zero():
 
     assert isinstance(prediction, int), "Prediction must be an integer"
     assert 0 <= prediction <= 9, "Prediction must be between 0 and 9"
+
+def test_classify_cells_batches_a_full_board():
+    """
+    Unit test for batched classification.
+
+    Verifies that 81 cells (grayscale and BGR) are classified in one call, returning one
+    digit per cell that matches the single-cell classifier.
+    """
+
+    gray_cell = np.ones((50, 50), dtype="uint8") * 255
+    bgr_cell = np.ones((50, 50, 3), dtype="uint8") * 255
+    cells = [gray_cell if i % 2 else bgr_cell for i in range(81)]
+
+    predictions = classify_cells(cells)
+
+    assert len(predictions) == 81
+    assert all(isinstance(p, int) and 0 <= p <= 9 for p in predictions)
+    assert predictions[1] == classify_cell(gray_cell)
@@ -0,0 +1,102 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the DLXSolver class and the solver backend factory. Verifies that the Dancing   #
+# Links backend solves valid puzzles, rejects conflicting ones, and is selectable by name.       #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import pytest
+from solver.dlx_solver import DLXSolver
+from solver.backends import create_solver
+from solver.bckt_logic_solver import SudokuSolver
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+PUZZLE = [
+    [5, 3, 0, 0, 7, 0, 0, 0, 0],
+    [6, 0, 0, 1, 9, 5, 0, 0, 0],
+    [0, 9, 8, 0, 0, 0, 0, 6, 0],
+    [8, 0, 0, 0, 6, 0, 0, 0, 3],
+    [4, 0, 0, 8, 0, 3, 0, 0, 1],
+    [7, 0, 0, 0, 2, 0, 0, 0, 6],
+    [0, 6, 0, 0, 0, 0, 2, 8, 0],
+    [0, 0, 0, 4, 1, 9, 0, 0, 5],
+    [0, 0, 0, 0, 8, 0, 0, 7, 9],
+]
+
+def test_dlx_solver_matches_backtracking_solution():
+    """
+    Tests that the DLX backend solves a valid puzzle and agrees with the backtracking solver.
+    """
+
+    dlx = DLXSolver([row[:] for row in PUZZLE])
+    bckt = SudokuSolver([row[:] for row in PUZZLE])
+
+    assert dlx.solve(verbose=False), "DLX solver failed to solve a valid puzzle"
+    assert bckt.solve(verbose=False)
+    assert dlx.get_board() == bckt.get_board()
+    assert dlx.steps == len(dlx.final_trace) > 0
+
+def test_dlx_solver_rejects_invalid_board():
+    """
+    Tests that the DLX backend refuses a board whose givens conflict.
+    """
+
+    invalid_board = [row[:] for row in PUZZLE]
+    invalid_board[0][2] = 5  # ← duplicate 5 in row
+
+    solver = DLXSolver(invalid_board)
+
+    assert not solver.solve(verbose=False), "DLX solver should fail on an invalid puzzle"
+
+def test_create_solver_selects_backend_by_name():
+    """
+    Tests that the backend factory returns the requested solver and rejects unknown names.
+    """
+
+    assert isinstance(create_solver([row[:] for row in PUZZLE], "dlx"), DLXSolver)
+    assert isinstance(create_solver([row[:] for row in PUZZLE], "backtracking"), SudokuSolver)
+
+    with pytest.raises(ValueError):
+        create_solver([row[:] for row in PUZZLE], "quantum")
+
+def test_dlx_solver_count_solutions_stops_at_limit():
+    """
+    Tests that the DLX backend counts solutions up to the limit and keeps the first one.
+    """
+
+    unique_solver = DLXSolver([row[:] for row in PUZZLE])
+    assert unique_solver.count_solutions(limit=2, verbose=False) == 1
+
+    empty_solver = DLXSolver([[0] * 9 for _ in range(9)])
+    assert empty_solver.count_solutions(limit=3, verbose=False) == 3
+    assert all(v for row in empty_solver.get_board() for v in row)
+
+@pytest.mark.parametrize("backend", ["backtracking", "dlx"])
+def test_count_solutions_reports_metrics_of_the_first_solution(backend):
+    """
+    Tests that checking uniqueness does not inflate the reported work: steps, guesses, trace
+    and technique counts match a plain `solve()` that stops at the first solution.
+    """
+
+    puzzle = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+    board = [[int(c) if c != "." else 0 for c in puzzle[r * 9:(r + 1) * 9]] for r in range(9)]
+
+    solved = create_solver([row[:] for row in board], backend)
+    assert solved.solve(verbose=False)
+
+    counted = create_solver([row[:] for row in board], backend)
+    assert counted._first_solution is None
+    assert counted.count_solutions(limit=2, verbose=False) == 1
+
+    assert counted.get_board() == solved.get_board()
+    assert counted.steps == solved.steps and counted.steps > 0
+    assert counted.final_trace == solved.final_trace
+    assert getattr(counted, "guesses", None) == getattr(solved, "guesses", None)
+    assert getattr(counted, "technique_counts", None) == getattr(solved, "technique_counts", None)
@@ -0,0 +1,189 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the frame-stream mode. A recorded video (and a directory of frames) of a moving #
+# synthetic board is replayed offline with an injected nearest-template classifier, to verify    #
+# corner tracking, incremental reclassification of changed cells, solving once stable, and that  #
+# empty squares are never sent to the solver.                                                    #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import cv2
+import numpy as np
+from vision import frame_stream
+from vision.frame_stream import stream_boards
+from cnn_classifier.digit_classifier import preprocess_grid
+from solver.batch_solver import parse_board, board_to_string
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+EASY = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+
+def render_board(board, size=450):
+    """
+    Draws a printed-looking Sudoku grid with its digits.
+    """
+
+    image = np.full((size, size, 3), 255, dtype=np.uint8)
+    step = size // 9
+    for i in range(10):
+        thickness = 4 if i % 3 == 0 else 1
+        cv2.line(image, (i * step, 0), (i * step, size), (0, 0, 0), thickness)
+        cv2.line(image, (0, i * step), (size, i * step), (0, 0, 0), thickness)
+    cv2.rectangle(image, (0, 0), (size - 1, size - 1), (0, 0, 0), 6)
+
+    for r in range(9):
+        for c in range(9):
+            if board[r][c]:
+                cv2.putText(image, str(board[r][c]), (c * step + 15, r * step + 38),
+                            cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+    return image
+
+class TemplateClassifier:
+    """
+    Offline stand-in for the CNN: nearest rendered digit template, on the cell interiors.
+    """
+
+    def __init__(self):
+        digits = [[(r * 3 + r // 3 + c) % 9 + 1 for c in range(9)] for r in range(9)]
+        self.templates = np.concatenate([
+            preprocess_grid(render_board(digits))[:, 12:52, 12:52],
+            preprocess_grid(render_board([[0] * 9] * 9))[:1, 12:52, 12:52],
+        ])
+        self.labels = [v for row in digits for v in row] + [0]
+        self.cells = 0
+
+    def __call__(self, batch):
+        self.cells += len(batch)
+        distances = ((batch[:, None, 12:52, 12:52] - self.templates[None]) ** 2).mean(axis=(2, 3, 4))
+        return [self.labels[i] for i in distances.argmin(axis=1)]
+
+def make_frames(boards, size=(640, 480)):
+    """
+    Frames of a board moving and slightly zooming across a gray background.
+
+    Returns:
+        list[tuple[np.ndarray, tuple[int, int]]]: Frames and the board's top-left corner.
+    """
+
+    frames = []
+    for i, board in enumerate(boards):
+        frame = np.full((size[1], size[0], 3), 170, dtype=np.uint8)
+        if board is not None:
+            grid = cv2.resize(render_board(board), (340 + i % 5, 340 + i % 5))
+            x, y = 60 + 3 * i, 50 + 2 * i
+            frame[y:y + grid.shape[0], x:x + grid.shape[1]] = grid
+            frames.append((frame, (x, y)))
+        else:
+            frames.append((frame, None))
+    return frames
+
+def test_stream_tracks_grid_and_reclassifies_only_changed_cells(tmp_path):
+    """
+    Tests on a recorded (MJPG) video that the grid is detected once and then tracked, that a
+    digit written mid-recording triggers the classification of that single cell, and that each
+    board is solved once it has been stable for `stable_frames` frames.
+    """
+
+    puzzle = parse_board(EASY)
+    written = [row[:] for row in puzzle]
+    written[0][2] = 4
+    frames = make_frames([puzzle] * 20 + [written] * 20)
+
+    video = str(tmp_path / "recording.avi")
+    writer = cv2.VideoWriter(video, cv2.VideoWriter_fourcc(*"MJPG"), 25, (640, 480))
+    for frame, _ in frames:
+        writer.write(frame)
+    writer.release()
+
+    classifier = TemplateClassifier()
+    results = list(stream_boards(video, classify=classifier, stable_frames=5, redetect_frames=10))
+
+    assert len(results) == 40
+    assert not results[0]["tracked"] and all(r["tracked"] for r in results[1:])
+    assert all(np.abs(np.array(r["corners"][0]) - origin).max() <= 2
+               for r, (_, origin) in zip(results, frames))
+
+    assert [r["reclassified"] for r in results] == [81] + [0] * 19 + [1] + [0] * 19
+    assert classifier.cells == 82
+
+    assert all(r["board"] == puzzle for r in results[:20])
+    assert all(r["board"] == written for r in results[20:])
+    assert [r["stable"] for r in results] == ([False] * 4 + [True] * 16) * 2
+
+    first, second = results[4]["solution"], results[24]["solution"]
+    assert all(r["solution"] == first for r in results[4:20])
+    assert first[0][2] == 4 and second[0][2] == 4
+    assert all(sorted(row) == list(range(1, 10)) for row in second)
+
+def test_stream_reads_frame_directory_and_recovers_lost_grid(tmp_path):
+    """
+    Tests that a directory of frames is read in name order, that frames without a grid reset
+    the board, and that the grid is detected again when it comes back.
+    """
+
+    puzzle = parse_board(EASY)
+    for index, (frame, _) in enumerate(make_frames([puzzle] * 3 + [None] * 2 + [puzzle] * 3)):
+        cv2.imwrite(str(tmp_path / f"frame_{index:03d}.png"), frame)
+
+    classifier = TemplateClassifier()
+    results = list(stream_boards(str(tmp_path), classify=classifier, stable_frames=2))
+
+    assert [r["frame"] for r in results] == list(range(8))
+    assert [r["board"] is None for r in results] == [False] * 3 + [True] * 2 + [False] * 3
+    assert [r["tracked"] for r in results] == [False, True, True, False, False, False, True, True]
+    assert [r["reclassified"] for r in results] == [81, 0, 0, 0, 0, 81, 0, 0]
+    assert results[6]["solution"] is not None and results[6]["solution"] == results[2]["solution"]
+
+def test_blank_square_is_not_solved(monkeypatch):
+    """
+    Tests that a framed square without digits is tracked and read as an empty board, but is
+    not solved: boards with fewer than MIN_GIVENS digits are not Sudoku puzzles.
+    """
+
+    solved = []
+    monkeypatch.setattr(frame_stream, "solve_puzzle", lambda *args: solved.append(args) or {"solution": None})
+
+    frame = np.full((480, 640, 3), 170, dtype=np.uint8)
+    frame[50:400, 60:410] = 255
+    cv2.rectangle(frame, (60, 50), (409, 399), (0, 0, 0), 3)
+
+    results = list(stream_boards([frame] * 4, classify=TemplateClassifier(), stable_frames=2))
+
+    assert all(r["corners"] is not None for r in results)
+    assert all(r["board"] == [[0] * 9] * 9 for r in results)
+    assert [r["stable"] for r in results] == [False, True, True, True]
+    assert all(r["solution"] is None for r in results)
+    assert solved == []
+
+def test_remembered_solutions_are_bounded(monkeypatch):
+    """
+    Tests that only the last MAX_SOLUTIONS solved boards are remembered, and that a board seen
+    again within that window is not solved twice.
+    """
+
+    monkeypatch.setattr(frame_stream, "MAX_SOLUTIONS", 2)
+    solve_puzzle = frame_stream.solve_puzzle
+    solved = []
+    monkeypatch.setattr(frame_stream, "solve_puzzle",
+                        lambda index, board, backend: solved.append(board) or solve_puzzle(index, board, backend))
+
+    puzzle = parse_board(EASY)
+    boards = [puzzle]
+    for row, col, digit in [(0, 2, 4), (0, 3, 6)]:
+        boards.append([r[:] for r in boards[-1]])
+        boards[-1][row][col] = digit
+
+    sequence = [boards[0], boards[1], boards[0], boards[2]]  # The digit is erased, then rewritten
+    frames = [frame for frame, _ in make_frames([board for board in sequence for _ in range(3)])]
+    tracker = frame_stream.BoardTracker(classify=TemplateClassifier(), stable_frames=2)
+    results = [tracker.process(frame) for frame in frames]
+
+    assert all(r["solution"] is not None for r in results[1::3])
+    assert solved == [boards[0], boards[1], boards[2]]
+    assert list(tracker._solutions) == [board_to_string(boards[0]), board_to_string(boards[2])]
@@ -10,7 +10,14 @@
 #                                            IMPORTS                                             #
 ##################################################################################################
 
-from vision.image_parser import extract_board_from_image
+from vision import image_parser
+import numpy as np
+from vision.image_parser import (
+    extract_board_from_image, extract_boards_from_bytes, extract_boards_from_page
+)
+from vision.board_segmenter import load_image, extract_grid_from_array
+from vision.cell_filter import find_nonempty_cells
+from cnn_classifier.digit_classifier import preprocess_grid
 
 ##################################################################################################
 #                                        IMPLEMENTATION                                          #
@@ -30,3 +37,64 @@ def test_extract_board_returns_valid_matrix():
     assert isinstance(board, list), "Board should be a list"
     assert len(board) == 9, "Board should have 9 rows"
     assert all(isinstance(row, list) and len(row) == 9 for row in board), "Each row must have 9 elements"
+
+
+def test_extract_boards_shares_cnn_calls_across_images(monkeypatch):
+    """
+    Tests that batch extraction classifies the cells of a whole chunk of images in one call,
+    skipping cells detected as empty, and reports undecodable images in place without aborting
+    the batch.
+    """
+
+    calls = []
+
+    def fake_classify(batch):
+        calls.append(len(batch))
+        return [5] * len(batch)
+
+    monkeypatch.setattr(image_parser, "classify_batch", fake_classify)
+
+    with open("tests/resources/inputs/easy.jpg", "rb") as f:
+        image = f.read()
+
+    grid = extract_grid_from_array(load_image("tests/resources/inputs/easy.jpg"))
+    nonempty = find_nonempty_cells(preprocess_grid(grid))
+    expected = [[5 if nonempty[r * 9 + c] else 0 for c in range(9)] for r in range(9)]
+
+    results = list(extract_boards_from_bytes([image, b"not an image", image, image], chunk_size=3))
+
+    assert calls == [2 * nonempty.sum(), nonempty.sum()]
+    assert isinstance(results[1], ValueError)
+    assert all(board == expected for i, board in enumerate(results) if i != 1)
+
+
+def test_extract_boards_from_page_classifies_all_grids_at_once(monkeypatch):
+    """
+    Tests that the cells of every grid on a page share one CNN call, that boards come back in
+    reading order with their page corners, and that a square without digits is dropped.
+    """
+
+    calls = []
+
+    def fake_classify(batch):
+        calls.append(len(batch))
+        return [5] * len(batch)
+
+    monkeypatch.setattr(image_parser, "classify_batch", fake_classify)
+
+    grid = extract_grid_from_array(load_image("tests/resources/inputs/easy.jpg"))
+    nonempty = find_nonempty_cells(preprocess_grid(grid))
+
+    page = np.full((1100, 1100, 3), 255, dtype=np.uint8)
+    page[600:1050, 50:500] = grid
+    page[40:490, 560:1010] = grid
+    page[50:450, 50:450] = 0  # Empty square frame: a grid candidate without digits
+    page[53:447, 53:447] = 255
+
+    boards = extract_boards_from_page(page)
+
+    assert calls == [2 * nonempty.sum()]
+    assert len(boards) == 2
+    assert np.abs(np.array(boards[0]["corners"][0]) - (560, 40)).max() <= 3
+    assert np.abs(np.array(boards[1]["corners"][0]) - (50, 600)).max() <= 3
+    assert all(sum(v != 0 for row in b["parsed_board"] for v in row) == nonempty.sum() for b in boards)
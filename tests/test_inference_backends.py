@@ -0,0 +1,56 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the pluggable CNN inference backends and the model export helpers. Verifies     #
+# backend selection by name, int8 quantization round trips and calibration data loading.         #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import os
+import numpy as np
+import pytest
+from cnn_classifier.inference_backends import load_backend, quantize, dequantize
+from cnn_classifier.export_model import load_labeled_cells, VAL_DIR
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def test_load_backend_rejects_unknown_name():
+    """
+    Tests that an unknown inference backend name raises a ValueError listing the options.
+    """
+
+    with pytest.raises(ValueError, match="tflite"):
+        load_backend("tensorrt")
+
+def test_quantize_round_trip_stays_within_one_step():
+    """
+    Tests that quantizing and dequantizing [0, 1] inputs loses at most one quantization step
+    and that out-of-range values are clipped to the int8 range.
+    """
+
+    scale, zero_point = 1 / 255, -128
+    values = np.linspace(0, 1, 50, dtype="float32")
+
+    q = quantize(values, scale, zero_point, np.int8)
+
+    assert q.dtype == np.int8
+    assert np.max(np.abs(dequantize(q, scale, zero_point) - values)) <= scale
+    assert quantize(np.array([5.0]), scale, zero_point, np.int8)[0] == 127
+
+@pytest.mark.skipif(not os.path.isdir(VAL_DIR), reason="Validation dataset not available")
+def test_load_labeled_cells_matches_model_input_format():
+    """
+    Tests that calibration images are loaded as normalized (N, 64, 64, 1) tensors with labels.
+    """
+
+    inputs, labels = load_labeled_cells(VAL_DIR, limit_per_class=2)
+
+    assert inputs.shape[1:] == (64, 64, 1) and inputs.dtype == np.float32
+    assert len(inputs) == len(labels) <= 20
+    assert 0.0 <= inputs.min() and inputs.max() <= 1.0
+    assert set(labels) <= set(range(10))
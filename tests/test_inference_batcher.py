@@ -0,0 +1,67 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the cross-request inference batcher. Uses a lightweight NumPy function in       #
+# place of the CNN to verify that concurrent requests are merged and routed back correctly.      #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from cnn_classifier.inference_batcher import InferenceBatcher
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def fake_predict(batch):
+    """
+    Stand-in for the model: returns the mean pixel value of each input row.
+    """
+
+    return batch.reshape(len(batch), -1).mean(axis=1, keepdims=True)
+
+def test_batcher_merges_concurrent_requests_and_routes_results():
+    """
+    Verifies that requests from many threads are served by fewer model calls, and that each
+    caller receives exactly the predictions for its own rows.
+    """
+
+    batcher = InferenceBatcher(fake_predict, max_batch_size=81 * 8, max_wait_ms=50)
+    batcher.start()
+
+    def request(i):
+        cells = np.full((81, 64, 64, 1), float(i), dtype="float32")
+        return i, batcher.predict(cells)
+
+    try:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(request, range(16)))
+    finally:
+        batcher.stop()
+
+    for i, preds in results:
+        assert preds.shape == (81, 1)
+        assert np.all(preds == i)
+
+    assert batcher.items == 16 * 81
+    assert batcher.batches < 16
+
+def test_batcher_propagates_model_errors():
+    """
+    Verifies that a failing model call is reported to the waiting caller.
+    """
+
+    def broken_predict(batch):
+        raise RuntimeError("model unavailable")
+
+    batcher = InferenceBatcher(broken_predict, max_wait_ms=1)
+    batcher.start()
+    try:
+        future = batcher.submit(np.zeros((81, 64, 64, 1), dtype="float32"))
+        assert isinstance(future.exception(timeout=5), RuntimeError)
+    finally:
+        batcher.stop()
@@ -0,0 +1,73 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the in-process metrics layer. Verifies that stage timers work as decorators and #
+# context managers, and that counters and histograms render in the Prometheus text format.       #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import pytest
+from utils import metrics
+from utils.metrics import timed, STAGE_SECONDS
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """
+    Starts every test from an empty registry.
+    """
+
+    metrics.reset()
+    yield
+    metrics.reset()
+
+def test_timed_records_decorated_calls_and_blocks():
+    """
+    Tests that both forms of `timed` observe into the stage histogram, including calls that
+    raise, and that the decorated function keeps its name and return value.
+    """
+
+    @timed("parse")
+    def parse(value):
+        if value is None:
+            raise ValueError("no value")
+        return value * 2
+
+    assert parse(21) == 42
+    assert parse.__name__ == "parse"
+    with pytest.raises(ValueError):
+        parse(None)
+
+    with timed("solve", backend="dlx"):
+        pass
+
+    text = metrics.render_prometheus()
+    assert f'{STAGE_SECONDS}_count{{stage="parse"}} 2' in text
+    assert f'{STAGE_SECONDS}_count{{backend="dlx",stage="solve"}} 1' in text
+    assert f"# TYPE {STAGE_SECONDS} histogram" in text
+
+def test_render_prometheus_uses_cumulative_buckets():
+    """
+    Tests that histogram buckets are cumulative and end with +Inf, and that counters are
+    rendered with their labels.
+    """
+
+    metrics.observe("latency_seconds", 0.003)
+    metrics.observe("latency_seconds", 0.2)
+    metrics.observe("latency_seconds", 60)
+    metrics.inc("cells_total", 81, kind="empty")
+
+    lines = metrics.render_prometheus().splitlines()
+
+    assert 'latency_seconds_bucket{le="0.005"} 1' in lines
+    assert 'latency_seconds_bucket{le="0.25"} 2' in lines
+    assert 'latency_seconds_bucket{le="10.0"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_count 3" in lines
+    assert 'cells_total{kind="empty"} 81' in lines
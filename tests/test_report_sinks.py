@@ -0,0 +1,88 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the API report sinks. Verifies that the filesystem sink writes queued artifacts #
+# in the background, that the memory sink evicts its oldest entries and that the inline sink     #
+# returns JSON-serializable content, and that the API never lets a placeholder report overwrite  #
+# the summarized one.                                                                            #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import base64
+from concurrent.futures import Future
+import app
+from utils.reporter import SUMMARY_PLACEHOLDER
+from utils.report_sinks import FilesystemSink, MemorySink, InlineSink
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def test_filesystem_sink_writes_artifacts_after_flush(tmp_path):
+    """
+    Tests that emitted text and binary artifacts are on disk once the sink is flushed, and that
+    a later emit with the same name replaces the file.
+    """
+
+    sink = FilesystemSink(tmp_path)
+    sink.emit({"a_REPORT.md": "pending", "a_input.png": b"\x89PNG"})
+    sink.emit({"a_REPORT.md": "done"})
+    sink.flush()
+
+    assert (tmp_path / "a_REPORT.md").read_text() == "done"
+    assert (tmp_path / "a_input.png").read_bytes() == b"\x89PNG"
+    assert sink.files_written == 3
+    assert not list(tmp_path.glob("*.tmp"))
+
+def test_memory_sink_keeps_most_recent_entries():
+    """
+    Tests that the memory sink drops the oldest artifacts beyond `max_entries`.
+    """
+
+    sink = MemorySink(max_entries=2)
+    sink.emit({"a.json": "[]", "b.json": "[]"})
+    sink.emit({"c.json": "[1]"})
+
+    assert sink.get("a.json") is None
+    assert sink.get("c.json") == "[1]"
+
+def test_inline_sink_encodes_binary_content():
+    """
+    Tests that the inline sink returns text as-is and base64-encodes bytes.
+    """
+
+    files = InlineSink().emit({"a.json": "[]", "a_input.png": b"\x89PNG"})
+
+    assert files["a.json"] == "[]"
+    assert base64.b64decode(files["a_input.png"]) == b"\x89PNG"
+
+def test_emit_report_keeps_summary_completed_during_render(monkeypatch):
+    """
+    Tests that a summary finishing while the placeholder report is being rendered ends up in
+    the sink, instead of being overwritten by the placeholder report.
+    """
+
+    summary_future = Future()
+
+    def render_report(parsed_board, solved_board, metrics, image_name, summary):
+        if not summary_future.done():
+            summary_future.set_result("Summary ready")  # Completes during the first render
+        return f"report: {summary}"
+
+    monkeypatch.setattr(app, "summarize_async", lambda *args: summary_future)
+    monkeypatch.setattr(app, "render_report", render_report)
+
+    board = [[(r * 3 + r // 3 + c) % 9 + 1 for c in range(9)] for r in range(9)]
+    parsed_board = [row[:] for row in board]
+    parsed_board[0][0] = 0
+    result = {"solved_board": board, "method": "Backtracking", "steps": 1, "duration": 0.01}
+
+    sink = MemorySink()
+    files = app.emit_report(parsed_board, result, b"\x89PNG", "board.png", "full", sink)["files"]
+
+    report_name = next(name for name in files if name.endswith("_REPORT.md"))
+    assert sink.get(report_name) == "report: Summary ready"
+    assert SUMMARY_PLACEHOLDER not in sink.get(report_name)
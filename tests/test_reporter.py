@@ -1,10 +1,13 @@
 import json
+import time
 from pathlib import Path
+import threading
 from unittest.mock import patch
-from utils.reporter import save_solution_report
+from utils import ai_summarizer
+from utils.reporter import save_solution_report, SUMMARY_PLACEHOLDER
 from utils.config import OUTPUT_DIR
 
-def test_save_solution_report_creates_markdown(tmp_path):
+def test_save_solution_report_creates_markdown(tmp_path, monkeypatch, stub_client):
     # Simulate 9x9 boards: parsed, edited and solved
     parsed_board = [[5, 3, 0, 0, 7, 0, 0, 0, 0]] * 9
     edited_board = [[5, 3, 4, 6, 7, 8, 9, 1, 2]] * 9
@@ -22,18 +25,19 @@ def test_save_solution_report_creates_markdown(tmp_path):
     dummy_image = tmp_path / "sudoku_input.png"
     dummy_image.write_bytes(b"fake image content")
 
-    # Create expected trace file in outputs/ (as required by reporter logic)
+    # Create expected trace file in the outputs directory (as required by reporter logic)
     base_name = dummy_image.stem
-    trace_path = Path("outputs") / f"{base_name}_solution_trace.json"
+    trace_path = OUTPUT_DIR / f"{base_name}_solution_trace.json"
     trace_path.parent.mkdir(parents=True, exist_ok=True)
     with open(trace_path, "w") as f:
         json.dump({"0_0": {"value": 5, "step": 1, "action": "place"}}, f)
 
-    # Patch OpenAI call and image copying
-    with patch("utils.reporter.generate_summary_from_trace") as mock_summary, \
-         patch("utils.reporter.shutil.copy") as mock_copy:
+    # Plug in a stub LLM client, disable the summary disk cache and patch image copying
+    monkeypatch.setattr(ai_summarizer, "client", stub_client("LLM summary for the Sudoku puzzle."))
+    monkeypatch.setattr(ai_summarizer, "CACHE_DIR", None)
+
+    with patch("utils.reporter.shutil.copy") as mock_copy:
 
-        mock_summary.return_value = "LLM summary for the Sudoku puzzle."
         mock_copy.return_value = None
 
         # Create dummy console log file expected by reporter
@@ -45,7 +49,8 @@ def test_save_solution_report_creates_markdown(tmp_path):
             input_board=input_board,
             solved_board=solved_board,
             bckt_metrics=bckt_metrics,
-            image_path=str(dummy_image)
+            image_path=str(dummy_image),
+            wait_for_summary=True
         )
 
         # Assert that the report file was created correctly
@@ -58,3 +63,34 @@ def test_save_solution_report_creates_markdown(tmp_path):
             assert "# Sudoku Solver Report" in content
             assert "LLM summary" in content
             assert "Final Solved Board" in content
+
+def test_report_is_written_before_summary_completes(tmp_path, monkeypatch, stub_client):
+    """
+    Checks that the report is saved immediately with a placeholder, and that the summary
+    replaces it once the (slow) LLM call returns.
+    """
+
+    release = threading.Event()
+    monkeypatch.setattr(ai_summarizer, "client", stub_client("Deferred LLM summary.", release=release))
+    monkeypatch.setattr(ai_summarizer, "CACHE_DIR", None)
+
+    image_name = "deferred_summary_input.png"
+    base_name = Path(image_name).stem
+    with open(OUTPUT_DIR / f"{base_name}_solution_trace.json", "w") as f:
+        json.dump([{"row": 0, "col": 0, "value": 1}] * 7, f)
+
+    board = [[1] * 9] * 9
+    future = save_solution_report(board, board, {"solved": True, "steps": 7, "duration": 0.123},
+                                  image_path=image_name, image_bytes=b"fake image content")
+
+    report_path = OUTPUT_DIR / f"{base_name}_REPORT.md"
+    assert SUMMARY_PLACEHOLDER in report_path.read_text()
+
+    release.set()
+    assert future.result(timeout=5) == "Deferred LLM summary."
+
+    for _ in range(100):
+        if "Deferred LLM summary." in report_path.read_text():
+            break
+        time.sleep(0.02)
+    assert SUMMARY_PLACEHOLDER not in report_path.read_text()
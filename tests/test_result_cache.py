@@ -0,0 +1,84 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the content-addressed result cache. Verifies LRU eviction, hit/miss counters    #
+# and the persistent SQLite tier shared across cache instances.                                  #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import asyncio
+from utils.result_cache import LRUCache, image_key
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def test_lru_cache_evicts_least_recently_used_entry():
+    """
+    Tests that the memory tier keeps at most `max_size` entries, evicting the least recently
+    used one, and counts hits and misses.
+    """
+
+    cache = LRUCache("boards", max_size=2)
+    cache.put("a", {"steps": 1})
+    cache.put("b", {"steps": 2})
+
+    assert cache.get("a") == {"steps": 1}  # "a" becomes the most recently used
+    cache.put("c", {"steps": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("c") == {"steps": 3}
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+def test_sqlite_tier_survives_new_cache_instance(tmp_path):
+    """
+    Tests that entries written with an on-disk tier are found by a fresh cache instance
+    (e.g. after a restart or from another API process) and promoted into memory.
+    """
+
+    db_path = str(tmp_path / "cache.sqlite")
+    board = [[0] * 9 for _ in range(9)]
+
+    writer = LRUCache("images", max_size=4, db_path=db_path)
+    writer.put(image_key(b"image"), board)
+    writer.flush()
+
+    cache = LRUCache("images", max_size=4, db_path=db_path)
+    assert cache.get(image_key(b"image")) == board
+    assert cache.stats()["size"] == 1
+    assert cache.get(image_key(b"other image")) is None
+
+def test_aget_reads_disk_tier_off_the_event_loop(tmp_path, monkeypatch):
+    """
+    Tests that `aget` serves memory hits on the event loop and runs SQLite lookups in a worker
+    thread, and that writes queued by `put` are batched into the on-disk tier.
+    """
+
+    db_path = str(tmp_path / "cache.sqlite")
+    writer = LRUCache("boards", max_size=0, db_path=db_path)
+    for index in range(10):
+        writer.put(f"board-{index}", {"steps": index})
+    writer.flush()
+
+    offloaded = []
+    to_thread = asyncio.to_thread
+
+    async def spy(function, *args):
+        offloaded.append(args)
+        return await to_thread(function, *args)
+
+    monkeypatch.setattr(asyncio, "to_thread", spy)
+    cache = LRUCache("boards", max_size=4, db_path=db_path)
+
+    async def lookups():
+        return [await cache.aget("board-3"), await cache.aget("board-3"), await cache.aget("missing")]
+
+    assert asyncio.run(lookups()) == [{"steps": 3}, {"steps": 3}, None]
+    assert offloaded == [("board-3",), ("missing",)]  # The second lookup is a memory hit
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (2, 1)
@@ -9,7 +9,15 @@
 #                                            IMPORTS                                             #
 ##################################################################################################
 
-from vision.board_segmenter import extract_cells_from_image
+import os
+import glob
+import numpy as np
+import pytest
+from vision.board_segmenter import (
+    extract_cells_from_image, extract_cells_from_array, extract_grid_from_array, decode_image,
+    load_image, tile_grid, segment_cells, find_grid_corners, find_all_grid_corners
+)
+from cnn_classifier.digit_classifier import preprocess_grid, preprocess_cell
 
 ##################################################################################################
 #                                        IMPLEMENTATION                                          #
@@ -28,3 +36,96 @@ def test_extract_cells_from_image_returns_81_cells():
     assert isinstance(cells, list), "Cells should be returned as a list"
     assert len(cells) == 81, "Should extract exactly 81 cells"
     assert all(cell is not None for cell in cells), "No cell should be None"
+
+def test_extract_cells_from_bytes_matches_file_path():
+    """
+    Unit test for in-memory decoding.
+
+    Verifies that decoding the encoded image bytes yields the same 81 cells as reading the
+    file from disk, and that undecodable data raises a ValueError.
+    """
+
+    image_path = "tests/resources/inputs/easy.jpg"
+    with open(image_path, "rb") as f:
+        image_bytes = f.read()
+
+    cells = extract_cells_from_array(decode_image(image_bytes))
+    expected = extract_cells_from_image(image_path)
+
+    assert len(cells) == 81
+    assert all(np.array_equal(a, b) for a, b in zip(cells, expected))
+
+    with pytest.raises(ValueError):
+        decode_image(b"not an image")
+
+def test_tile_grid_is_a_view_of_the_warped_grid():
+    """
+    Tests that the (9, 9, h, w, 3) cell tiling shares memory with the grid and matches the
+    row-major cell order.
+    """
+
+    grid = extract_grid_from_array(load_image("tests/resources/inputs/easy.jpg"))
+    tiles = tile_grid(grid)
+
+    assert tiles.shape == (9, 9, 50, 50, 3)
+    assert np.shares_memory(tiles, grid)
+    assert np.array_equal(tiles[4, 7], segment_cells(grid)[4 * 9 + 7])
+
+def test_preprocess_grid_matches_per_cell_preprocessing():
+    """
+    Tests that the vectorized CNN input equals per-cell resizing, except for the outermost
+    pixels of each cell (interpolated with the neighboring cell instead of clamped).
+    """
+
+    grid = extract_grid_from_array(load_image("tests/resources/inputs/easy.jpg"))
+    batch = preprocess_grid(grid)
+    expected = np.stack([preprocess_cell(cell) for cell in segment_cells(grid)])
+
+    assert batch.shape == (81, 64, 64, 1) and batch.dtype == np.float32
+    assert batch.flags["C_CONTIGUOUS"]
+    assert np.abs(batch[:, 2:-2, 2:-2, 0] - expected[:, 2:-2, 2:-2]).max() <= 2 / 255
+    assert preprocess_grid(grid, trim=0.1).shape == (81, 64, 64, 1)
+
+@pytest.mark.parametrize("path", sorted(glob.glob("datasets/sudokus/*.jpg")), ids=os.path.basename)
+def test_downscaled_detection_matches_full_resolution(path):
+    """
+    Tests on every photo of the Sudoku dataset that detecting the grid on a downscaled copy
+    finds the same corners, in the same order, as full-resolution detection (within 1 pixel).
+    """
+
+    image = load_image(path)
+
+    full = find_grid_corners(image, max_side=0)
+    fast = find_grid_corners(image, max_side=800)
+
+    assert max(image.shape[:2]) > 800  # Detection really runs on a downscaled copy
+    assert fast.shape == (4, 2)
+    assert np.abs(full - fast).max() <= 1
+    # Top-left, top-right, bottom-right, bottom-left
+    assert full[0].sum() < full[2].sum() and full[1, 0] > full[3, 0] and full[1, 1] < full[3, 1]
+
+def test_find_all_grid_corners_on_a_multi_board_page():
+    """
+    Tests that every grid of a synthetic page is found once (not its boxes or cells), in
+    reading order, with corners in page coordinates, and that a single-board photo yields
+    the same grid as single-board detection.
+    """
+
+    image = load_image("tests/resources/inputs/easy.jpg")
+    grid = extract_grid_from_array(image)
+
+    page = np.full((1200, 1100, 3), 255, dtype=np.uint8)
+    origins = [(50, 60), (600, 40), (320, 640)]  # (x, y) of the top-left corner of each grid
+    for x, y in origins:
+        page[y:y + 450, x:x + 450] = grid
+
+    corners = find_all_grid_corners(page)
+
+    assert len(corners) == 3
+    for found, (x, y) in zip(corners, origins):
+        assert np.abs(found[0] - (x, y)).max() <= 3
+        assert np.abs(found[2] - (x + 449, y + 449)).max() <= 3
+
+    single = find_all_grid_corners(image)
+    assert len(single) == 1
+    assert np.abs(single[0] - find_grid_corners(image)).max() <= 2
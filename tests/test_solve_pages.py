@@ -0,0 +1,56 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the multi-board page CLI. Verifies that the boards of every page are solved     #
+# and written as one JSON line per page, in input order, including pages without any grid and    #
+# pages that cannot be read.                                                                     #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import io
+import json
+from src import solve_pages
+from solver.batch_solver import parse_board
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+EASY = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+HARD = "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......"
+
+def test_solve_pages_writes_one_line_per_page(monkeypatch):
+    """
+    Tests that every board of a page is solved, that pages are written in input order with
+    their board positions, and that empty and unreadable pages keep their place.
+    """
+
+    corners = [[0.0, 0.0], [450.0, 0.0], [450.0, 450.0], [0.0, 450.0]]
+    pages = {
+        "two.jpg": [{"corners": corners, "parsed_board": parse_board(EASY)},
+                    {"corners": corners, "parsed_board": parse_board(HARD)}],
+        "blank.jpg": [],
+        "one.jpg": [{"corners": corners, "parsed_board": parse_board(HARD)}],
+    }
+
+    def fake_read_pages(paths):
+        for path in paths:
+            yield path, pages[path] if path in pages else FileNotFoundError(f"Image not found: {path}")
+
+    monkeypatch.setattr(solve_pages, "read_pages", fake_read_pages)
+
+    sink = io.StringIO()
+    totals = solve_pages.solve_pages(["two.jpg", "missing.jpg", "blank.jpg", "one.jpg"], sink, workers=1)
+    lines = [json.loads(line) for line in sink.getvalue().splitlines()]
+
+    assert [line["image"] for line in lines] == ["two.jpg", "missing.jpg", "blank.jpg", "one.jpg"]
+    assert [len(line.get("boards", [])) for line in lines] == [2, 0, 0, 1]
+    assert "error" in lines[1]
+    assert totals["pages"] == 4 and totals["boards"] == 3 and totals["solved"] == 3 and totals["errors"] == 1
+
+    first = lines[0]["boards"][1]
+    assert first["index"] == 1 and first["corners"] == corners and first["solved"]
+    assert all(sorted(row) == list(range(1, 10)) for row in first["solved_board"])
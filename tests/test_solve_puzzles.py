@@ -0,0 +1,56 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the headless puzzle-file CLI. Verifies that puzzles are streamed from a text    #
+# input to one aligned output line each, with optional step/time columns, and that the CLI and   #
+# the vision pipeline import without loading TensorFlow.                                         #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import io
+import sys
+import subprocess
+from src.solve_puzzles import solve_stream
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def test_solve_stream_writes_one_line_per_puzzle():
+    """
+    Tests that comments and blank lines are skipped, solutions are written in input order,
+    malformed lines are reported as `invalid`, and the stats columns are appended.
+    """
+
+    source = io.StringIO(
+        "# puzzle bank\n"
+        "530070000600195000098000060800060003400803001700020006060000280000419005000080079\n"
+        "\n"
+        "too short\n"
+        "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......\n"
+    )
+    sink = io.StringIO()
+
+    totals = solve_stream(source, sink, workers=1, stats=True)
+    lines = sink.getvalue().splitlines()
+
+    assert totals["puzzles"] == 3 and totals["solved"] == 2 and totals["invalid"] == 1
+    assert len(lines) == 3
+    assert lines[0].split("\t")[0] == "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+    assert len(lines[0].split("\t")) == 3
+    assert lines[1] == "invalid"
+    assert lines[2].startswith("417369825")
+
+def test_imports_do_not_load_tensorflow():
+    """
+    Tests that importing the CLI and the vision pipeline defers TensorFlow until the model is used.
+    """
+
+    code = ("import sys, src.solve_puzzles, vision.image_parser; "
+            "sys.exit('tensorflow' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+
+    assert result.returncode == 0, result.stderr.decode()
@@ -64,3 +64,83 @@ def test_solver_rejects_invalid_board():
     solved = solver.solve()
 
     assert not solved, "Solver should fail on an invalid puzzle"
+
+def test_solver_solution_satisfies_all_constraints():
+    """
+    Tests that the bitmask-based solver produces a board where every row, column and
+    3x3 box contains the digits 1–9 exactly once, and that the givens are preserved.
+    """
+
+    puzzle = "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......"
+    board = [[int(c) if c != "." else 0 for c in puzzle[r * 9:(r + 1) * 9]] for r in range(9)]
+    givens = [row[:] for row in board]
+
+    solver = SudokuSolver(board)
+    assert solver.solve(verbose=False), "Solver failed to solve a hard puzzle"
+
+    solved = solver.get_board()
+    units = [solved[i] for i in range(9)]
+    units += [[solved[i][j] for i in range(9)] for j in range(9)]
+    units += [[solved[r][c] for r in range(br, br + 3) for c in range(bc, bc + 3)]
+              for br in (0, 3, 6) for bc in (0, 3, 6)]
+
+    assert all(sorted(unit) == list(range(1, 10)) for unit in units)
+    assert all(solved[i][j] == givens[i][j] for i in range(9) for j in range(9) if givens[i][j])
+
+def test_solver_propagation_solves_easy_board_without_guesses():
+    """
+    Tests that the logical propagation stage alone solves an easy puzzle, and that the
+    techniques applied are reported in `technique_counts`.
+    """
+
+    puzzle = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+    board = [[int(c) for c in puzzle[r * 9:(r + 1) * 9]] for r in range(9)]
+
+    solver = SudokuSolver(board)
+
+    assert solver.solve(verbose=False)
+    assert solver.guesses == 0 and solver.steps == 0
+    assert sum(solver.technique_counts.values()) == puzzle.count("0")
+    assert all(entry["technique"] in ("naked_single", "hidden_single") for entry in solver.final_trace)
+
+def test_solver_count_solutions_detects_ambiguous_boards():
+    """
+    Tests that `count_solutions` stops at the limit, distinguishes unique from ambiguous
+    boards, and leaves the first solution found on the board.
+    """
+
+    puzzle = "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......"
+    unique_board = [[int(c) if c != "." else 0 for c in puzzle[r * 9:(r + 1) * 9]] for r in range(9)]
+    ambiguous_board = [row[:] for row in unique_board]
+    ambiguous_board[0][0] = 0  # Removing a given opens up a second solution
+
+    unique_solver = SudokuSolver(unique_board)
+    assert unique_solver.count_solutions(limit=2, verbose=False) == 1
+    assert all(v for row in unique_solver.get_board() for v in row)
+
+    ambiguous_solver = SudokuSolver(ambiguous_board)
+    assert ambiguous_solver.count_solutions(limit=2, verbose=False) == 2
+    assert all(v for row in ambiguous_solver.get_board() for v in row)
+
+    assert SudokuSolver([[0] * 9 for _ in range(9)]).count_solutions(limit=5, verbose=False) == 5
+
+def test_solver_reports_progress_to_subscriber():
+    """
+    Tests that a progress callback receives periodic search snapshots, and that a solver
+    without subscriber never schedules a report.
+    """
+
+    puzzle = "..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1........4...9"
+    board = [[int(c) if c != "." else 0 for c in puzzle[r * 9:(r + 1) * 9]] for r in range(9)]
+
+    reports = []
+    solver = SudokuSolver([row[:] for row in board], propagate=False)
+    solver.set_progress_callback(reports.append, interval=500)
+    assert solver.solve(verbose=False)
+
+    assert len(reports) == solver.steps // 500
+    assert [report["steps"] for report in reports] == [500 * (i + 1) for i in range(len(reports))]
+    assert all(0 <= report["depth"] <= 81 - solver.givens for report in reports)
+    assert all(report["fill_ratio"] == round(report["filled"] / 81, 3) for report in reports)
+
+    assert SudokuSolver([row[:] for row in board])._progress_at == -1
@@ -0,0 +1,85 @@
+##################################################################################################
+#                                       TEST OVERVIEW                                            #
+#                                                                                                #
+# Unit tests for the bounded worker pool used by the API. Verifies that jobs run off the         #
+# calling thread, that submissions beyond the queue depth are rejected, that slots are           #
+# released once jobs finish, and that process workers are not forked from the server.            #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import asyncio
+import threading
+import pytest
+from utils.worker_pool import BoundedWorkerPool, PoolSaturatedError
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def test_pool_rejects_jobs_beyond_capacity_and_recovers():
+    """
+    Tests that a pool with 1 worker and 1 queued slot accepts two jobs, rejects the third,
+    and accepts new jobs again after the running ones complete.
+    """
+
+    pool = BoundedWorkerPool("thread", max_workers=1, max_queued=1)
+    release = threading.Event()
+
+    try:
+        first = pool.submit(release.wait)
+        second = pool.submit(release.wait)
+
+        with pytest.raises(PoolSaturatedError):
+            pool.submit(release.wait)
+        assert pool.rejected == 1
+
+        release.set()
+        first.result(timeout=5)
+        second.result(timeout=5)
+
+        assert pool.submit(sum, [1, 2, 3]).result(timeout=5) == 6
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert pool.in_flight == 0
+
+def test_pool_run_awaits_result_from_worker_thread():
+    """
+    Tests that `run` executes the job in a worker thread and returns its result to async code.
+    """
+
+    pool = BoundedWorkerPool("thread", max_workers=2)
+
+    try:
+        worker = asyncio.run(pool.run(threading.current_thread))
+    finally:
+        pool.shutdown()
+
+    assert worker is not threading.current_thread()
+
+def test_pool_rejects_unknown_kind():
+    """
+    Tests that only thread and process pools can be created.
+    """
+
+    with pytest.raises(ValueError):
+        BoundedWorkerPool("fiber")
+
+def test_process_pool_does_not_fork_the_server():
+    """
+    Tests that process workers are not started with fork, which would copy locks held by the
+    server's other threads into the children.
+    """
+
+    pool = BoundedWorkerPool("process", max_workers=1)
+
+    try:
+        assert pool.submit(sum, [1, 2, 3]).result(timeout=30) == 6
+    finally:
+        pool.shutdown()
+
+    assert pool._executor._mp_context.get_start_method() in ("forkserver", "spawn")
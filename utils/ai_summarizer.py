@@ -3,6 +3,14 @@
 #                                                                                                #
 # This module reads a Sudoku solving trace (JSON format) and uses OpenAI's API to generate       #
 # a natural language summary of the solving process.                                             #
+#                                                                                                #
+# Summaries can be generated out of band with `generate_summary_async`, which runs the LLM call  #
+# in a background thread and coalesces concurrent requests with the same prompt inputs into one  #
+# call. Successful responses are cached on disk, keyed by the prompt inputs (filled cells,       #
+# steps and a duration bucket), so repeated puzzles never pay for a second round trip.           #
+#                                                                                                #
+# The OpenAI client is created lazily on first use; `set_client` plugs in any object exposing    #
+# `chat.completions.create` (e.g. a local stub in tests).                                        #
 ##################################################################################################
 
 ##################################################################################################
@@ -11,8 +19,12 @@
 
 import os
 import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
 from dotenv import load_dotenv
-from openai import OpenAI
+from utils.config import SUMMARY_CACHE_DIR, SUMMARY_DURATION_BUCKET
+from utils.metrics import timed, inc
 
 ##################################################################################################
 #                                        CONFIGURATION                                           #
@@ -22,12 +34,136 @@ from openai import OpenAI
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+MODEL = "gpt-4"
+CACHE_DIR = SUMMARY_CACHE_DIR  # Set to None to disable the disk cache
+
+client = None  # Created on first use by get_client(), or injected with set_client()
+_client_lock = threading.Lock()
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="llm-summary")
+_in_flight = {}  # Cache key → Future of the pending LLM call
+_in_flight_lock = threading.Lock()
 
 ##################################################################################################
 #                                        IMPLEMENTATION                                          #
 ##################################################################################################
 
+def get_client():
+    """
+    Returns the LLM client, creating the OpenAI client on the first call.
+
+    Returns:
+        OpenAI: Client exposing `chat.completions.create`.
+    """
+
+    global client
+
+    if client is None:
+        with _client_lock:
+            if client is None:
+                from openai import OpenAI
+                client = OpenAI(api_key=OPENAI_API_KEY)
+    return client
+
+def set_client(new_client):
+    """
+    Replaces the LLM client, e.g. with a local stub for tests or offline runs.
+
+    Args:
+        new_client: Object exposing `chat.completions.create(model, messages, ...)`, or None
+            to go back to the lazily created OpenAI client.
+    """
+
+    global client
+    client = new_client
+
+def _cache_key(filled_cells: int, steps: int, duration: float) -> str:
+    """
+    Hashes the prompt inputs (and the model) into a cache key.
+    """
+
+    payload = json.dumps([MODEL, filled_cells, steps, duration])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def _bucket(duration: float) -> float:
+    """
+    Rounds a solving time to the cache bucket, so near-identical runs share a summary.
+    """
+
+    return round(round(duration / SUMMARY_DURATION_BUCKET) * SUMMARY_DURATION_BUCKET, 4)
+
+def summarize(filled_cells: int, steps: int, duration: float) -> str:
+    """
+    Returns the LLM summary for the given solving metrics, from the disk cache when available.
+
+    Args:
+        filled_cells (int): Number of cells filled by the solver.
+        steps (int): Total number of recursive steps taken by the solver.
+        duration (float): Total solving time in seconds.
+
+    Returns:
+        str: A summary generated by the LLM, or an error message if the call fails.
+    """
+
+    duration = _bucket(duration)
+    key = _cache_key(filled_cells, steps, duration)
+    cache_path = os.path.join(CACHE_DIR, f"{key}.json") if CACHE_DIR else None
+
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r") as f:
+                summary = json.load(f)["summary"]
+            inc("sudoku_summary_cache_total", result="hit")
+            return summary
+        except (OSError, ValueError, KeyError):
+            pass  # Unreadable entry: regenerate it
+
+    prompt = f"""
+        You are a Sudoku expert analyzing how a specific puzzle was solved.
+
+        A solver has completed a puzzle by filling {filled_cells} empty cells. The process involved {steps} recursive steps and took {duration:.2f} seconds.
+
+        Write a concise and informative summary (3–5 sentences) focused only on this specific puzzle and its resolution. Include:
+        - An estimation of the puzzle's difficulty.
+        - A short analysis of how the puzzle was approached (e.g., constraint-focused, regional clustering).
+        - Observations on time and efficiency.
+
+        Avoid general comments about the solver or suggestions for improvement. Focus strictly on interpreting the trace and performance of this specific resolution.
+        Use a professional and neutral tone.
+    """
+
+    inc("sudoku_summary_cache_total", result="miss")
+    try:
+        with timed("llm_summary", model=MODEL):
+            response = get_client().chat.completions.create(
+                model=MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.7,
+                max_tokens=300
+            )
+        summary = response.choices[0].message.content.strip()
+    except Exception as e:
+        inc("sudoku_summary_failures_total")
+        return f"⚠️ LLM call failed: {e}"
+
+    if cache_path:
+        # Write then rename, so concurrent processes never read a partial entry
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"summary": summary}, f)
+        os.replace(tmp_path, cache_path)
+
+    return summary
+
+def _count_filled_cells(trace_path: str) -> int:
+    """
+    Reads a solving trace and returns the number of placed cells.
+    """
+
+    with open(trace_path, "r") as f:
+        return len(json.load(f))
+
 def generate_summary_from_trace(trace_path: str, steps: int, duration: float) -> str:
     """
     Generates a natural language summary of a Sudoku solving process using an LLM.
@@ -47,34 +183,66 @@ def generate_summary_from_trace(trace_path: str, steps: int, duration: float) ->
     """
 
     try:
-        with open(trace_path, "r") as f:
-            trace = json.load(f)
+        filled_cells = _count_filled_cells(trace_path)
     except Exception as e:
         return f"⚠️ Failed to read trace file: {e}"
 
-    filled_cells = len(trace)
+    return summarize(filled_cells, steps, duration)
 
-    prompt = f"""
-        You are a Sudoku expert analyzing how a specific puzzle was solved.
-    
-        A solver has completed a puzzle by filling {filled_cells} empty cells. The process involved {steps} recursive steps and took {duration:.2f} seconds.
-    
-        Write a concise and informative summary (3–5 sentences) focused only on this specific puzzle and its resolution. Include:
-        - An estimation of the puzzle's difficulty.
-        - A short analysis of how the puzzle was approached (e.g., constraint-focused, regional clustering).
-        - Observations on time and efficiency.
-    
-        Avoid general comments about the solver or suggestions for improvement. Focus strictly on interpreting the trace and performance of this specific resolution.
-        Use a professional and neutral tone.
+def generate_summary_async(trace_path: str, steps: int, duration: float):
+    """
+    Generates the summary of a solving trace in the background (see `summarize_async`).
+
+    Args:
+        trace_path (str): Path to the *_solution_trace.json file.
+        steps (int): Total number of recursive steps taken by the solver.
+        duration (float): Total solving time in seconds.
+
+    Returns:
+        concurrent.futures.Future: Resolves to the summary (or an error message).
     """
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=300
-        )
-        return response.choices[0].message.content.strip()
+        filled_cells = _count_filled_cells(trace_path)
     except Exception as e:
-        return f"⚠️ LLM call failed: {e}"
+        future = Future()
+        future.set_result(f"⚠️ Failed to read trace file: {e}")
+        return future
+
+    return summarize_async(filled_cells, steps, duration)
+
+def summarize_async(filled_cells: int, steps: int, duration: float):
+    """
+    Generates the summary for the given solving metrics in the background.
+
+    Concurrent calls with the same prompt inputs share a single LLM call.
+
+    Args:
+        filled_cells (int): Number of cells filled by the solver.
+        steps (int): Total number of recursive steps taken by the solver.
+        duration (float): Total solving time in seconds.
+
+    Returns:
+        concurrent.futures.Future: Resolves to the summary (or an error message).
+    """
+
+    key = _cache_key(filled_cells, steps, _bucket(duration))
+
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        if future is not None:
+            return future
+        future = _executor.submit(summarize, filled_cells, steps, duration)
+        _in_flight[key] = future
+
+    # Registered outside the lock: it runs immediately if the call has already finished
+    future.add_done_callback(lambda _: _forget(key))
+    return future
+
+def _forget(key: str):
+    """
+    Drops a finished call from the in-flight table.
+    """
+
+    with _in_flight_lock:
+        _in_flight.pop(key, None)
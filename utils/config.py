@@ -10,6 +10,7 @@
 #                                            IMPORTS                                             #
 ##################################################################################################
 
+import os
 from pathlib import Path
 
 ##################################################################################################
@@ -24,3 +25,64 @@ OUTPUT_DIR = Path.home() / "Downloads" / "AISudokuSolver"
 
 # Ensure the directory exists
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Sudoku solving backend used by the CLI and the API ("backtracking" or "dlx")
+SOLVER_BACKEND = os.getenv("SUDOKU_SOLVER_BACKEND", "backtracking")
+
+# Cross-request micro-batching of CNN inference in the API
+INFERENCE_MICRO_BATCHING = os.getenv("INFERENCE_MICRO_BATCHING", "1") == "1"
+INFERENCE_MAX_BATCH_SIZE = int(os.getenv("INFERENCE_MAX_BATCH_SIZE", "810"))  # Cells (10 boards)
+INFERENCE_MAX_WAIT_MS = float(os.getenv("INFERENCE_MAX_WAIT_MS", "5"))
+
+# Load the CNN model at API startup instead of on the first request
+MODEL_PREWARM = os.getenv("MODEL_PREWARM", "1") == "1"
+
+# CNN inference runtime ("keras", "tflite" or "onnx"; see cnn_classifier/export_model.py)
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "keras")
+INFERENCE_MODEL_PATH = os.getenv("INFERENCE_MODEL_PATH") or None  # Defaults to cnn_classifier/model/
+
+# Worker pool running the blocking /solve pipeline off the API event loop
+API_WORKER_POOL = os.getenv("API_WORKER_POOL", "thread")  # "thread" or "process"
+API_WORKERS = int(os.getenv("API_WORKERS", "0")) or None  # Defaults to the CPU count
+API_MAX_QUEUED = int(os.getenv("API_MAX_QUEUED", "16"))  # Waiting jobs before answering 503
+
+# Content-addressed /solve result cache: entries per in-memory LRU, optional SQLite file
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "1024"))
+RESULT_CACHE_DB = os.getenv("RESULT_CACHE_DB") or None
+
+# Disk cache of LLM summaries (keyed by prompt inputs) and its solving-time bucket in seconds
+SUMMARY_CACHE_DIR = str(OUTPUT_DIR / "summary_cache")
+SUMMARY_DURATION_BUCKET = float(os.getenv("SUMMARY_DURATION_BUCKET", "0.05"))
+
+# API report artifacts: default mode ("none", "trace" or "full") and sink ("filesystem",
+# "memory" or "inline"), both overridable per request; entries kept by the memory sink
+REPORT_MODE = os.getenv("REPORT_MODE", "none")
+REPORT_SINK = os.getenv("REPORT_SINK", "filesystem")
+REPORT_MEMORY_ENTRIES = int(os.getenv("REPORT_MEMORY_ENTRIES", "256"))
+
+# /solve/batch: images whose cells share one CNN forward pass, and maximum images per request
+BATCH_CHUNK_IMAGES = int(os.getenv("BATCH_CHUNK_IMAGES", "32"))
+BATCH_MAX_IMAGES = int(os.getenv("BATCH_MAX_IMAGES", "2000"))
+
+# In-process stage timers and counters exported at /metrics
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+
+# Skip the CNN for cells the ink-density gate detects as empty (vision/cell_filter.py)
+EMPTY_CELL_GATE = os.getenv("EMPTY_CELL_GATE", "1") == "1"
+
+# Fraction of each cell's border trimmed before the CNN (0 matches the training preprocessing)
+CELL_BORDER_TRIM = float(os.getenv("CELL_BORDER_TRIM", "0"))
+
+# Longest image side used to detect the grid (larger photos are downscaled first; 0 disables)
+DETECTION_MAX_SIDE = int(os.getenv("DETECTION_MAX_SIDE", "800"))
+
+# Multi-board pages: longest side used for detection, minimum grid area (share of the page) and
+# maximum side ratio of a grid candidate
+PAGE_DETECTION_MAX_SIDE = int(os.getenv("PAGE_DETECTION_MAX_SIDE", "1600"))
+PAGE_MIN_GRID_AREA = float(os.getenv("PAGE_MIN_GRID_AREA", "0.01"))
+PAGE_MAX_GRID_ASPECT = float(os.getenv("PAGE_MAX_GRID_ASPECT", "1.4"))
+
+# Frame streams (vision/frame_stream.py): consecutive frames with the same board before it is
+# solved, and frames between two full grid detections while the grid is being tracked
+STREAM_STABLE_FRAMES = int(os.getenv("STREAM_STABLE_FRAMES", "5"))
+STREAM_REDETECT_FRAMES = int(os.getenv("STREAM_REDETECT_FRAMES", "30"))
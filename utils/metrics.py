@@ -0,0 +1,205 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module provides lightweight in-process metrics: counters, gauges and histograms, keyed by #
+# name and labels, rendered in the Prometheus text exposition format (served by app.py /metrics).#
+#                                                                                                #
+# Pipeline stages are timed with `timed`, usable as a decorator or a context manager:            #
+#                                                                                                #
+#     @timed("warp_perspective")              with timed("solve", backend="dlx"):                #
+#     def warp_perspective(...): ...              solver.solve()                                 #
+#                                                                                                #
+# Durations go to the `sudoku_stage_duration_seconds` histogram with a `stage` label. Recording  #
+# costs two perf_counter calls, one lock and a bisect, so it is left on in production; set       #
+# METRICS_ENABLED=0 to turn every timer into a no-op. Metrics are per process: stages running    #
+# in process pool workers (batch solving) are not visible to the API process.                    #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import time
+import threading
+import functools
+from bisect import bisect_left
+from utils.config import METRICS_ENABLED
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+STAGE_SECONDS = "sudoku_stage_duration_seconds"
+
+# Upper bounds in seconds, from sub-millisecond cell work to multi-second LLM calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HELP = {
+    STAGE_SECONDS: "Duration of pipeline stages in seconds.",
+}
+
+_lock = threading.Lock()
+_counters = {}  # (name, labels) → value
+_gauges = {}  # (name, labels) → value
+_histograms = {}  # (name, labels) → [bucket counts..., +Inf count, sum]
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def _key(name: str, labels: dict) -> tuple:
+    """
+    Builds the registry key of a metric (labels sorted by name).
+    """
+
+    return name, tuple(sorted(labels.items()))
+
+def inc(name: str, amount: float = 1, **labels):
+    """
+    Increments a counter.
+
+    Args:
+        name (str): Metric name (conventionally ending in `_total`).
+        amount (float): Value to add.
+        **labels: Label values, e.g. `stage="solve"`.
+    """
+
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+def set_gauge(name: str, value: float, **labels):
+    """
+    Sets a gauge to the given value.
+    """
+
+    with _lock:
+        _gauges[_key(name, labels)] = value
+
+def observe(name: str, value: float, **labels):
+    """
+    Records a value in a histogram with DEFAULT_BUCKETS.
+
+    Args:
+        name (str): Metric name.
+        value (float): Observed value (e.g. a duration in seconds).
+        **labels: Label values.
+    """
+
+    key = _key(name, labels)
+    index = bisect_left(DEFAULT_BUCKETS, value)
+    with _lock:
+        series = _histograms.get(key)
+        if series is None:
+            series = _histograms[key] = [0] * (len(DEFAULT_BUCKETS) + 1) + [0.0]
+        series[index] += 1
+        series[-1] += value
+
+class timed:
+    """
+    Times a block or a function into the stage duration histogram.
+    """
+
+    __slots__ = ("stage", "labels", "_start")
+
+    def __init__(self, stage: str, **labels):
+        """
+        Args:
+            stage (str): Stage name, exported as the `stage` label.
+            **labels: Additional labels, e.g. the solver backend.
+        """
+
+        self.stage = stage
+        self.labels = labels
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if METRICS_ENABLED:
+            observe(STAGE_SECONDS, time.perf_counter() - self._start, stage=self.stage, **self.labels)
+        return False
+
+    def __call__(self, fn):
+        """
+        Decorator form: times every call of `fn`.
+        """
+
+        if not METRICS_ENABLED:
+            return fn
+
+        stage, labels = self.stage, self.labels
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(STAGE_SECONDS, time.perf_counter() - start, stage=stage, **labels)
+
+        return wrapper
+
+def _format_labels(labels: tuple, extra: tuple = ()) -> str:
+    """
+    Formats label pairs as `{name="value",...}` (empty string without labels).
+    """
+
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+def render_prometheus() -> str:
+    """
+    Renders every metric in the Prometheus text exposition format (version 0.0.4).
+
+    Returns:
+        str: Exposition text, one `# TYPE` block per metric name.
+    """
+
+    with _lock:
+        counters = dict(_counters)
+        gauges = dict(_gauges)
+        histograms = {key: list(series) for key, series in _histograms.items()}
+
+    lines = []
+
+    def header(name, kind):
+        if name in HELP:
+            lines.append(f"# HELP {name} {HELP[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    for kind, series in (("counter", counters), ("gauge", gauges)):
+        for name in sorted({name for name, _ in series}):
+            header(name, kind)
+            for (metric, labels), value in sorted(series.items()):
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+
+    for name in sorted({name for name, _ in histograms}):
+        header(name, "histogram")
+        for (metric, labels), series in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(DEFAULT_BUCKETS + ("+Inf",), series[:-1]):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels, (('le', bound),))} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {series[-1]}")
+            lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+
+    return "\n".join(lines) + "\n"
+
+def reset():
+    """
+    Clears every metric (e.g. between tests).
+    """
+
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _histograms.clear()
@@ -0,0 +1,160 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module defines where API report artifacts (solution trace, Markdown report, input image)  #
+# are delivered. Artifacts are passed around as a dict of file name → content (str or bytes).    #
+#                                                                                                #
+# Available sinks:                                                                               #
+#   - filesystem → queued and written to OUTPUT_DIR in batches by a background thread, so the    #
+#                  request path never waits on disk I/O                                          #
+#   - memory     → kept in a bounded in-process store, retrievable by name                       #
+#   - inline     → returned to the caller, to be embedded in the HTTP response                   #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import os
+import base64
+import queue
+import threading
+from collections import OrderedDict
+from utils.logs_config import logger
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+class FilesystemSink:
+    """
+    Writes artifacts to a directory asynchronously, in batches, from a background thread.
+    """
+
+    name = "filesystem"
+
+    def __init__(self, directory, max_batch: int = 64):
+        """
+        Initializes the sink and starts its writer thread.
+
+        Args:
+            directory (str | Path): Destination directory.
+            max_batch (int): Maximum number of files written per wake-up of the writer thread.
+        """
+
+        self.directory = str(directory)
+        self.max_batch = max_batch
+        self.files_written = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="report-writer", daemon=True)
+        self._thread.start()
+
+    def emit(self, artifacts: dict):
+        """
+        Queues artifacts for writing and returns immediately.
+
+        Args:
+            artifacts (dict[str, str | bytes]): File name → content. A later emit with the same
+                name overwrites the file (e.g. a report completed with its summary).
+        """
+
+        for filename, content in artifacts.items():
+            self._queue.put((filename, content))
+
+    def flush(self):
+        """
+        Blocks until every queued artifact has been written.
+        """
+
+        self._queue.join()
+
+    def _run(self):
+        """
+        Writer loop: waits for the first pending file, then drains up to `max_batch` files.
+        """
+
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for filename, content in batch:
+                try:
+                    self._write(filename, content)
+                    self.files_written += 1
+                except OSError:
+                    logger.exception(f"❌ Could not write report artifact {filename}")
+                finally:
+                    self._queue.task_done()
+
+    def _write(self, filename: str, content):
+        """
+        Writes one file atomically (write then rename).
+        """
+
+        path = os.path.join(self.directory, filename)
+        tmp_path = f"{path}.tmp"
+        mode = "wb" if isinstance(content, bytes) else "w"
+        with open(tmp_path, mode) as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+class MemorySink:
+    """
+    Keeps the most recent artifacts in memory (no disk I/O), retrievable by file name.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries (int): Maximum number of artifacts kept; the oldest are dropped first.
+        """
+
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def emit(self, artifacts: dict):
+        """
+        Stores artifacts, replacing any previous content under the same name.
+        """
+
+        with self._lock:
+            for filename, content in artifacts.items():
+                self._entries[filename] = content
+                self._entries.move_to_end(filename)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, filename: str):
+        """
+        Returns a stored artifact, or None if unknown or already evicted.
+        """
+
+        with self._lock:
+            return self._entries.get(filename)
+
+class InlineSink:
+    """
+    Returns artifacts to the caller as JSON-serializable values instead of storing them.
+    """
+
+    name = "inline"
+
+    def emit(self, artifacts: dict) -> dict:
+        """
+        Converts artifacts for a JSON response (binary content is base64-encoded).
+
+        Returns:
+            dict[str, str]: File name → text content.
+        """
+
+        return {
+            filename: base64.b64encode(content).decode() if isinstance(content, bytes) else content
+            for filename, content in artifacts.items()
+        }
@@ -10,6 +10,9 @@
 #   - A summary of the solving process and performance metrics                                   #
 #                                                                                                #
 # Output is saved under `outputs/` using the image's filename as base.                           #
+#                                                                                                #
+# The report is written right away with a placeholder in place of the LLM summary, which is      #
+# generated in the background and filled in as soon as it is available.                          #
 ##################################################################################################
 
 ##################################################################################################
@@ -21,64 +24,52 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 from utils.logs_config import logger
-from utils.ai_summarizer import generate_summary_from_trace
+from utils.ai_summarizer import generate_summary_async
 from utils.config import OUTPUT_DIR
+from utils.metrics import timed
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+SUMMARY_PLACEHOLDER = "_⏳ The AI summary is being generated and will appear here shortly._"
 
 ##################################################################################################
 #                                        IMPLEMENTATION                                          #
 ##################################################################################################
 
-def save_solution_report(input_board, solved_board, bckt_metrics, image_path):
+def format_board_table(board):
+    """
+    Formats a 9x9 Sudoku board as a Markdown table for visual display in the report.
     """
-    Generates a Markdown report summarizing the Sudoku solving process.
+
+    rows = []
+    for i, row in enumerate(board):
+        formatted_row = [str(val) if val != 0 else " " for val in row]
+        row_line = "| " + " | ".join(formatted_row) + " |"
+        rows.append(row_line)
+    header = rows[0]
+    num_cols = header.count('|') - 1
+    separator = "|" + "---|" * num_cols
+    return "\n".join([header, separator] + rows[1:])
+
+@timed("render_report")
+def render_report(input_board, solved_board, bckt_metrics, image_filename: str,
+                  summary: str = SUMMARY_PLACEHOLDER) -> str:
+    """
+    Renders the Markdown report of a solved Sudoku.
 
     Args:
         input_board (list[list[int]]): Board parsed automatically from the image.
         solved_board (list[list[int]]): Final solved board.
         bckt_metrics (dict): Dictionary with backtracking performance data.
-        image_path (str): Path to the input image used for board extraction.
+        image_filename (str): Name of the input image, relative to the report.
+        summary (str): LLM summary, or a placeholder while it is being generated.
 
-    Output:
-        Saves a Markdown file in `outputs/` describing the entire solving pipeline.
+    Returns:
+        str: Markdown content.
     """
 
-    base_name = os.path.splitext(os.path.basename(image_path))[0]
-    report_name = f"{base_name}_REPORT.md"
-    report_path = str(OUTPUT_DIR / report_name)
-
-    # Normalize and resolve absolute path
-    image_path = Path(image_path).resolve()
-    image_ext = image_path.suffix
-
-    image_filename = f"{base_name}_input{image_ext}"
-    local_img_path = OUTPUT_DIR / image_filename
-
-    # Copy only if it's not already in OUTPUT_DIR with correct name
-    if image_path != local_img_path.resolve():
-        shutil.copy(image_path, local_img_path)
-
-    def format_board_table(board):
-        """
-        Formats a 9x9 Sudoku board as a Markdown table for visual display in the report.
-        """
-
-        rows = []
-        for i, row in enumerate(board):
-            formatted_row = [str(val) if val != 0 else " " for val in row]
-            row_line = "| " + " | ".join(formatted_row) + " |"
-            rows.append(row_line)
-        header = rows[0]
-        num_cols = header.count('|') - 1
-        separator = "|" + "---|" * num_cols
-        return "\n".join([header, separator] + rows[1:])
-
-    # Generate summary using solving trace
-    summary = generate_summary_from_trace(
-        trace_path=str(OUTPUT_DIR / f"{base_name}_solution_trace.json"),
-        steps=bckt_metrics["steps"],
-        duration=bckt_metrics["duration"]
-    )
-
     lines = []
     lines.append(f"# Sudoku Solver Report\n")
     lines.append(f"**Solved at:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -100,22 +91,102 @@ def save_solution_report(input_board, solved_board, bckt_metrics, image_path):
 
     lines.append("---\n")
 
-    lines.append("## Final Solved Board (Backtracking)\n")
-    lines.append("Completed Sudoku board after applying the backtracking algorithm.\n")
+    method = bckt_metrics.get("method", "Backtracking")
+
+    lines.append(f"## Final Solved Board ({method})\n")
+    lines.append(f"Completed Sudoku board after applying the {method} algorithm.\n")
     lines.append(format_board_table(solved_board) + "\n")
     lines.append("---\n")
 
-    lines.append("## Backtracking Performance\n")
+    lines.append(f"## {method} Performance\n")
     lines.append("Summary of solver performance, including total steps and execution time.\n")
     lines.append("| Solved | Steps | Time (s) |")
     lines.append("|--------|-------|----------|")
     lines.append(f"| {'Yes' if bckt_metrics['solved'] else 'No'} | {bckt_metrics['steps']} | {bckt_metrics['duration']:.4f} |")
 
+    return "\n".join(lines)
+
+def fill_summary(report_path: str, summary: str):
+    """
+    Replaces the summary placeholder of a saved report with the generated summary.
+
+    Args:
+        report_path (str): Path to the Markdown report.
+        summary (str): Summary text.
+    """
+
+    try:
+        with open(report_path, "r") as f:
+            content = f.read()
+
+        # Write then rename, so readers never see a half-written report
+        tmp_path = f"{report_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(content.replace(SUMMARY_PLACEHOLDER, summary, 1))
+        os.replace(tmp_path, report_path)
+    except OSError:
+        logger.exception(f"❌ Could not add the summary to {report_path}")
+
+@timed("save_report")
+def save_solution_report(input_board, solved_board, bckt_metrics, image_path, image_bytes: bytes = None,
+                         wait_for_summary: bool = False):
+    """
+    Generates a Markdown report summarizing the Sudoku solving process.
+
+    Args:
+        input_board (list[list[int]]): Board parsed automatically from the image.
+        solved_board (list[list[int]]): Final solved board.
+        bckt_metrics (dict): Dictionary with backtracking performance data.
+        image_path (str): Path to the input image used for board extraction. When `image_bytes`
+            is given, only its name is used (the file does not need to exist).
+        image_bytes (bytes): Encoded input image held in memory (e.g. an API upload). It is
+            written directly to the outputs directory instead of copying `image_path`.
+        wait_for_summary (bool): If True, blocks until the summary has been written to the report.
+
+    Returns:
+        concurrent.futures.Future: Resolves to the summary once it is generated.
+
+    Output:
+        Saves a Markdown file in `outputs/` describing the entire solving pipeline.
+    """
+
+    base_name = os.path.splitext(os.path.basename(image_path))[0]
+    report_name = f"{base_name}_REPORT.md"
+    report_path = str(OUTPUT_DIR / report_name)
+
+    # Normalize and resolve absolute path
+    image_path = Path(image_path).resolve()
+    image_ext = image_path.suffix
+
+    image_filename = f"{base_name}_input{image_ext}"
+    local_img_path = OUTPUT_DIR / image_filename
+
+    if image_bytes is not None:
+        local_img_path.write_bytes(image_bytes)
+
+    # Copy only if it's not already in OUTPUT_DIR with correct name
+    elif image_path != local_img_path.resolve():
+        shutil.copy(image_path, local_img_path)
+
+    # Generate summary using solving trace (in the background)
+    summary_future = generate_summary_async(
+        trace_path=str(OUTPUT_DIR / f"{base_name}_solution_trace.json"),
+        steps=bckt_metrics["steps"],
+        duration=bckt_metrics["duration"]
+    )
+
     with open(report_path, "w") as f:
-        f.write("\n".join(lines))
+        f.write(render_report(input_board, solved_board, bckt_metrics, image_filename))
 
     logger.info(f"\nReport saved to: {report_path}")
 
+    if wait_for_summary:
+        fill_summary(report_path, summary_future.result())
+    else:
+        summary_future.add_done_callback(lambda future: fill_summary(report_path, future.result()))
+
+    return summary_future
+
 def generate_trace_filename(image_path: str) -> str:
     """
     Creates a standard filename for saving the solution trace of a Sudoku image.
@@ -0,0 +1,233 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module implements the content-addressed result cache used by the API.                     #
+#                                                                                                #
+# Two LRU caches are kept:                                                                       #
+#   - images → hash of the uploaded bytes → parsed 9x9 board (skips segmentation and the CNN)    #
+#   - boards → solver backend + 81-character board → solution and metrics (skips the solver)     #
+#                                                                                                #
+# Each cache has an in-memory LRU tier with a size limit and an optional SQLite tier, shared by  #
+# all API processes and persistent across restarts. Values must be JSON-serializable.            #
+# Disk writes are batched by a background writer thread, and `aget` runs disk lookups in a       #
+# worker thread, so that only the in-memory tier is touched from the event loop.                 #
+# Hit/miss counters are kept per cache and exposed through `stats()`.                            #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import json
+import queue
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from utils.logs_config import logger
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def image_key(image_bytes: bytes) -> str:
+    """
+    Returns the content hash used as cache key for an uploaded image.
+
+    Args:
+        image_bytes (bytes): Encoded image content.
+
+    Returns:
+        str: 32-character hex digest (BLAKE2b, faster than SHA-256 on large uploads).
+    """
+
+    return hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with an optional SQLite tier.
+    """
+
+    def __init__(self, name: str, max_size: int = 1024, db_path: str = None, max_batch: int = 256):
+        """
+        Initializes the cache, and the writer thread of its on-disk tier if configured.
+
+        Args:
+            name (str): Cache name, also used as the SQLite table name.
+            max_size (int): Maximum number of entries kept in memory (0 disables the memory tier).
+            db_path (str): SQLite database file for the on-disk tier (None for memory only).
+            max_batch (int): Maximum number of entries written per SQLite transaction.
+        """
+
+        self.name = name
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_batch = max_batch
+        self._db = None
+        self._db_lock = threading.Lock()  # Serializes the SQLite connection (readers and writer)
+        self._writes = queue.Queue()
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(f"CREATE TABLE IF NOT EXISTS {name} (key TEXT PRIMARY KEY, value TEXT)")
+            self._db.commit()
+            threading.Thread(target=self._run_writer, name=f"{name}-cache-writer", daemon=True).start()
+
+    def get(self, key: str):
+        """
+        Looks up a key, promoting on-disk hits into the memory tier.
+
+        Blocks on SQLite for keys missing from memory: use `aget` from the event loop.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Cached value, or None on a miss.
+        """
+
+        found, value = self._get_memory(key)
+        if found:
+            return value
+        return self._count(key, self._load(key))
+
+    async def aget(self, key: str):
+        """
+        Looks up a key like `get`, running the on-disk lookup (if any) in a worker thread so
+        that the event loop only touches the memory tier.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Cached value, or None on a miss.
+        """
+
+        found, value = self._get_memory(key)
+        if found:
+            return value
+        if self._db is not None:
+            value = await asyncio.to_thread(self._load, key)
+        return self._count(key, value)
+
+    def put(self, key: str, value):
+        """
+        Stores a value in the memory tier (evicting the least recently used entry if full) and
+        queues it for the on-disk tier, if configured. Never blocks on disk I/O.
+
+        Args:
+            key (str): Cache key.
+            value (Any): JSON-serializable value (None is not cacheable).
+        """
+
+        with self._lock:
+            self._remember(key, value)
+        if self._db is not None:
+            self._writes.put((key, json.dumps(value)))
+
+    def flush(self):
+        """
+        Blocks until every queued write has been committed to the on-disk tier.
+        """
+
+        if self._db is not None:
+            self._writes.join()
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: Keys `size`, `max_size`, `hits`, `misses`, `hit_rate` and `persistent`.
+        """
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "persistent": self._db is not None,
+            }
+
+    def _get_memory(self, key: str):
+        """
+        Looks up the memory tier only, counting a hit if found.
+
+        Returns:
+            tuple[bool, Any]: Whether the key was found, and its value.
+        """
+
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, self._entries[key]
+
+    def _load(self, key: str):
+        """
+        Reads a key from the on-disk tier (None if absent or not configured).
+        """
+
+        if self._db is None:
+            return None
+        with self._db_lock:
+            row = self._db.execute(f"SELECT value FROM {self.name} WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def _count(self, key: str, value):
+        """
+        Counts a lookup that missed the memory tier, promoting an on-disk hit into memory.
+        """
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._remember(key, value)
+        return value
+
+    def _run_writer(self):
+        """
+        Writer loop: waits for the first queued entry, then commits up to `max_batch` entries
+        in a single transaction.
+        """
+
+        while True:
+            batch = [self._writes.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                with self._db_lock:
+                    self._db.executemany(f"INSERT OR REPLACE INTO {self.name} (key, value) VALUES (?, ?)",
+                                         batch)
+                    self._db.commit()
+            except sqlite3.Error:
+                logger.exception(f"❌ Could not write {len(batch)} entries to the {self.name} cache")
+            finally:
+                for _ in batch:
+                    self._writes.task_done()
+
+    def _remember(self, key: str, value):
+        """
+        Inserts into the memory tier and enforces the size limit. Caller must hold the lock.
+        """
+
+        if self.max_size <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
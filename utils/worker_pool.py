@@ -0,0 +1,132 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module provides a bounded worker pool for running blocking work from async code.          #
+#                                                                                                #
+# CPU-heavy and blocking stages (file I/O, OpenCV, CNN inference, solving, report generation)    #
+# are submitted to a thread or process pool instead of running on the event loop. The pool       #
+# admits at most `max_workers + max_queued` jobs at once; further submissions fail immediately   #
+# with PoolSaturatedError, so callers can shed load (e.g. HTTP 503) instead of queueing without  #
+# bound and letting latency grow for everyone.                                                   #
+#                                                                                                #
+# Process pools start their workers with forkserver (or spawn) rather than fork: forking the     #
+# multi-threaded API server could copy locks held by other threads into the children.            #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import os
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+class PoolSaturatedError(RuntimeError):
+    """
+    Raised when a job is submitted while the pool's queue is full.
+    """
+
+class BoundedWorkerPool:
+    """
+    Thread or process pool with a limit on running plus queued jobs.
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: int = None, max_queued: int = 16):
+        """
+        Initializes the pool.
+
+        Args:
+            kind (str): "thread" (shares the CNN model and micro-batcher, which release the GIL)
+                or "process" (isolates the CPU-bound solver, at the cost of one model per worker).
+            max_workers (int): Number of workers. Defaults to os.cpu_count().
+            max_queued (int): Jobs allowed to wait for a free worker before rejecting new ones.
+
+        Raises:
+            ValueError: If the pool kind is unknown.
+        """
+
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown worker pool kind '{kind}'. Available: thread, process")
+
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.capacity = self.max_workers + max_queued
+        self.in_flight = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+        if kind == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        else:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+
+    @property
+    def saturated(self) -> bool:
+        """
+        Whether new submissions are currently rejected.
+        """
+
+        return self.in_flight >= self.capacity
+
+    def submit(self, fn, *args):
+        """
+        Submits a job, unless the pool is saturated.
+
+        Args:
+            fn (Callable): Function to run (must be picklable for process pools).
+            *args: Arguments for `fn`.
+
+        Returns:
+            concurrent.futures.Future: Future resolving to the function's result.
+
+        Raises:
+            PoolSaturatedError: If `capacity` jobs are already running or queued.
+        """
+
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                raise PoolSaturatedError(f"Worker pool saturated ({self.in_flight} jobs in flight)")
+            self.in_flight += 1
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._release()
+            raise
+
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    async def run(self, fn, *args):
+        """
+        Runs a job in the pool and awaits its result without blocking the event loop.
+
+        Raises:
+            PoolSaturatedError: If the pool is saturated.
+        """
+
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def shutdown(self):
+        """
+        Waits for running jobs and releases the workers.
+        """
+
+        self._executor.shutdown(wait=True)
+
+    def _release(self):
+        """
+        Frees the slot of a finished job.
+        """
+
+        with self._lock:
+            self.in_flight -= 1
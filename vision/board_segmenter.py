@@ -5,6 +5,18 @@
 # detects the board using contour detection and perspective transformation, and segments it      #
 # into 81 individual cell readme_images (9x9). These can then be passed to OCR modules for digit        #
 # extraction.                                                                                    #
+#                                                                                                #
+# Images can be given as a file path, an already decoded array, or raw encoded bytes (e.g. an    #
+# HTTP upload), which are decoded in memory with `cv2.imdecode` without touching the disk.       #
+#                                                                                                #
+# Grid detection (blur, adaptive threshold, contour search) runs on a copy downscaled to         #
+# DETECTION_MAX_SIDE pixels, and only the four corners are mapped back to warp the original      #
+# image, so detection latency stays flat on high-resolution phone photos.                        #
+#                                                                                                #
+# Scanned pages (newspapers, puzzle books) can hold several grids: `extract_grids_from_array`    #
+# keeps every convex, roughly square quadrilateral above a minimum share of the page, skipping   #
+# those nested in a grid already kept (its 3x3 boxes and cells), and returns them in reading     #
+# order with their corners in page coordinates.                                                  #
 ##################################################################################################
 
 ##################################################################################################
@@ -14,11 +26,16 @@
 import cv2
 import numpy as np
 import os
+from utils.metrics import timed
+from utils.config import (
+    DETECTION_MAX_SIDE, PAGE_DETECTION_MAX_SIDE, PAGE_MIN_GRID_AREA, PAGE_MAX_GRID_ASPECT
+)
 
 ##################################################################################################
 #                                        IMPLEMENTATION                                          #
 ##################################################################################################
 
+@timed("preprocess_image")
 def preprocess_image(image):
     """
     Applies grayscale, Gaussian blur, and adaptive thresholding to enhance the Sudoku grid.
@@ -38,6 +55,7 @@ def preprocess_image(image):
     )
     return thresh
 
+@timed("find_largest_contour")
 def find_largest_contour(thresh_img):
     """
     Finds the largest external contour in a thresholded image.
@@ -54,19 +72,58 @@ def find_largest_contour(thresh_img):
     contours, _ = cv2.findContours(thresh_img, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     return max(contours, key=cv2.contourArea)
 
-def warp_perspective(image, contour, size=450):
+@timed("find_grid_contours")
+def find_grid_contours(thresh_img, min_area_ratio: float = PAGE_MIN_GRID_AREA,
+                       max_aspect: float = PAGE_MAX_GRID_ASPECT) -> list:
     """
-    Warps a detected grid contour into a top-down square view.
+    Finds every grid-like quadrilateral in a thresholded image, for pages with several boards.
 
-    Applies a perspective transform and fixes orientation for consistency.
+    Contours are visited from the largest down. A contour is kept if it approximates to a
+    convex quadrilateral whose rotated bounding box is roughly square, and if its center does
+    not lie inside a contour already kept (which rejects the boxes and cells of a kept grid, as
+    well as the inner edge of its border).
 
     Args:
-        image (np.ndarray): Original image.
-        contour (np.ndarray): 4-point contour of the Sudoku grid.
-        size (int): Desired output size (default: 450).
+        thresh_img (np.ndarray): Binary preprocessed image.
+        min_area_ratio (float): Minimum contour area, as a share of the image area.
+        max_aspect (float): Maximum ratio between the long and short sides.
+
+    Returns:
+        list[np.ndarray]: 4-point contours of the grids, largest first.
+    """
+
+    contours, _ = cv2.findContours(thresh_img, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+    min_area = min_area_ratio * thresh_img.shape[0] * thresh_img.shape[1]
+
+    grids = []
+    for contour in sorted(contours, key=cv2.contourArea, reverse=True):
+        if cv2.contourArea(contour) < min_area:
+            break
+
+        approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+        if len(approx) != 4 or not cv2.isContourConvex(approx):
+            continue
+
+        _, (width, height), _ = cv2.minAreaRect(approx)
+        if max(width, height) > max_aspect * min(width, height):
+            continue
+
+        cx, cy = approx.reshape(4, 2).mean(axis=0)
+        if any(cv2.pointPolygonTest(grid, (float(cx), float(cy)), False) >= 0 for grid in grids):
+            continue
+
+        grids.append(approx)
+    return grids
+
+def grid_corners(contour) -> np.ndarray:
+    """
+    Approximates the grid contour with a quadrilateral and orders its corners.
+
+    Args:
+        contour (np.ndarray): Contour of the Sudoku grid.
 
     Returns:
-        np.ndarray: Warped, oriented square image of the Sudoku grid.
+        np.ndarray: Float32 array of shape (4, 2): top-left, top-right, bottom-right, bottom-left.
 
     Raises:
         ValueError: If the contour does not have exactly 4 points.
@@ -78,24 +135,72 @@ def warp_perspective(image, contour, size=450):
     if len(approx) != 4:
         raise ValueError("Could not find 4-cornered grid contour.")
 
-    points = approx.reshape(4, 2)
-    points = sorted(points, key=lambda x: x[0] + x[1])
-    tl, tr = sorted(points[:2], key=lambda x: x[0])
-    bl, br = sorted(points[2:], key=lambda x: x[0])
+    # Extremes of x + y and y - x: unlike sorting, no tie on an axis-aligned square, so the
+    # order does not depend on the resolution the contour was found at
+    points = approx.reshape(4, 2).astype("float32")
+    total, diff = points.sum(axis=1), points[:, 1] - points[:, 0]
+    tl, br = points[np.argmin(total)], points[np.argmax(total)]
+    tr, bl = points[np.argmin(diff)], points[np.argmax(diff)]
+
+    return np.array([tl, tr, br, bl], dtype="float32")
+
+@timed("warp_perspective")
+def warp_corners(image, corners, size=450):
+    """
+    Warps the quadrilateral given by its corners into a top-down square view.
+
+    Args:
+        image (np.ndarray): Original image.
+        corners (np.ndarray): Grid corners as returned by `grid_corners`, in `image` coordinates.
+        size (int): Desired output size (default: 450).
+
+    Returns:
+        np.ndarray: Warped square image of the Sudoku grid, upright.
+    """
 
-    src = np.array([tl, tr, br, bl], dtype="float32")
     dst = np.array([[0, 0], [size-1, 0], [size-1, size-1], [0, size-1]], dtype="float32")
 
-    matrix = cv2.getPerspectiveTransform(src, dst)
+    matrix = cv2.getPerspectiveTransform(corners, dst)
 
-    warped = cv2.warpPerspective(image, matrix, (size, size))
+    # Corners are in true reading order, so no rotation or flip is needed afterwards
+    return cv2.warpPerspective(image, matrix, (size, size))
 
-    # 💡 FIX ORIENTATION
-    warped = cv2.rotate(warped, cv2.ROTATE_90_CLOCKWISE)
-    warped = cv2.flip(warped, 1)  # Horizontal flip
+def warp_perspective(image, contour, size=450):
+    """
+    Warps a detected grid contour into a top-down square view.
+
+    Applies a perspective transform from the ordered corners of the contour.
+
+    Args:
+        image (np.ndarray): Original image.
+        contour (np.ndarray): 4-point contour of the Sudoku grid.
+        size (int): Desired output size (default: 450).
+
+    Returns:
+        np.ndarray: Warped square image of the Sudoku grid, upright.
 
-    return warped
+    Raises:
+        ValueError: If the contour does not have exactly 4 points.
+    """
+
+    return warp_corners(image, grid_corners(contour), size)
+
+def tile_grid(warped_grid: np.ndarray) -> np.ndarray:
+    """
+    Views a warped grid as a (9, 9, h, w[, channels]) array of cells, without copying.
+
+    Args:
+        warped_grid (np.ndarray): Top-down Sudoku grid image (grayscale or BGR).
 
+    Returns:
+        np.ndarray: View where [row, col] is the cell image at that board position.
+    """
+
+    cell_h, cell_w = warped_grid.shape[0] // 9, warped_grid.shape[1] // 9
+    grid = warped_grid[:cell_h * 9, :cell_w * 9]
+    return grid.reshape(9, cell_h, 9, cell_w, *grid.shape[2:]).swapaxes(1, 2)
+
+@timed("segment_cells")
 def segment_cells(warped_grid):
     """
     Splits a warped Sudoku grid into 81 equal-sized cell readme_images.
@@ -104,19 +209,153 @@ def segment_cells(warped_grid):
         warped_grid (np.ndarray): Top-down 450x450 Sudoku grid image.
 
     Returns:
-        list[np.ndarray]: List of 81 cell readme_images in row-major order.
+        list[np.ndarray]: List of 81 cell readme_images (views of the grid) in row-major order.
+    """
+
+    return [cell for row in tile_grid(warped_grid) for cell in row]
+
+@timed("decode_image")
+def decode_image(image_bytes: bytes) -> np.ndarray:
+    """
+    Decodes an encoded JPG/PNG image from memory.
+
+    Args:
+        image_bytes (bytes): Encoded image content.
+
+    Returns:
+        np.ndarray: Decoded BGR image.
+
+    Raises:
+        ValueError: If the bytes are not a decodable image.
     """
 
-    cells = []
-    size = warped_grid.shape[0]  # assuming square
-    cell_size = size // 9
+    image = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Could not decode image data.")
+    return image
 
-    for y in range(9):
-        for x in range(9):
-            x1, y1 = x * cell_size, y * cell_size
-            cell = warped_grid[y1:y1 + cell_size, x1:x1 + cell_size]
-            cells.append(cell)
-    return cells
+def load_image(image_path: str) -> np.ndarray:
+    """
+    Reads a Sudoku image from disk.
+
+    Args:
+        image_path (str): Path to the input image.
+
+    Returns:
+        np.ndarray: BGR image.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+
+    if not os.path.exists(image_path):
+        raise FileNotFoundError(f"Image not found: {image_path}")
+
+    return cv2.imread(image_path)
+
+def find_grid_corners(image: np.ndarray, max_side: int = DETECTION_MAX_SIDE) -> np.ndarray:
+    """
+    Locates the four corners of the Sudoku grid.
+
+    Large images are first downscaled so that their longest side is `max_side` pixels. The
+    blur, threshold and contour search then run on the small copy, so their cost no longer
+    grows with the input resolution. The corners are mapped back to full-resolution
+    coordinates.
+
+    Args:
+        image (np.ndarray): BGR Sudoku image.
+        max_side (int): Longest side used for detection (0 or None: full resolution).
+
+    Returns:
+        np.ndarray: Float32 corners of shape (4, 2) in `image` coordinates (see `grid_corners`).
+    """
+
+    small, scale = downscale_for_detection(image, max_side)
+    return to_image_coordinates(grid_corners(find_largest_contour(preprocess_image(small))), scale)
+
+def find_all_grid_corners(image: np.ndarray, max_side: int = PAGE_DETECTION_MAX_SIDE) -> list:
+    """
+    Locates the corners of every Sudoku grid on a page (see `find_grid_contours`).
+
+    Args:
+        image (np.ndarray): BGR page image.
+        max_side (int): Longest side used for detection (0 or None: full resolution). Grids
+            are smaller on a page than in a single-board photo, hence a larger default.
+
+    Returns:
+        list[np.ndarray]: Float32 corners of shape (4, 2) per grid, in `image` coordinates,
+        in reading order (top to bottom, then left to right within a row of grids).
+    """
+
+    small, scale = downscale_for_detection(image, max_side)
+    corners = [to_image_coordinates(grid_corners(contour), scale)
+               for contour in find_grid_contours(preprocess_image(small))]
+    if not corners:
+        return []
+
+    # Grids whose top edges are less than half a grid height apart share a row
+    corners.sort(key=lambda c: c[:, 1].min())
+    row_gap = np.median([np.ptp(c[:, 1]) for c in corners]) / 2
+
+    rows = [[corners[0]]]
+    for c in corners[1:]:
+        if c[:, 1].min() - rows[-1][0][:, 1].min() > row_gap:
+            rows.append([])
+        rows[-1].append(c)
+    return [c for row in rows for c in sorted(row, key=lambda c: c[:, 0].min())]
+
+def downscale_for_detection(image: np.ndarray, max_side: int):
+    """
+    Downscales an image so that its longest side is at most `max_side` pixels.
+
+    Returns:
+        tuple[np.ndarray, float]: The (possibly unchanged) image and the scale factor applied.
+    """
+
+    scale = min(1.0, max_side / max(image.shape[:2])) if max_side else 1.0
+    if scale == 1.0:
+        return image, scale
+    return cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR), scale
+
+def to_image_coordinates(corners: np.ndarray, scale: float) -> np.ndarray:
+    """
+    Maps corners found on a copy downscaled by `scale` back to original image coordinates.
+    """
+
+    if scale == 1.0:
+        return corners
+    return (corners + 0.5) / scale - 0.5  # Pixel centers of the small image → original
+
+def extract_grid_from_array(image: np.ndarray) -> np.ndarray:
+    """
+    Locates the Sudoku grid in a decoded image and warps it into a top-down square view.
+    The grid is detected on a downscaled copy (see `find_grid_corners`) and warped from the
+    full-resolution image.
+
+    Args:
+        image (np.ndarray): BGR Sudoku image.
+
+    Returns:
+        np.ndarray: Warped BGR grid, to be split with `tile_grid` / `segment_cells`.
+    """
+
+    return warp_corners(image, find_grid_corners(image))
+
+def extract_grids_from_array(image: np.ndarray, max_side: int = PAGE_DETECTION_MAX_SIDE) -> list:
+    """
+    Locates every Sudoku grid on a page and warps each one into a top-down square view.
+
+    Args:
+        image (np.ndarray): BGR page image.
+        max_side (int): Longest side used for detection (see `find_all_grid_corners`).
+
+    Returns:
+        list[tuple[np.ndarray, np.ndarray]]: (warped BGR grid, corners in page coordinates)
+        per grid, in reading order. Empty if no grid was found.
+    """
+
+    return [(warp_corners(image, corners), corners)
+            for corners in find_all_grid_corners(image, max_side)]
 
 def extract_cells_from_image(image_path: str) -> list:
     """
@@ -129,12 +368,17 @@ def extract_cells_from_image(image_path: str) -> list:
         list[np.ndarray]: List of 81 segmented cell readme_images.
     """
 
-    if not os.path.exists(image_path):
-        raise FileNotFoundError(f"Image not found: {image_path}")
+    return extract_cells_from_array(load_image(image_path))
+
+def extract_cells_from_array(image: np.ndarray) -> list:
+    """
+    Extracts 81 cell readme_images from an already decoded Sudoku image.
+
+    Args:
+        image (np.ndarray): BGR Sudoku image.
+
+    Returns:
+        list[np.ndarray]: List of 81 segmented cell readme_images.
+    """
 
-    image = cv2.imread(image_path)
-    preprocessed = preprocess_image(image)
-    contour = find_largest_contour(preprocessed)
-    warped = warp_perspective(image, contour)
-    cell_images = segment_cells(warped)
-    return cell_images
+    return segment_cells(extract_grid_from_array(image))
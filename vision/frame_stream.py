@@ -0,0 +1,361 @@
+##################################################################################################
+#                                        SCRIPT OVERVIEW                                         #
+#                                                                                                #
+# This module reads Sudoku boards from a stream of frames (a video file, a directory of frames   #
+# or any iterable of images, e.g. a camera) and yields one result per frame, as a generator.     #
+#                                                                                                #
+# Per frame, the work is kept as small as possible:                                              #
+#   1. Once the grid has been detected, its four corners are followed with pyramidal Lucas-      #
+#      Kanade optical flow on the downscaled grayscale frame, instead of re-running contour      #
+#      detection. Tracking is checked forward-backward; on failure, and every                    #
+#      STREAM_REDETECT_FRAMES frames to catch drift, the grid is detected again.                 #
+#   2. The grid is warped and turned into the CNN input tensor. Each cell is compared, in 8x8    #
+#      blocks, with the pixels it had when it was last classified, and only the cells that       #
+#      changed (a digit written, a hand passing over the board) are classified again.            #
+#   3. Once the recognized board has stayed the same for STREAM_STABLE_FRAMES frames, it is      #
+#      solved, once per distinct board (the last MAX_SOLUTIONS solutions are remembered).        #
+#      Boards with fewer than MIN_GIVENS digits (an empty frame, a square that is not a          #
+#      Sudoku) are not solved.                                                                   #
+#                                                                                                #
+# The classifier can be injected (any callable mapping an (N, 64, 64, 1) tensor to N digits), so #
+# recorded videos can be replayed offline without the CNN.                                       #
+#                                                                                                #
+# Usage:                                                                                         #
+#   python -m vision.frame_stream recording.mp4 --stable-frames 5                                #
+##################################################################################################
+
+##################################################################################################
+#                                            IMPORTS                                             #
+##################################################################################################
+
+import os
+import time
+import argparse
+from collections import OrderedDict
+import cv2
+import numpy as np
+from vision.board_segmenter import (
+    find_grid_corners, warp_corners, downscale_for_detection, to_image_coordinates
+)
+from vision.image_parser import classify_tensor, MIN_GIVENS
+from cnn_classifier.digit_classifier import preprocess_grid
+from solver.batch_solver import solve_puzzle, board_to_string
+from utils.logs_config import logger
+from utils.print_board import print_board
+from utils.metrics import timed
+from utils.config import (
+    DETECTION_MAX_SIDE, CELL_BORDER_TRIM, STREAM_STABLE_FRAMES, STREAM_REDETECT_FRAMES
+)
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+TRACK_WINDOW = (21, 21)  # Lucas-Kanade search window (pixels of the downscaled frame)
+TRACK_LEVELS = 3  # Pyramid levels, for motion larger than the window
+MAX_TRACK_ERROR = 1.0  # Maximum forward-backward error of a tracked corner (pixels)
+MAX_DRIFT = 2.0  # Tracked corners farther than this from a fresh detection are replaced (pixels)
+
+CHANGE_BLOCK = 8  # Side of the blocks compared between frames (pixels of a 64x64 cell)
+CELL_CHANGE_THRESHOLD = 0.25  # Mean absolute block difference (0–1 scale) marking a changed cell
+
+MAX_SOLUTIONS = 64  # Distinct boards whose solution is remembered (least recently seen dropped)
+
+##################################################################################################
+#                                        IMPLEMENTATION                                          #
+##################################################################################################
+
+def read_frames(source):
+    """
+    Lazily reads the frames of a video file or of a directory of images.
+
+    Args:
+        source (str | Iterable[np.ndarray]): Video file path, directory of frame images (read in
+            file name order), or an iterable of BGR frames, returned as is.
+
+    Yields:
+        np.ndarray: BGR frame.
+
+    Raises:
+        FileNotFoundError: If the path does not exist.
+        ValueError: If the video cannot be opened.
+    """
+
+    if not isinstance(source, (str, os.PathLike)):
+        yield from source
+        return
+
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Frame source not found: {source}")
+
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                frame = cv2.imread(os.path.join(source, name))
+                if frame is not None:
+                    yield frame
+        return
+
+    capture = cv2.VideoCapture(str(source))
+    if not capture.isOpened():
+        raise ValueError(f"Could not open video: {source}")
+    try:
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                return
+            yield frame
+    finally:
+        capture.release()
+
+class BoardTracker:
+    """
+    Follows one Sudoku grid across frames and keeps its recognized board up to date.
+    """
+
+    def __init__(self, classify=None, stable_frames: int = STREAM_STABLE_FRAMES,
+                 redetect_frames: int = STREAM_REDETECT_FRAMES, max_side: int = DETECTION_MAX_SIDE,
+                 backend: str = None):
+        """
+        Args:
+            classify (Callable[[np.ndarray], list[int]]): Maps a (N, 64, 64, 1) cell tensor to N
+                digits (0 for empty). Defaults to the empty-cell gate followed by the CNN.
+            stable_frames (int): Consecutive frames with the same board before it is solved.
+            redetect_frames (int): Tracked frames before the grid is detected again from scratch.
+            max_side (int): Longest side of the frame copy used for detection and tracking.
+            backend (str): Solver backend name. Defaults to the configured backend.
+        """
+
+        self.classify = classify or classify_tensor
+        self.stable_frames = max(1, stable_frames)
+        self.redetect_frames = redetect_frames
+        self.max_side = max_side
+        self.backend = backend
+
+        self.cells_classified = 0  # Total cells sent to the classifier
+        self._solutions = OrderedDict()  # Board string → solution (None if unsolvable), LRU order
+        self._gray = None  # Previous downscaled grayscale frame
+        self._corners = None  # Grid corners in the downscaled frame
+        self._tracked_frames = 0
+        self._reset_board()
+
+    def _reset_board(self):
+        """
+        Forgets the recognized board (grid lost or detected again from scratch elsewhere).
+        """
+
+        self._reference = None  # Cell tensor as it was when each cell was last classified
+        self._digits = None
+        self._stable_count = 0
+
+    @timed("stream_frame")
+    def process(self, frame: np.ndarray) -> dict:
+        """
+        Updates the grid position and the board with a new frame.
+
+        Args:
+            frame (np.ndarray): BGR frame.
+
+        Returns:
+            dict: `corners` (grid corners in frame pixels, or None if no grid was found),
+            `tracked` (True if the corners were tracked rather than detected), `board` (9x9
+            matrix or None), `reclassified` (cells classified for this frame), `stable` (the
+            board has been the same for `stable_frames` frames) and `solution` (9x9 matrix
+            once the stable board is solved; None otherwise, if it has no solution, or if it
+            has fewer than MIN_GIVENS digits).
+        """
+
+        small, scale = downscale_for_detection(frame, self.max_side)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        corners, tracked = self._locate(small, gray)
+        self._gray, self._corners = gray, corners
+
+        if corners is None:
+            self._reset_board()
+            return {"corners": None, "tracked": False, "board": None, "reclassified": 0,
+                    "stable": False, "solution": None}
+
+        corners = to_image_coordinates(corners, scale)
+        tensor = preprocess_grid(warp_corners(frame, corners), CELL_BORDER_TRIM)
+        changed = self._changed_cells(tensor)
+
+        board_changed = self._digits is None
+        if len(changed):
+            digits = self.classify(tensor[changed])
+            self.cells_classified += len(changed)
+            if self._digits is None:
+                self._reference, self._digits = tensor.copy(), [0] * len(tensor)
+            for index, digit in zip(changed, digits):
+                board_changed |= self._digits[index] != digit
+                self._digits[index] = int(digit)
+            self._reference[changed] = tensor[changed]
+
+        self._stable_count = 1 if board_changed else self._stable_count + 1
+        board = [self._digits[row * 9:(row + 1) * 9] for row in range(9)]
+        stable = self._stable_count >= self.stable_frames
+
+        solution = None
+        if stable and sum(digit != 0 for digit in self._digits) >= MIN_GIVENS:
+            solution = self._solve(board)
+
+        return {"corners": np.round(corners, 1).tolist(), "tracked": tracked, "board": board,
+                "reclassified": len(changed), "stable": stable, "solution": solution}
+
+    def _solve(self, board: list):
+        """
+        Solves a board, reusing the solution of a board seen recently.
+
+        Returns:
+            list[list[int]] | None: The solution, or None if the board has no solution.
+        """
+
+        key = board_to_string(board)
+        if key in self._solutions:
+            self._solutions.move_to_end(key)
+            return self._solutions[key]
+
+        solution = self._solutions[key] = solve_puzzle(0, board, self.backend)["solution"]
+        while len(self._solutions) > MAX_SOLUTIONS:
+            self._solutions.popitem(last=False)
+        return solution
+
+    def _locate(self, small: np.ndarray, gray: np.ndarray):
+        """
+        Tracks the grid corners from the previous frame, or detects the grid again.
+
+        Every `redetect_frames` tracked frames, the grid is also detected from scratch. If the
+        detection agrees with tracking within MAX_DRIFT pixels, the sub-pixel tracked corners
+        are kept, since snapping to the detected ones would shift every cell and trigger
+        useless reclassifications.
+
+        Returns:
+            tuple[np.ndarray | None, bool]: Corners in the downscaled frame (None if no grid was
+            found) and whether they were tracked.
+        """
+
+        tracked = self._track(gray) if self._corners is not None else None
+        if tracked is not None and self._tracked_frames < self.redetect_frames:
+            self._tracked_frames += 1
+            return tracked, True
+
+        self._tracked_frames = 0
+        try:
+            detected = find_grid_corners(small, max_side=0)
+        except ValueError:
+            return (tracked, True) if tracked is not None else (None, False)
+
+        if tracked is not None and np.abs(tracked - detected).max() <= MAX_DRIFT:
+            return tracked, True
+
+        if self._corners is None or np.abs(detected - self._corners).max() > TRACK_WINDOW[0]:
+            self._reset_board()  # Not the grid that was being followed
+        return detected, False
+
+    @timed("track_grid")
+    def _track(self, gray: np.ndarray):
+        """
+        Follows the four corners with pyramidal Lucas-Kanade optical flow.
+
+        A corner is accepted only if tracking it back to the previous frame lands within
+        MAX_TRACK_ERROR pixels of where it started, and the four corners must still form a
+        convex quadrilateral.
+
+        Returns:
+            np.ndarray | None: Tracked corners, or None if tracking failed.
+        """
+
+        previous = self._corners.reshape(-1, 1, 2)
+        params = dict(winSize=TRACK_WINDOW, maxLevel=TRACK_LEVELS)
+
+        forward, status, _ = cv2.calcOpticalFlowPyrLK(self._gray, gray, previous, None, **params)
+        if forward is None or not status.all():
+            return None
+        backward, status, _ = cv2.calcOpticalFlowPyrLK(gray, self._gray, forward, None, **params)
+        if backward is None or not status.all():
+            return None
+        if np.abs(backward - previous).max() > MAX_TRACK_ERROR:
+            return None
+
+        corners = forward.reshape(4, 2)
+        if not cv2.isContourConvex(corners):
+            return None
+        return corners
+
+    def _changed_cells(self, tensor: np.ndarray) -> np.ndarray:
+        """
+        Finds the cells whose pixels changed since they were last classified.
+
+        Cells are compared in CHANGE_BLOCK-sized blocks rather than pixel by pixel, so that the
+        sub-pixel jitter of tracking and compression noise average out, while a new stroke
+        still changes at least one block a lot.
+
+        Returns:
+            np.ndarray: Indices of the changed cells (all cells if there is no reference yet).
+        """
+
+        if self._reference is None:
+            return np.arange(len(tensor))
+
+        count, size = len(tensor), tensor.shape[1]
+        blocks = size // CHANGE_BLOCK
+        diff = np.abs(tensor[:, :blocks * CHANGE_BLOCK, :blocks * CHANGE_BLOCK, 0]
+                      - self._reference[:, :blocks * CHANGE_BLOCK, :blocks * CHANGE_BLOCK, 0])
+        diff = diff.reshape(count, blocks, CHANGE_BLOCK, blocks, CHANGE_BLOCK).mean(axis=(2, 4))
+        return np.flatnonzero(diff.max(axis=(1, 2)) > CELL_CHANGE_THRESHOLD)
+
+def stream_boards(source, classify=None, stable_frames: int = STREAM_STABLE_FRAMES,
+                  redetect_frames: int = STREAM_REDETECT_FRAMES, max_side: int = DETECTION_MAX_SIDE,
+                  backend: str = None):
+    """
+    Reads the Sudoku board of every frame of a stream (see `BoardTracker.process`).
+
+    Args:
+        source (str | Iterable[np.ndarray]): Video file, directory of frames, or iterable of
+            BGR frames.
+        classify, stable_frames, redetect_frames, max_side, backend: See `BoardTracker`.
+
+    Yields:
+        dict: Result of `BoardTracker.process`, with the frame number under `frame`.
+    """
+
+    tracker = BoardTracker(classify, stable_frames, redetect_frames, max_side, backend)
+    for index, frame in enumerate(read_frames(source)):
+        yield {"frame": index, **tracker.process(frame)}
+
+def main(argv=None):
+    """
+    Replays a video file or a directory of frames, printing each newly solved board and the
+    sustained frame rate.
+
+    Args:
+        argv (list[str]): Command line arguments (defaults to sys.argv[1:]).
+    """
+
+    parser = argparse.ArgumentParser(description="Read and solve Sudoku boards from a video stream.")
+    parser.add_argument("source", help="Video file or directory of frame images")
+    parser.add_argument("--stable-frames", type=int, default=STREAM_STABLE_FRAMES,
+                        help="Frames with the same board before solving it")
+    parser.add_argument("--backend", default=None, help="Solver backend")
+    args = parser.parse_args(argv)
+
+    frames, solved = 0, set()
+    start = time.perf_counter()
+    for result in stream_boards(args.source, stable_frames=args.stable_frames, backend=args.backend):
+        frames += 1
+        if result["solution"] is not None and board_to_string(result["board"]) not in solved:
+            solved.add(board_to_string(result["board"]))
+            logger.info(f"\n✅ Frame {result['frame']}: board solved")
+            print_board(result["solution"])
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"🎞️ {frames} frames in {elapsed:.2f}s ({frames / elapsed if elapsed else 0.0:.1f} fps), "
+                f"{len(solved)} boards solved")
+
+##################################################################################################
+#                                               MAIN                                             #
+##################################################################################################
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,44 @@
 # It takes a Sudoku image, segments it into 81 individual cells, classifies each one using a     #
 # pre-trained CNN model, and reconstructs the final 9x9 board composed of digits and zeros.      #
 # Zeros are used to represent empty or unrecognized cells.                                       #
+#                                                                                                #
+# Entry points accept a file path, a decoded image array, or encoded image bytes (API uploads).  #
+# The warped grid is turned into the (81, 64, 64, 1) CNN input tensor in one vectorized pass     #
+# (`preprocess_grid`), without slicing and resizing cells one by one.                            #
+# `extract_boards_from_bytes` handles many images at once: they are decoded and segmented in     #
+# parallel threads, and the cells of a whole chunk of images go through one CNN forward pass.    #
+#                                                                                                #
+# `extract_boards_from_page` reads every grid of a multi-board page (newspaper, puzzle book): the  #
+# cells of all its grids go through one CNN forward pass, and each board comes with its corners  #
+# in page coordinates.                                                                           #
+#                                                                                                #
+# Cells that the ink-density gate (vision/cell_filter.py) detects as empty are set to 0 without  #
+# being sent to the model, which roughly halves the CNN work per board.                          #
 ##################################################################################################
 
 ##################################################################################################
 #                                            IMPORTS                                             #
 ##################################################################################################
 
+import time
 from typing import List
-from vision.board_segmenter import extract_cells_from_image
-from cnn_classifier.digit_classifier import classify_cell
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from vision.board_segmenter import (
+    load_image, extract_grid_from_array, extract_grids_from_array, decode_image
+)
+from vision.cell_filter import find_nonempty_cells
+from cnn_classifier.digit_classifier import preprocess_grid, classify_batch
 from utils.logs_config import logger
+from utils.metrics import inc
+from utils.config import EMPTY_CELL_GATE, CELL_BORDER_TRIM
+
+##################################################################################################
+#                                        CONFIGURATION                                           #
+##################################################################################################
+
+MIN_GIVENS = 17  # Fewest clues of a uniquely solvable Sudoku; sparser page detections are dropped
 
 ##################################################################################################
 #                                        IMPLEMENTATION                                          #
@@ -24,7 +52,7 @@ def extract_board_from_image(image_path: str) -> List[List[int]]:
     """
     Extracts a 9x9 Sudoku board from an input image using cell segmentation and digit classification.
 
-    The image is split into 81 cells, each of which is passed through a CNN model to detect the digit.
+    The image is split into 81 cells, which are classified together in a single CNN forward pass.
     Unrecognized or empty cells are represented with a 0.
 
     Args:
@@ -36,18 +64,184 @@ def extract_board_from_image(image_path: str) -> List[List[int]]:
 
     #print(f"📸 Loading image: {image_path}")
 
-    cells = extract_cells_from_image(image_path)
-    if len(cells) != 81:
-        raise ValueError("Expected 81 cells from segmenter, got: {}".format(len(cells)))
-
-    board = []
-    for row in range(9):
-        row_digits = []
-        for col in range(9):
-            idx = row * 9 + col
-            digit = classify_cell(cells[idx])
-            row_digits.append(digit)
-        board.append(row_digits)
+    return extract_board_from_array(load_image(image_path))
+
+def extract_board_from_array(image: np.ndarray, on_stage=None) -> List[List[int]]:
+    """
+    Extracts a 9x9 Sudoku board from an already decoded BGR image.
+
+    Args:
+        image (np.ndarray): BGR Sudoku image.
+        on_stage (Callable[[str, float], None]): Optional hook called with the name and duration
+            in seconds of each completed stage ("warp": grid detection and segmentation,
+            "classify": CNN inference).
+
+    Returns:
+        List[List[int]]: A 9x9 matrix representing the Sudoku board.
+    """
+
+    start = time.perf_counter()
+    grid = extract_grid_from_array(image)
+    if on_stage is not None:
+        on_stage("warp", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    board = _board_from_digits(classify_tensor(preprocess_grid(grid, CELL_BORDER_TRIM)))
+    if on_stage is not None:
+        on_stage("classify", time.perf_counter() - start)
+    return board
+
+def extract_board_from_bytes(image_bytes: bytes, on_stage=None) -> List[List[int]]:
+    """
+    Extracts a 9x9 Sudoku board from encoded JPG/PNG bytes, decoding them in memory.
+
+    Args:
+        image_bytes (bytes): Encoded image content, e.g. an uploaded file.
+        on_stage (Callable[[str, float], None]): Optional stage timing hook, also called for
+            the "decode" stage (see `extract_board_from_array`).
+
+    Returns:
+        List[List[int]]: A 9x9 matrix representing the Sudoku board.
+
+    Raises:
+        ValueError: If the bytes are not a decodable image.
+    """
+
+    start = time.perf_counter()
+    image = decode_image(image_bytes)
+    if on_stage is not None:
+        on_stage("decode", time.perf_counter() - start)
+    return extract_board_from_array(image, on_stage)
+
+def extract_boards_from_bytes(images, chunk_size: int = 32, workers: int = None):
+    """
+    Extracts boards from many encoded images, e.g. the pages of a scanned puzzle book.
+
+    Images are decoded and segmented in a thread pool (OpenCV releases the GIL), and the cells
+    of `chunk_size` images are classified in a single CNN forward pass. The next chunk is
+    segmented while the current one is being classified. The input is consumed lazily.
+
+    Args:
+        images (Iterable[bytes]): Encoded JPG/PNG contents.
+        chunk_size (int): Number of images whose cells share one CNN forward pass.
+        workers (int): Segmentation threads. Defaults to the ThreadPoolExecutor default.
+
+    Yields:
+        List[List[int]] | Exception: The 9x9 board of each image, in input order, or the
+        exception that prevented its extraction (undecodable image, grid not found...).
+    """
+
+    images = iter(images)
+    chunk_size = max(1, chunk_size)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="segmenter") as executor:
+        def submit_chunk():
+            return [executor.submit(_tensor_from_bytes, image) for image in islice(images, chunk_size)]
+
+        pending = submit_chunk()
+        while pending:
+            segmented = [future.result() for future in pending]
+            pending = submit_chunk()  # Segment the next chunk while the CNN runs
+
+            tensors = [item for item in segmented if not isinstance(item, Exception)]
+            digits = classify_tensor(np.concatenate(tensors)) if tensors else []
+
+            offset = 0
+            for item in segmented:
+                if isinstance(item, Exception):
+                    yield item
+                    continue
+                yield _board_from_digits(digits[offset:offset + 81])
+                offset += 81
+
+def extract_boards_from_page(image: np.ndarray, on_stage=None) -> List[dict]:
+    """
+    Extracts every Sudoku board of a page image (e.g. a scanned newspaper or puzzle book page).
+
+    The cells of all the grids found on the page are classified in a single CNN forward pass.
+    Detections whose board has fewer than MIN_GIVENS digits (logos, photos, empty frames that
+    happen to be square) are dropped.
+
+    Args:
+        image (np.ndarray): BGR page image.
+        on_stage (Callable[[str, float], None]): Optional stage timing hook (see
+            `extract_board_from_array`).
+
+    Returns:
+        List[dict]: One entry per board in reading order, with `corners` (top-left, top-right,
+        bottom-right and bottom-left [x, y] in page pixels) and `parsed_board` (9x9 matrix).
+    """
+
+    start = time.perf_counter()
+    grids = extract_grids_from_array(image)
+    if on_stage is not None:
+        on_stage("warp", time.perf_counter() - start)
+
+    if not grids:
+        return []
+
+    start = time.perf_counter()
+    tensors = [preprocess_grid(grid, CELL_BORDER_TRIM) for grid, _ in grids]
+    digits = classify_tensor(np.concatenate(tensors))
+    if on_stage is not None:
+        on_stage("classify", time.perf_counter() - start)
+
+    boards = []
+    for index, (_, corners) in enumerate(grids):
+        board = _board_from_digits(digits[index * 81:(index + 1) * 81])
+        if sum(value != 0 for row in board for value in row) >= MIN_GIVENS:
+            boards.append({"corners": np.round(corners, 1).tolist(), "parsed_board": board})
+    return boards
+
+def extract_boards_from_page_bytes(image_bytes: bytes) -> List[dict]:
+    """
+    Extracts every Sudoku board of an encoded JPG/PNG page (see `extract_boards_from_page`).
+
+    Raises:
+        ValueError: If the bytes are not a decodable image.
+    """
+
+    return extract_boards_from_page(decode_image(image_bytes))
+
+def _tensor_from_bytes(image_bytes: bytes):
+    """
+    Decodes one image and builds its (81, 64, 64, 1) CNN input, or returns the exception raised.
+    """
+
+    try:
+        return preprocess_grid(extract_grid_from_array(decode_image(image_bytes)), CELL_BORDER_TRIM)
+    except Exception as e:
+        return e
+
+def classify_tensor(batch: np.ndarray) -> List[int]:
+    """
+    Classifies a tensor of cells in one CNN forward pass, skipping the model for cells that the
+    empty-cell gate rejects (they are returned as 0).
+
+    Args:
+        batch (np.ndarray): CNN input of shape (N, 64, 64, 1), e.g. built by `preprocess_grid`.
+
+    Returns:
+        List[int]: Digit of each cell, 0 for empty cells.
+    """
+
+    if not EMPTY_CELL_GATE or len(batch) == 0:
+        return classify_batch(batch)
+
+    nonempty = np.flatnonzero(find_nonempty_cells(batch))
+    inc("sudoku_cells_skipped_total", len(batch) - len(nonempty))
+
+    digits = [0] * len(batch)
+    for index, digit in zip(nonempty, classify_batch(batch[nonempty])):
+        digits[index] = digit
+    return digits
+
+def _board_from_digits(digits) -> List[List[int]]:
+    """
+    Arranges 81 classified cells (row-major order) into a 9x9 board.
+    """
+
+    board = [digits[row * 9:(row + 1) * 9] for row in range(9)]
 
     '''
     logger.info("🧩 Extracted Sudoku Board:\n")